@@ -0,0 +1,6 @@
+"""
+Benchmarks de rendimiento ejecutables desde la terminal
+
+Uso:
+    python -m benchmarks.<benchmark> --help
+"""
@@ -0,0 +1,127 @@
+"""
+Datos sintéticos para los benchmarks.
+
+Inserta eventos, participantes y asistencias con INSERT de varias filas
+por lote (Core, sin ORM) y reconstruye las estadísticas. Las asistencias
+se reparten en forma pareja entre los eventos: el evento 1 es el "caliente"
+usado por los benchmarks de detalle y tiene ceil(asistencias / eventos)
+registros.
+"""
+import math
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, NamedTuple
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from src.database.connection import Base
+from src.models.attendance import Attendance
+from src.models.event import Event
+from src.models.participant import Participant
+from src.services.statistics_service import StatisticsService
+
+CHUNK_SIZE = 10000
+HOT_EVENT_ID = 1
+
+
+class DatasetSize(NamedTuple):
+    """Tamaño del conjunto de datos"""
+
+    events: int
+    participants: int
+    attendances: int
+
+
+PRESETS: Dict[str, DatasetSize] = {
+    "small": DatasetSize(events=100, participants=5000, attendances=20000),
+    "medium": DatasetSize(events=1000, participants=100000, attendances=500000),
+    "large": DatasetSize(events=10000, participants=1000000, attendances=5000000),
+}
+
+
+def current_size(engine: Engine) -> DatasetSize:
+    """Filas actuales de cada tabla (0 si no existen)"""
+    Base.metadata.create_all(bind=engine)
+    with engine.connect() as connection:
+        return DatasetSize(
+            *(
+                connection.execute(select(func.count()).select_from(model)).scalar()
+                for model in (Event, Participant, Attendance)
+            )
+        )
+
+
+def _chunks(rows: Iterator[dict]) -> Iterator[List[dict]]:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == CHUNK_SIZE:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def seed(engine: Engine, size: DatasetSize) -> None:
+    """
+    Recrea las tablas (borra todos los datos) y las llena con `size` filas.
+
+    La asistencia i pertenece al evento (i mod eventos) + 1 y al
+    participante (i div eventos) + 1, de modo que no se repite el par
+    (evento, participante).
+    """
+    if size.attendances > size.events * size.participants:
+        raise ValueError("Más asistencias que pares (evento, participante)")
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    now = datetime.utcnow().replace(microsecond=0)
+    per_event = math.ceil(size.attendances / size.events) if size.events else 0
+
+    events = (
+        {
+            "id": index,
+            "name": f"Evento {index}",
+            "description": f"Descripción del evento {index}",
+            "location": f"Sede {index % 50}",
+            "date": now + timedelta(days=index % 365 + 1),
+            "capacity": per_event + 100,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for index in range(1, size.events + 1)
+    )
+    participants = (
+        {
+            "id": index,
+            "name": f"Participante {index}",
+            "email": f"participante{index}@example.com",
+            "phone": f"+57300{index:07d}",
+            "created_at": now,
+            "updated_at": now,
+        }
+        for index in range(1, size.participants + 1)
+    )
+    attendances = (
+        {
+            "event_id": index % size.events + 1,
+            "participant_id": index // size.events + 1,
+            "registered_at": now - timedelta(minutes=index % 43200),
+        }
+        for index in range(size.attendances)
+    )
+
+    with engine.begin() as connection:
+        if engine.dialect.name == "sqlite":
+            connection.exec_driver_sql("PRAGMA synchronous = OFF")
+        for model, rows in (
+            (Event, events),
+            (Participant, participants),
+            (Attendance, attendances),
+        ):
+            for chunk in _chunks(rows):
+                connection.execute(insert(model), chunk)
+
+    with Session(bind=engine) as db:
+        StatisticsService(db).rebuild_all()
@@ -0,0 +1,155 @@
+"""
+Benchmark del costo de CPU por petición al serializar listados grandes.
+
+Compara, para listas de AttendanceDetail y de eventos leídos del ORM, el
+camino por defecto de FastAPI (validar contra `response_model`, convertir
+a dicts y codificar con json o orjson) con `model_response`, que serializa
+los modelos ya construidos en una sola pasada.
+
+Uso:
+    python -m benchmarks.serialization
+    python -m benchmarks.serialization --sizes 100 1000 10000 --repeat 20
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Callable, Dict, List
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from src.schemas.attendance import AttendanceDetail
+from src.schemas.event import EventResponse
+from src.schemas.serialization import model_response
+
+
+def build_attendances(size: int) -> List[AttendanceDetail]:
+    """Modelos ya construidos, como los retorna AttendanceService"""
+    registered_at = datetime(2024, 1, 15, 14, 30)
+    return [
+        AttendanceDetail(
+            id=index,
+            event_id=1,
+            event_name="Conferencia de Tecnología",
+            participant_id=index,
+            participant_name=f"Participante {index}",
+            participant_email=f"participante{index}@example.com",
+            registered_at=registered_at + timedelta(seconds=index),
+        )
+        for index in range(1, size + 1)
+    ]
+
+
+def build_orm_events(size: int) -> List[SimpleNamespace]:
+    """Objetos con atributos, como las filas ORM de EventService"""
+    now = datetime(2024, 1, 15, 14, 30)
+    return [
+        SimpleNamespace(
+            id=index,
+            name=f"Evento {index}",
+            description="Descripción del evento " * 5,
+            location="Auditorio Principal",
+            date=now + timedelta(days=index),
+            capacity=500,
+            available_capacity=250,
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(1, size + 1)
+    ]
+
+
+def fastapi_default(schema, response_class) -> Callable:
+    """Reproduce lo que hace FastAPI con un endpoint que declara response_model"""
+    field = create_response_field(name="Benchmark", type_=schema, mode="serialization")
+    loop = asyncio.new_event_loop()
+
+    def render(content):
+        serialized = loop.run_until_complete(
+            serialize_response(field=field, response_content=content)
+        )
+        return response_class(serialized).body
+
+    return render
+
+
+def fast_path(schema) -> Callable:
+    """Modelos ya construidos serializados en una pasada"""
+    return lambda content: model_response(schema, content).body
+
+
+def measure(render: Callable, content, repeat: int) -> float:
+    """Milisegundos de CPU por petición (mediana de `repeat` ejecuciones)"""
+    render(content)  # calentamiento: construye validadores y serializadores
+    samples = []
+    for _ in range(repeat):
+        start = time.process_time()
+        render(content)
+        samples.append((time.process_time() - start) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def run(sizes: List[int], repeat: int) -> Dict[str, Dict[int, float]]:
+    """Ejecuta todas las variantes y retorna ms de CPU por variante y tamaño"""
+    cases = {
+        "attendances / FastAPI + json": (
+            build_attendances,
+            fastapi_default(List[AttendanceDetail], JSONResponse),
+        ),
+        "attendances / FastAPI + orjson": (
+            build_attendances,
+            fastapi_default(List[AttendanceDetail], ORJSONResponse),
+        ),
+        "attendances / model_response": (
+            build_attendances,
+            fast_path(List[AttendanceDetail]),
+        ),
+        "events ORM / FastAPI + json": (
+            build_orm_events,
+            fastapi_default(List[EventResponse], JSONResponse),
+        ),
+        "events ORM / FastAPI + orjson": (
+            build_orm_events,
+            fastapi_default(List[EventResponse], ORJSONResponse),
+        ),
+        # Incluye construir los modelos desde el ORM, que el controller
+        # hace antes de serializar
+        "events ORM / model_response": (
+            build_orm_events,
+            lambda events: fast_path(List[EventResponse])(
+                [EventResponse.model_validate(event) for event in events]
+            ),
+        ),
+    }
+    results = {}
+    for name, (build, render) in cases.items():
+        results[name] = {size: measure(render, build(size), repeat) for size in sizes}
+    return results
+
+
+def main(argv=None):
+    """Punto de entrada del benchmark"""
+    parser = argparse.ArgumentParser(
+        description="CPU por petición al serializar listados grandes"
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.repeat)
+    width = max(len(name) for name in results)
+    print(f"{'variante':<{width}}" + "".join(f"{size:>12}" for size in args.sizes))
+    for name, timings in results.items():
+        print(
+            f"{name:<{width}}"
+            + "".join(f"{timings[size]:>10.2f}ms" for size in args.sizes)
+        )
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""
+Suite de benchmarks de los caminos críticos de servicios y API.
+
+Siembra una base de datos local con un volumen configurable, mide
+servicios (EventService, AttendanceService) y endpoints de listado a
+través de TestClient, y guarda los resultados en JSON. Con `--baseline`
+compara contra resultados anteriores y termina con código 1 si alguna
+mediana empeora más que `--threshold`.
+
+Sembrar borra y recrea todas las tablas de `--database-url`: si la base de
+datos ya tiene datos, la suite se niega salvo con `--replace` (o con
+`--reuse` si el tamaño coincide).
+
+Uso:
+    python -m benchmarks.suite --size small
+    python -m benchmarks.suite --size large --database-url mysql+pymysql://... --replace
+    python -m benchmarks.suite --size small --reuse --baseline benchmarks/baseline.json
+    python -m benchmarks.suite --size small --replace --output benchmarks/baseline.json
+
+Los tiempos dependen de la máquina: comparar solo contra una línea base
+generada en el mismo entorno (p. ej. el mismo runner de CI).
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+DEFAULT_DATABASE_URL = "sqlite:///./benchmark.db"
+
+
+def measure(function: Callable[[], Any], repeat: int, warmup: int = 1) -> Dict:
+    """Ejecuta `function` y retorna estadísticas en milisegundos"""
+    for _ in range(warmup):
+        function()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "median_ms": round(samples[len(samples) // 2], 3),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        "min_ms": round(samples[0], 3),
+        "mean_ms": round(sum(samples) / len(samples), 3),
+        "repeat": repeat,
+    }
+
+
+def compare(
+    results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float
+) -> List[Dict]:
+    """
+    Compara las medianas contra la línea base.
+
+    Returns:
+        Una fila por caso con `status`: regression, improvement, ok o new
+    """
+    rows = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            rows.append({"case": name, "status": "new", **current})
+            continue
+        ratio = current["median_ms"] / previous["median_ms"]
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 - threshold:
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append(
+            {
+                "case": name,
+                "status": status,
+                "baseline_ms": previous["median_ms"],
+                "median_ms": current["median_ms"],
+                "ratio": round(ratio, 3),
+            }
+        )
+    return rows
+
+
+def build_cases(client, session_factory, hot_event_id: int, target_event_id: int):
+    """Casos a medir: nombre -> función sin argumentos"""
+    # Importado aquí: src lee DATABASE_URL al importarse (ver main)
+    from src.schemas.attendance import AttendanceCreate
+    from src.services.attendance_service import AttendanceService
+    from src.services.event_service import EventService
+
+    def with_session(call: Callable) -> Callable[[], Any]:
+        # Una sesión por llamada, como una petición
+        def run():
+            with session_factory() as db:
+                return call(db)
+
+        return run
+
+    participant_ids = itertools.count(1)
+
+    def register(db):
+        AttendanceService(db).register_attendance(
+            AttendanceCreate(
+                event_id=target_event_id, participant_id=next(participant_ids)
+            )
+        )
+
+    return {
+        "service/get_all_events": with_session(
+            lambda db: EventService(db).get_all_events(0, 100)
+        ),
+        "service/get_event_statistics": with_session(
+            lambda db: EventService(db).get_event_statistics(hot_event_id)
+        ),
+        "service/get_event_attendances": with_session(
+            lambda db: AttendanceService(db).get_event_attendances(hot_event_id)
+        ),
+        "service/register_attendance": with_session(register),
+        "api/GET /events": lambda: client.get("/events/?limit=100"),
+        "api/GET /participants": lambda: client.get("/participants/?limit=100"),
+        "api/GET /events/{id}/statistics": lambda: client.get(
+            f"/events/{hot_event_id}/statistics"
+        ),
+        "api/GET /attendances/event/{id}": lambda: client.get(
+            f"/attendances/event/{hot_event_id}"
+        ),
+    }
+
+
+def create_registration_target(session_factory, capacity: int) -> int:
+    """Crea el evento donde se miden los registros y retorna su ID"""
+    from src.models.event import Event
+    from src.services.statistics_service import StatisticsService
+
+    with session_factory() as db:
+        event = Event(
+            name="Benchmark registro",
+            location="Benchmark",
+            date=datetime.utcnow(),
+            capacity=capacity,
+        )
+        db.add(event)
+        db.flush()
+        StatisticsService(db).initialize_event(event.id)
+        db.commit()
+        return event.id
+
+
+def remove_event(session_factory, event_id: int) -> None:
+    """Elimina el evento de registro con sus asistencias y estadísticas"""
+    from src.models.attendance import Attendance
+    from src.models.event import Event
+    from src.models.statistics import EventDailyRegistration, EventStatistic
+
+    with session_factory() as db:
+        for model in (Attendance, EventStatistic, EventDailyRegistration):
+            db.query(model).filter(model.event_id == event_id).delete()
+        db.query(Event).filter(Event.id == event_id).delete()
+        db.commit()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Punto de entrada de la suite"""
+    parser = argparse.ArgumentParser(description="Benchmarks de servicios y API")
+    parser.add_argument("--size", default="small", help="small, medium o large")
+    parser.add_argument("--events", type=int, help="Sobrescribe el preset")
+    parser.add_argument("--participants", type=int, help="Sobrescribe el preset")
+    parser.add_argument("--attendances", type=int, help="Sobrescribe el preset")
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument(
+        "--reuse", action="store_true", help="No volver a sembrar si el tamaño coincide"
+    )
+    parser.add_argument(
+        "--replace",
+        action="store_true",
+        help="Borra las tablas de una base de datos con datos y vuelve a sembrar",
+    )
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--baseline", help="JSON de una ejecución anterior")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Empeoramiento tolerado (0.2 = 20%%)",
+    )
+    args = parser.parse_args(argv)
+
+    # La configuración se lee al importar src: se define antes de importarlo
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    os.environ["STARTUP_INIT_DB_IN_BACKGROUND"] = "false"
+
+    from fastapi.testclient import TestClient
+
+    from benchmarks.dataset import HOT_EVENT_ID, PRESETS, current_size, seed
+    from src.database.connection import SessionLocal, get_engine
+    from src.main import app
+
+    preset = PRESETS[args.size]
+    size = preset._replace(
+        **{
+            field: getattr(args, field)
+            for field in preset._fields
+            if getattr(args, field) is not None
+        }
+    )
+    engine = get_engine()
+    current = current_size(engine)
+    if args.reuse and current == size:
+        print(f"Reutilizando datos: {size}")
+    elif any(current) and not args.replace:
+        print(
+            f"La base de datos ya tiene datos ({current}); sembrar la borra. "
+            "Usar --replace para continuar, o --reuse si el tamaño coincide"
+        )
+        return 2
+    else:
+        print(f"Sembrando {size}...")
+        start = time.perf_counter()
+        seed(engine, size)
+        print(f"Sembrado en {time.perf_counter() - start:.1f}s")
+
+    # Evento propio para medir registros; se elimina al terminar para que
+    # --reuse encuentre el mismo tamaño de datos
+    target_event_id = create_registration_target(SessionLocal, size.participants)
+    results = {}
+    try:
+        with TestClient(app) as client:
+            cases = build_cases(client, SessionLocal, HOT_EVENT_ID, target_event_id)
+            for name, function in cases.items():
+                results[name] = measure(function, args.repeat)
+                print(f"{name:<40}{results[name]['median_ms']:>10.2f} ms")
+    finally:
+        remove_event(SessionLocal, target_event_id)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.utcnow().isoformat(),
+            "dataset": size._asdict(),
+            "database": engine.dialect.name,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as output:
+        json.dump(report, output, indent=2)
+    print(f"Resultados en {args.output}")
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+    if baseline["meta"]["dataset"] != report["meta"]["dataset"]:
+        print("Aviso: la línea base usa otro tamaño de datos")
+    rows = compare(results, baseline["results"], args.threshold)
+    print(f"\n{'caso':<40}{'base':>10}{'actual':>10}{'ratio':>8}  estado")
+    for row in rows:
+        print(
+            f"{row['case']:<40}{row.get('baseline_ms', 0):>10.2f}"
+            f"{row['median_ms']:>10.2f}{row.get('ratio', 0):>8.2f}  {row['status']}"
+        )
+    return 1 if any(row["status"] == "regression" for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
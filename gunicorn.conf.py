@@ -0,0 +1,33 @@
+"""
+Configuración de Gunicorn con workers de Uvicorn.
+
+Uso:
+    PROMETHEUS_MULTIPROC_DIR=/tmp/eventia-metrics gunicorn src.main:app
+
+Con PROMETHEUS_MULTIPROC_DIR definido, cada worker escribe sus métricas
+en ese directorio y /metrics (en cualquier worker) las agrega. El
+directorio se vacía al iniciar el master y los valores "en vivo" de un
+worker (p. ej. peticiones en curso) se descartan cuando termina.
+"""
+import os
+import shutil
+
+bind = f"{os.environ.get('HOST', '0.0.0.0')}:{os.environ.get('PORT', '8000')}"
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.environ.get("WEB_CONCURRENCY", "4"))
+
+
+def on_starting(server):
+    """Vacía el directorio de métricas de una ejecución anterior"""
+    directory = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if directory:
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory, exist_ok=True)
+
+
+def child_exit(server, worker):
+    """Marca como terminado al worker para el colector multiproceso"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
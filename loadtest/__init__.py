@@ -0,0 +1,6 @@
+"""
+Generador de carga HTTP contra un servidor en ejecución
+
+Uso:
+    python -m loadtest.run --help
+"""
@@ -0,0 +1,231 @@
+"""
+Reproduce tráfico capturado (TRAFFIC_CAPTURE_ENABLED) contra una
+instancia de prueba y compara las distribuciones de latencia.
+
+Las peticiones se reenvían respetando los intervalos originales,
+escalados por `--speed` (2 = el doble de rápido). El reporte compara por
+ruta la latencia capturada (medida en el servidor de origen) con la de la
+reproducción (medida en el cliente). Para un antes/después, reproducir la
+misma captura contra ambas versiones y pasar el primer reporte como
+`--baseline` del segundo.
+
+Las rutas incluyen los IDs originales: la instancia de prueba necesita
+datos equivalentes (una copia de staging o `src.commands.generate_data`).
+Las peticiones cuyo cuerpo no se capturó se omiten.
+
+Uso:
+    python -m loadtest.replay traffic/capture-*.jsonl --base-url http://localhost:8000
+    python -m loadtest.replay traffic/*.jsonl --speed 2 --read-only --output after.json
+    python -m loadtest.replay traffic/*.jsonl --baseline before.json --output after.json
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+import httpx
+
+from loadtest.scenarios import Api
+from loadtest.stats import Recorder, format_report, summarize
+
+READ_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+def load_captures(paths: Iterable[str]) -> List[Dict]:
+    """Registros de uno o más archivos de captura, ordenados por tiempo"""
+    records = []
+    for path in paths:
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                line = line.strip()
+                if line:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        continue  # línea truncada (p. ej. el proceso murió)
+    records.sort(key=lambda record: record["ts"])
+    return records
+
+
+def operation(record: Dict) -> str:
+    return f"{record['method']} {record.get('route') or record['path']}"
+
+
+def replayable(record: Dict, read_only: bool = False) -> bool:
+    """Si la petición se puede reenviar tal como se capturó"""
+    if record["method"] in READ_METHODS:
+        return True
+    if read_only:
+        return False
+    return not record.get("body_bytes") or "body" in record
+
+
+async def replay(
+    records: List[Dict],
+    base_url: str,
+    speed: float = 1.0,
+    concurrency: int = 100,
+    timeout: float = 30.0,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> Dict:
+    """
+    Reenvía los registros con sus intervalos originales divididos por `speed`.
+
+    Returns:
+        Reporte de Recorder con `late_requests`: peticiones enviadas más de
+        100 ms después de lo programado (el generador no alcanzó el ritmo)
+    """
+    recorder = Recorder()
+    late = 0
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        transport=transport,
+        limits=httpx.Limits(
+            max_connections=concurrency, max_keepalive_connections=concurrency
+        ),
+        timeout=httpx.Timeout(timeout, pool=None),
+    ) as client:
+        api = Api(client, recorder)
+        tasks = []
+        first_ts = records[0]["ts"] if records else 0.0
+        recorder.start()
+        start = time.perf_counter()
+        for record in records:
+            delay = (record["ts"] - first_ts) / speed - (time.perf_counter() - start)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            elif delay < -0.1:
+                late += 1
+            tasks.append(
+                asyncio.create_task(
+                    api.call(
+                        operation(record),
+                        record["method"],
+                        record["path"],
+                        # Con datos distintos un 404 o 409 es esperable;
+                        # solo los 5xx y los fallos de transporte son errores
+                        expected=range(100, 500),
+                        params=record.get("query") or None,
+                        json=record.get("body"),
+                    )
+                )
+            )
+        await asyncio.gather(*tasks)
+        recorder.stop()
+
+    report = recorder.report()
+    report["late_requests"] = late
+    return report
+
+
+def compare(
+    records: List[Dict], report: Dict, baseline: Optional[Dict] = None
+) -> List[Dict]:
+    """
+    Por operación: latencia capturada, de la reproducción y, con
+    `baseline`, de una reproducción anterior, con el ratio de p95.
+    """
+    captured: Dict[str, List[float]] = defaultdict(list)
+    for record in records:
+        captured[operation(record)].append(record["duration_ms"] / 1000)
+
+    rows = []
+    for name, replayed in report["operations"].items():
+        row = {
+            "operation": name,
+            "requests": replayed["requests"],
+            "captured": summarize(captured.get(name, [])),
+            "replay": {key: replayed[key] for key in ("p50_ms", "p95_ms", "p99_ms")},
+        }
+        previous = (baseline or {}).get("operations", {}).get(name)
+        if previous is not None:
+            row["baseline"] = {
+                key: previous[key] for key in ("p50_ms", "p95_ms", "p99_ms")
+            }
+            if previous["p95_ms"]:
+                row["p95_ratio"] = round(replayed["p95_ms"] / previous["p95_ms"], 3)
+        rows.append(row)
+    return rows
+
+
+def format_comparison(rows: List[Dict]) -> str:
+    lines = [
+        f"{'operación':<40}{'req':>7}{'cap p50':>9}{'cap p95':>9}"
+        f"{'p50':>9}{'p95':>9}{'p99':>9}{'base p95':>10}{'ratio':>7}"
+    ]
+    for row in rows:
+        baseline = row.get("baseline", {})
+        lines.append(
+            f"{row['operation']:<40}{row['requests']:>7}"
+            f"{row['captured']['p50_ms']:>9}{row['captured']['p95_ms']:>9}"
+            f"{row['replay']['p50_ms']:>9}{row['replay']['p95_ms']:>9}"
+            f"{row['replay']['p99_ms']:>9}{baseline.get('p95_ms', '-'):>10}"
+            f"{row.get('p95_ratio', '-'):>7}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Punto de entrada de la reproducción"""
+    parser = argparse.ArgumentParser(description="Reproduce tráfico capturado")
+    parser.add_argument("captures", nargs="+", help="Archivos JSONL de captura")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="Multiplicador del ritmo original (2 = el doble de rápido)",
+    )
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument(
+        "--read-only", action="store_true", help="Reproduce solo GET/HEAD/OPTIONS"
+    )
+    parser.add_argument("--limit", type=int, help="Reproduce solo los N primeros")
+    parser.add_argument("--baseline", help="Reporte de una reproducción anterior")
+    parser.add_argument("--output", help="Guarda el reporte en JSON")
+    args = parser.parse_args(argv)
+
+    records = load_captures(args.captures)
+    selected = [record for record in records if replayable(record, args.read_only)]
+    if args.limit is not None:
+        selected = selected[: args.limit]
+    if not selected:
+        print("No hay peticiones para reproducir")
+        return 1
+    span = (selected[-1]["ts"] - selected[0]["ts"]) / args.speed
+    print(
+        f"Reproduciendo {len(selected)} de {len(records)} peticiones "
+        f"en ~{span:.0f}s contra {args.base_url}"
+    )
+
+    report = asyncio.run(
+        replay(selected, args.base_url, args.speed, args.concurrency, args.timeout)
+    )
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+    report["skipped"] = len(records) - len(selected)
+    report["comparison"] = compare(selected, report, baseline)
+
+    print(format_report(report))
+    print()
+    print(format_comparison(report["comparison"]))
+    if report["late_requests"]:
+        print(
+            f"\nAviso: {report['late_requests']} peticiones salieron tarde; "
+            "el generador no alcanzó el ritmo pedido"
+        )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+        print(f"\nReporte en {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""
+Ejecuta un escenario de carga contra un servidor en ejecución.
+
+Uso:
+    python -m loadtest.run flash-sale --users 2000 --capacity 100 --concurrency 200
+    python -m loadtest.run browse --duration 60 --concurrency 50
+    python -m loadtest.run poll --attendees 1000 --duration 30
+    python -m loadtest.run mixed --base-url http://staging:8000 --output report.json
+
+Termina con código 1 si algún evento supera su capacidad o si la tasa de
+errores supera `--max-error-rate`. Las diferencias entre conteos que no
+superan la capacidad (p. ej. respuestas 201 perdidas por timeouts) se
+muestran como avisos.
+"""
+import argparse
+import asyncio
+import json
+import sys
+from typing import List, Optional
+
+from loadtest.scenarios import SCENARIOS, Options, run_scenario
+from loadtest.stats import format_report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Punto de entrada del generador de carga"""
+    defaults = Options()
+    parser = argparse.ArgumentParser(description="Pruebas de carga de la API")
+    parser.add_argument("scenario", choices=sorted(SCENARIOS))
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=defaults.concurrency,
+        help="Conexiones simultáneas (usuarios en bucle en browse/poll/mixed)",
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=defaults.duration,
+        help="Segundos de carga (browse, poll, mixed)",
+    )
+    parser.add_argument(
+        "--users",
+        type=int,
+        default=defaults.users,
+        help="Participantes que intentan registrarse (flash-sale, mixed)",
+    )
+    parser.add_argument(
+        "--capacity",
+        type=int,
+        default=defaults.capacity,
+        help="Capacidad del evento creado por el escenario",
+    )
+    parser.add_argument(
+        "--attendees",
+        type=int,
+        default=defaults.attendees,
+        help="Asistentes del evento consultado (poll)",
+    )
+    parser.add_argument(
+        "--events",
+        type=int,
+        default=defaults.events,
+        help="Eventos a crear si el catálogo está vacío (browse, mixed)",
+    )
+    parser.add_argument("--timeout", type=float, default=defaults.timeout)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument(
+        "--max-error-rate",
+        type=float,
+        default=0.01,
+        help="Tasa de errores tolerada (0.01 = 1%%)",
+    )
+    parser.add_argument("--output", help="Guarda el reporte en JSON")
+    args = parser.parse_args(argv)
+
+    options = Options(
+        **{field: getattr(args, field) for field in Options._fields},
+    )
+    report = asyncio.run(run_scenario(args.scenario, options, args.base_url))
+    report["base_url"] = args.base_url
+
+    print(format_report(report))
+    for check in report["capacity_checks"]:
+        print(
+            f"\nEvento {check['event_id']}: capacidad {check['capacity']}, "
+            f"{check['attendances']} asistencias, {check['accepted']} respuestas 201"
+        )
+        for violation in check["violations"]:
+            print(f"  VIOLACIÓN: {violation}")
+        for mismatch in check["mismatches"]:
+            print(f"  AVISO: {mismatch}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+        print(f"\nReporte en {args.output}")
+
+    failed = (
+        report["capacity_violations"] > 0 or report["error_rate"] > args.max_error_rate
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,389 @@
+"""
+Escenarios de carga contra la API.
+
+- flash-sale: `--users` clientes esperan la apertura y envían a la vez
+  POST /attendances/ para un mismo evento de capacidad `--capacity`.
+- browse: navegación del catálogo (listado paginado, detalle y
+  estadísticas de eventos) durante `--duration` segundos.
+- poll: consulta repetida de la lista de asistentes de un evento.
+- mixed: navegación, consulta de asistentes y registros en un evento en
+  venta, mezclados.
+
+La preparación (crear eventos y participantes) usa la propia API y no se
+mide. Al terminar, los escenarios con registros verifican que ningún
+evento supere su capacidad: ni en la tabla de asistencias, ni en las
+estadísticas, ni en el número de respuestas 201. Las diferencias entre
+esos conteos sin exceso de capacidad (p. ej. un registro guardado cuya
+respuesta 201 se perdió por un timeout del cliente) se reportan aparte.
+"""
+import asyncio
+import json
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, Iterator, List, NamedTuple, Optional
+
+import httpx
+
+from loadtest.stats import Recorder
+
+# Valores por defecto de LOOKUP_MAX_ITEMS y ATTENDANCE_BULK_MAX_ITEMS
+LOOKUP_CHUNK = 200
+BULK_CHUNK = 1000
+
+
+class Options(NamedTuple):
+    """Parámetros de un escenario"""
+
+    concurrency: int = 50
+    duration: float = 30.0
+    users: int = 2000
+    capacity: int = 100
+    attendees: int = 500
+    events: int = 20
+    timeout: float = 30.0
+    seed: int = 42
+
+
+class Api:
+    """Cliente de la API que registra cada petición en un Recorder"""
+
+    def __init__(self, client: httpx.AsyncClient, recorder: Recorder):
+        self.client = client
+        self.recorder = recorder
+
+    async def call(
+        self, operation: str, method: str, url: str, expected=(200,), **kwargs
+    ) -> Optional[httpx.Response]:
+        """Ejecuta y registra una petición; None si falló el transporte"""
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            self.recorder.record(
+                operation, time.perf_counter() - start, type(e).__name__, False
+            )
+            return None
+        self.recorder.record(
+            operation,
+            time.perf_counter() - start,
+            str(response.status_code),
+            response.status_code in expected,
+        )
+        return response
+
+
+# ============================================================================
+# Preparación (no se mide)
+# ============================================================================
+
+
+async def create_event(client: httpx.AsyncClient, name: str, capacity: int) -> int:
+    response = await client.post(
+        "/events/",
+        json={
+            "name": name,
+            "location": "Prueba de carga",
+            "date": (datetime.utcnow() + timedelta(days=30)).isoformat(),
+            "capacity": capacity,
+        },
+    )
+    response.raise_for_status()
+    return response.json()["id"]
+
+
+async def create_participants(client: httpx.AsyncClient, count: int) -> List[int]:
+    """Crea `count` participantes con una importación NDJSON y retorna sus IDs"""
+    run_id = uuid.uuid4().hex[:8]
+    emails = [f"carga-{run_id}-{index}@example.com" for index in range(count)]
+    body = "\n".join(
+        json.dumps({"name": f"Carga {run_id} {index}", "email": email})
+        for index, email in enumerate(emails)
+    )
+    response = await client.post(
+        "/participants/import?format=ndjson",
+        content=body.encode(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    response.raise_for_status()
+
+    ids = []
+    for offset in range(0, count, LOOKUP_CHUNK):
+        response = await client.post(
+            "/participants/lookup",
+            json={"emails": emails[offset : offset + LOOKUP_CHUNK]},
+        )
+        response.raise_for_status()
+        ids += [participant["id"] for participant in response.json()["participants"]]
+    return ids
+
+
+async def register_bulk(
+    client: httpx.AsyncClient, event_id: int, participant_ids: List[int]
+) -> None:
+    for offset in range(0, len(participant_ids), BULK_CHUNK):
+        response = await client.post(
+            "/attendances/bulk",
+            json={
+                "event_id": event_id,
+                "participant_ids": participant_ids[offset : offset + BULK_CHUNK],
+            },
+        )
+        response.raise_for_status()
+
+
+async def catalog(client: httpx.AsyncClient, events: int) -> List[int]:
+    """IDs de eventos existentes; crea `events` si no hay ninguno"""
+    response = await client.get("/events/", params={"limit": 1000, "fields": "id"})
+    response.raise_for_status()
+    ids = [event["id"] for event in response.json()]
+    if not ids:
+        ids = [
+            await create_event(client, f"Catálogo {index}", 100)
+            for index in range(events)
+        ]
+    return ids
+
+
+# ============================================================================
+# Verificación
+# ============================================================================
+
+
+async def check_capacity(
+    client: httpx.AsyncClient, event_id: int, accepted: int, unanswered: int = 0
+) -> Dict:
+    """
+    Verifica que el evento no supere su capacidad.
+
+    Solo superar la capacidad es una violación. Que los conteos no
+    coincidan entre sí se reporta en `mismatches`: un registro que el
+    servidor guardó pero cuya respuesta no llegó (timeout, conexión
+    cortada) aparece como asistencia sin respuesta 201.
+
+    Args:
+        event_id: Evento creado por el escenario (sin registros previos)
+        accepted: Respuestas 201 recibidas para ese evento
+        unanswered: Registros sin respuesta por errores de transporte
+    """
+    event = (await client.get(f"/events/{event_id}")).json()
+    attendances = len((await client.get(f"/attendances/event/{event_id}")).json())
+    statistics = (await client.get(f"/events/{event_id}/statistics")).json()
+    capacity = event["capacity"]
+    registered = statistics["registered_participants"]
+
+    violations = []
+    if attendances > capacity:
+        violations.append(f"{attendances} asistencias para capacidad {capacity}")
+    if registered > capacity:
+        violations.append(
+            f"las estadísticas cuentan {registered} registros para capacidad {capacity}"
+        )
+    if accepted > capacity:
+        violations.append(f"{accepted} respuestas 201 para capacidad {capacity}")
+
+    mismatches = []
+    if accepted != attendances:
+        mismatches.append(
+            f"{accepted} respuestas 201 pero {attendances} asistencias guardadas "
+            f"({unanswered} registros sin respuesta por errores de transporte)"
+        )
+    if registered != attendances:
+        mismatches.append(
+            f"las estadísticas cuentan {registered} registros pero hay "
+            f"{attendances} asistencias"
+        )
+    return {
+        "event_id": event_id,
+        "capacity": capacity,
+        "attendances": attendances,
+        "statistics_registered": registered,
+        "accepted": accepted,
+        "unanswered": unanswered,
+        "violations": violations,
+        "mismatches": mismatches,
+    }
+
+
+def unanswered_registrations(recorder: Recorder) -> int:
+    """Registros cuyo resultado es una excepción de transporte y no un código"""
+    return sum(
+        times
+        for outcome, times in recorder.outcomes["register"].items()
+        if not outcome.isdigit()
+    )
+
+
+# ============================================================================
+# Escenarios
+# ============================================================================
+
+
+async def run_workers(
+    recorder: Recorder,
+    options: Options,
+    step: Callable[[random.Random], Awaitable[None]],
+) -> None:
+    """`concurrency` usuarios ejecutan `step` en bucle durante `duration`"""
+    deadline = time.perf_counter() + options.duration
+
+    async def worker(rng: random.Random) -> None:
+        while time.perf_counter() < deadline:
+            await step(rng)
+
+    recorder.start()
+    await asyncio.gather(
+        *(
+            worker(random.Random(options.seed + index))
+            for index in range(options.concurrency)
+        )
+    )
+    recorder.stop()
+
+
+async def register(api: Api, event_id: int, participant_id: int) -> None:
+    # 400: capacidad agotada, 409: ya registrado; ambas son respuestas válidas
+    await api.call(
+        "register",
+        "POST",
+        "/attendances/",
+        expected=(201, 400, 409),
+        json={"event_id": event_id, "participant_id": participant_id},
+    )
+
+
+async def browse_step(api: Api, rng: random.Random, event_ids: List[int]) -> None:
+    choice = rng.random()
+    if choice < 0.5:
+        skip = rng.randrange(max(len(event_ids) - 20, 1))
+        await api.call("list_events", "GET", f"/events/?skip={skip}&limit=20")
+    elif choice < 0.8:
+        await api.call("event_detail", "GET", f"/events/{rng.choice(event_ids)}")
+    else:
+        await api.call(
+            "event_statistics", "GET", f"/events/{rng.choice(event_ids)}/statistics"
+        )
+
+
+async def flash_sale(api: Api, options: Options) -> List[Dict]:
+    """Todos los usuarios se registran a la vez en el mismo evento"""
+    event_id = await create_event(api.client, "Venta relámpago", options.capacity)
+    participant_ids = await create_participants(api.client, options.users)
+    opened = asyncio.Event()
+
+    async def user(participant_id: int) -> None:
+        await opened.wait()
+        await register(api, event_id, participant_id)
+
+    users = [asyncio.create_task(user(pid)) for pid in participant_ids]
+    await asyncio.sleep(0)  # todos esperando la apertura
+    api.recorder.start()
+    opened.set()
+    await asyncio.gather(*users)
+    api.recorder.stop()
+    return [
+        await check_capacity(
+            api.client,
+            event_id,
+            api.recorder.count("register", "201"),
+            unanswered_registrations(api.recorder),
+        )
+    ]
+
+
+async def browse_catalog(api: Api, options: Options) -> List[Dict]:
+    """Listado paginado, detalle y estadísticas de eventos"""
+    event_ids = await catalog(api.client, options.events)
+    await run_workers(
+        api.recorder, options, lambda rng: browse_step(api, rng, event_ids)
+    )
+    return []
+
+
+async def poll_attendees(api: Api, options: Options) -> List[Dict]:
+    """Consulta repetida de la lista de asistentes de un evento"""
+    attendees = min(options.attendees, options.capacity)
+    event_id = await create_event(api.client, "Asistentes", options.capacity)
+    await register_bulk(
+        api.client, event_id, await create_participants(api.client, attendees)
+    )
+
+    async def step(rng: random.Random) -> None:
+        await api.call("list_attendees", "GET", f"/attendances/event/{event_id}")
+
+    await run_workers(api.recorder, options, step)
+    return []
+
+
+async def mixed(api: Api, options: Options) -> List[Dict]:
+    """60% navegación, 25% lista de asistentes, 15% registros en venta"""
+    event_ids = await catalog(api.client, options.events)
+    sale_id = await create_event(api.client, "Venta", options.capacity)
+    buyers: Iterator[int] = iter(await create_participants(api.client, options.users))
+
+    async def step(rng: random.Random) -> None:
+        choice = rng.random()
+        buyer = next(buyers, None) if choice >= 0.85 else None
+        if buyer is not None:
+            await register(api, sale_id, buyer)
+        elif choice >= 0.6:
+            await api.call("list_attendees", "GET", f"/attendances/event/{sale_id}")
+        else:
+            await browse_step(api, rng, event_ids)
+
+    await run_workers(api.recorder, options, step)
+    return [
+        await check_capacity(
+            api.client,
+            sale_id,
+            api.recorder.count("register", "201"),
+            unanswered_registrations(api.recorder),
+        )
+    ]
+
+
+SCENARIOS: Dict[str, Callable[[Api, Options], Awaitable[List[Dict]]]] = {
+    "flash-sale": flash_sale,
+    "browse": browse_catalog,
+    "poll": poll_attendees,
+    "mixed": mixed,
+}
+
+
+async def run_scenario(
+    name: str,
+    options: Options,
+    base_url: str,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> Dict:
+    """
+    Ejecuta un escenario y retorna el reporte con las verificaciones.
+
+    Args:
+        name: Clave de SCENARIOS
+        options: Parámetros del escenario
+        base_url: URL del servidor (p. ej. http://localhost:8000)
+        transport: Transporte alternativo (p. ej. httpx.ASGITransport en pruebas)
+    """
+    recorder = Recorder()
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        transport=transport,
+        limits=httpx.Limits(
+            max_connections=options.concurrency,
+            max_keepalive_connections=options.concurrency,
+        ),
+        # Sin límite de espera por una conexión libre: en la venta relámpago
+        # los usuarios hacen fila en el pool, y esa espera es parte de la latencia
+        timeout=httpx.Timeout(options.timeout, pool=None),
+    ) as client:
+        checks = await SCENARIOS[name](Api(client, recorder), options)
+
+    report = recorder.report()
+    report["scenario"] = name
+    report["options"] = options._asdict()
+    report["capacity_checks"] = checks
+    report["capacity_violations"] = sum(len(check["violations"]) for check in checks)
+    report["capacity_mismatches"] = sum(len(check["mismatches"]) for check in checks)
+    return report
@@ -0,0 +1,136 @@
+"""
+Registro de resultados de una prueba de carga.
+
+Cada petición se registra con su operación (p. ej. "register"), su
+latencia y su resultado: el código HTTP o el nombre de la excepción de
+transporte (ConnectError, ReadTimeout...). Un resultado es un error si no
+está entre los esperados para la operación: un 400 por capacidad agotada
+es la respuesta correcta en una venta relámpago, un 500 no.
+"""
+import time
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence
+
+
+def percentile(ordered: Sequence[float], q: float) -> float:
+    """Percentil `q` (0-100) de una lista ordenada, por rango más cercano"""
+    if not ordered:
+        return 0.0
+    index = max(0, min(len(ordered) - 1, int(round(q / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def summarize(latencies: Iterable[float]) -> Dict[str, float]:
+    """p50, p95, p99, media y máximo en milisegundos"""
+    ordered = sorted(latencies)
+    if not ordered:
+        return {
+            "p50_ms": 0.0,
+            "p95_ms": 0.0,
+            "p99_ms": 0.0,
+            "mean_ms": 0.0,
+            "max_ms": 0.0,
+        }
+    return {
+        "p50_ms": round(percentile(ordered, 50) * 1000, 2),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 2),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 2),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 2),
+        "max_ms": round(ordered[-1] * 1000, 2),
+    }
+
+
+class Recorder:
+    """Latencias y resultados por operación"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.outcomes: Dict[str, Counter] = defaultdict(Counter)
+        self.errors: Dict[str, Counter] = defaultdict(Counter)
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def start(self) -> None:
+        self.started_at = time.perf_counter()
+
+    def stop(self) -> None:
+        self.finished_at = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    def record(self, operation: str, latency: float, outcome: str, ok: bool) -> None:
+        """Registra una petición terminada"""
+        self.latencies[operation].append(latency)
+        self.outcomes[operation][outcome] += 1
+        if not ok:
+            self.errors[operation][outcome] += 1
+
+    def count(self, operation: str, outcome: str) -> int:
+        return self.outcomes[operation][outcome]
+
+    def report(self) -> Dict:
+        """Resumen: throughput, percentiles y desglose de resultados"""
+        elapsed = self.elapsed
+        operations = {}
+        for operation, latencies in sorted(self.latencies.items()):
+            operations[operation] = {
+                "requests": len(latencies),
+                "errors": sum(self.errors[operation].values()),
+                "throughput_rps": round(len(latencies) / elapsed, 1)
+                if elapsed
+                else 0.0,
+                **summarize(latencies),
+                "outcomes": dict(self.outcomes[operation]),
+            }
+        total = sum(len(latencies) for latencies in self.latencies.values())
+        errors = sum(sum(counter.values()) for counter in self.errors.values())
+        return {
+            "duration_s": round(elapsed, 2),
+            "requests": total,
+            "errors": errors,
+            "error_rate": round(errors / total, 4) if total else 0.0,
+            "throughput_rps": round(total / elapsed, 1) if elapsed else 0.0,
+            **summarize(
+                latency
+                for latencies in self.latencies.values()
+                for latency in latencies
+            ),
+            "operations": operations,
+            "error_breakdown": {
+                f"{operation} {outcome}": times
+                for operation, counter in sorted(self.errors.items())
+                for outcome, times in counter.most_common()
+            },
+        }
+
+
+def format_report(report: Dict) -> str:
+    """Reporte en texto para la terminal"""
+    width = max([22] + [len(name) + 2 for name in report["operations"]])
+    lines = [
+        f"Duración: {report['duration_s']}s  Peticiones: {report['requests']}  "
+        f"Throughput: {report['throughput_rps']} req/s  "
+        f"Errores: {report['errors']} ({report['error_rate']:.2%})",
+        "",
+        f"{'operación':<{width}}{'req':>8}{'req/s':>9}{'p50':>9}{'p95':>9}"
+        f"{'p99':>9}{'err':>7}  resultados",
+    ]
+    for name, operation in report["operations"].items():
+        outcomes = ", ".join(
+            f"{outcome}={times}" for outcome, times in operation["outcomes"].items()
+        )
+        lines.append(
+            f"{name:<{width}}{operation['requests']:>8}{operation['throughput_rps']:>9}"
+            f"{operation['p50_ms']:>9}{operation['p95_ms']:>9}"
+            f"{operation['p99_ms']:>9}{operation['errors']:>7}  {outcomes}"
+        )
+    if report["error_breakdown"]:
+        lines += ["", "Errores:"]
+        lines += [
+            f"  {key}: {times}" for key, times in report["error_breakdown"].items()
+        ]
+    return "\n".join(lines)
@@ -1 +1,6 @@
 # Eventia Core API package
+import time
+
+# Inicio de la importación de la aplicación, para el perfil de arranque
+# (src.observability.startup): este módulo se carga antes que cualquier otro
+IMPORT_STARTED_AT = time.perf_counter()
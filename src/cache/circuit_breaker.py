@@ -0,0 +1,75 @@
+"""
+Circuit breaker para dependencias opcionales (Redis).
+
+Tras `failure_threshold` fallos consecutivos el circuito se abre y las
+llamadas se omiten sin tocar la red durante `reset_timeout` segundos.
+Pasado ese tiempo se permite una llamada de prueba (semiabierto): si
+funciona el circuito se cierra, si falla vuelve a abrirse.
+
+Así, durante una caída de Redis las peticiones no se acumulan esperando
+timeouts de conexión: el caché simplemente se salta.
+"""
+import threading
+import time
+from typing import Any, Dict
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Circuit breaker de tres estados, seguro entre hilos"""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = 0.0
+        self._state = CLOSED
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Estado actual; un circuito abierto pasa a semiabierto al expirar"""
+        with self._lock:
+            if (
+                self._state == OPEN
+                and time.monotonic() - self.opened_at >= self.reset_timeout
+            ):
+                return HALF_OPEN
+            return self._state
+
+    def allow_request(self) -> bool:
+        """
+        Indica si se puede intentar la llamada.
+
+        En estado semiabierto deja pasar una sola llamada de prueba.
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    return False
+                self._state = HALF_OPEN
+                return True
+            return False  # semiabierto: ya hay una llamada de prueba en curso
+
+    def record_success(self) -> None:
+        """Registra una llamada exitosa: cierra el circuito"""
+        with self._lock:
+            self.failures = 0
+            self._state = CLOSED
+
+    def record_failure(self) -> None:
+        """Registra un fallo: abre el circuito al alcanzar el umbral"""
+        with self._lock:
+            self.failures += 1
+            if self._state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self._state = OPEN
+                self.opened_at = time.monotonic()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Estado para los health checks"""
+        return {"state": self.state, "consecutive_failures": self.failures}
@@ -1,22 +1,98 @@
 import json
-from typing import Any, Optional
-
-import redis
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Protocol
 
+from src.cache.circuit_breaker import CircuitBreaker
 from src.config.setting import settings
 
+logger = logging.getLogger(__name__)
+
+
+class CacheObserver(Protocol):
+    """Recibe cada operación del caché (p. ej. para métricas)"""
+
+    def on_operation(self, operation: str, outcome: str, duration: float) -> None:
+        """outcome: "ok", "error" o "skipped" (circuito abierto)"""
+
+    def on_lookup(self, hits: int, misses: int) -> None:
+        """Claves encontradas y no encontradas en una lectura"""
+
 
 class RedisClient:
-    """Cliente para manejar operaciones de caché con Redis"""
+    """
+    Cliente para manejar operaciones de caché con Redis.
+
+    Todas las operaciones pasan por un circuit breaker: si Redis falla
+    de forma repetida, el caché se omite (como un fallo de caché) sin
+    esperar timeouts de red hasta que Redis vuelva a responder.
+    """
 
     def __init__(self):
-        self.client = redis.Redis(
-            host=settings.REDIS_HOST,
-            port=settings.REDIS_PORT,
-            db=settings.REDIS_DB,
-            password=settings.REDIS_PASSWORD if settings.REDIS_PASSWORD else None,
-            decode_responses=True,
+        self._client = None
+        self.breaker = CircuitBreaker(
+            failure_threshold=settings.REDIS_BREAKER_FAILURE_THRESHOLD,
+            reset_timeout=settings.REDIS_BREAKER_RESET_TIMEOUT,
         )
+        self.observers: List[CacheObserver] = []
+
+    @property
+    def client(self):
+        """
+        Cliente de Redis, creado en el primer uso.
+
+        El paquete redis se importa aquí y no al importar el módulo, para
+        no sumar su costo al arranque de la aplicación.
+        """
+        if self._client is None:
+            import redis
+
+            self._client = redis.Redis(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                db=settings.REDIS_DB,
+                password=settings.REDIS_PASSWORD if settings.REDIS_PASSWORD else None,
+                decode_responses=True,
+                socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            )
+        return self._client
+
+    def _run(
+        self, name: str, operation: Callable[[], Any], default: Any, error: str
+    ) -> Any:
+        """
+        Ejecuta una operación de Redis protegida por el circuit breaker.
+
+        Args:
+            name: Nombre de la operación, para los observadores
+            operation: Función que usa self.client
+            default: Valor retornado si el circuito está abierto o falla
+            error: Mensaje a registrar si la operación falla
+        """
+        if not self.breaker.allow_request():
+            self._notify(name, "skipped", 0.0)
+            return default
+        start = time.perf_counter()
+        try:
+            result = operation()
+        except Exception as e:
+            self.breaker.record_failure()
+            self._notify(name, "error", time.perf_counter() - start)
+            logger.warning("%s: %s", error, e)
+            return default
+        self.breaker.record_success()
+        self._notify(name, "ok", time.perf_counter() - start)
+        return result
+
+    def _notify(self, name: str, outcome: str, duration: float) -> None:
+        for observer in self.observers:
+            observer.on_operation(name, outcome, duration)
+
+    def _notify_lookup(self, values: List[Optional[str]]) -> None:
+        hits = sum(1 for value in values if value)
+        for observer in self.observers:
+            observer.on_lookup(hits, len(values) - hits)
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -28,14 +104,11 @@ class RedisClient:
         Returns:
             Valor deserializado o None si no existe
         """
-        try:
-            value = self.client.get(key)
-            if value:
-                return json.loads(value)
-            return None
-        except Exception as e:
-            print(f"Error al obtener del caché: {e}")
-            return None
+        value = self._run(
+            "get", lambda: self.client.get(key), None, "Error al obtener del caché"
+        )
+        self._notify_lookup([value])
+        return json.loads(value) if value else None
 
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """
@@ -49,14 +122,59 @@ class RedisClient:
         Returns:
             True si se guardó correctamente
         """
-        try:
-            ttl = ttl or settings.CACHE_TTL
-            serialized = json.dumps(value)
-            self.client.setex(key, ttl, serialized)
+        ttl = ttl or settings.CACHE_TTL
+        serialized = json.dumps(value)
+        return self._run(
+            "set",
+            lambda: self.client.setex(key, ttl, serialized) and True,
+            False,
+            "Error al guardar en caché",
+        )
+
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        Obtiene varios valores del caché en un solo comando MGET.
+
+        Args:
+            keys: Claves a buscar
+
+        Returns:
+            Valores deserializados en el mismo orden (None si no existe)
+        """
+        if not keys:
+            return []
+        values = self._run(
+            "get_many",
+            lambda: self.client.mget(keys),
+            [None] * len(keys),
+            "Error al obtener del caché",
+        )
+        self._notify_lookup(values)
+        return [json.loads(value) if value else None for value in values]
+
+    def set_many(self, values: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """
+        Guarda varios valores en el caché con un solo viaje (pipeline).
+
+        Args:
+            values: Diccionario clave -> valor (serializado a JSON)
+            ttl: Tiempo de vida en segundos (por defecto usa CACHE_TTL)
+
+        Returns:
+            True si se guardaron correctamente
+        """
+        if not values:
+            return True
+        ttl = ttl or settings.CACHE_TTL
+
+        def write():
+            pipeline = self.client.pipeline(transaction=False)
+            for key, value in values.items():
+                pipeline.setex(key, ttl, json.dumps(value))
+            pipeline.execute()
             return True
-        except Exception as e:
-            print(f"Error al guardar en caché: {e}")
-            return False
+
+        return self._run("set_many", write, False, "Error al guardar en caché")
 
     def delete(self, key: str) -> bool:
         """
@@ -68,12 +186,31 @@ class RedisClient:
         Returns:
             True si se eliminó
         """
-        try:
-            self.client.delete(key)
-            return True
-        except Exception as e:
-            print(f"Error al eliminar del caché: {e}")
-            return False
+        return self._run(
+            "delete",
+            lambda: self.client.delete(key) is not None,
+            False,
+            "Error al eliminar del caché",
+        )
+
+    def delete_many(self, *keys: str) -> int:
+        """
+        Elimina varias claves del caché en un solo comando DEL.
+
+        Args:
+            keys: Claves a eliminar
+
+        Returns:
+            Número de claves eliminadas
+        """
+        if not keys:
+            return 0
+        return self._run(
+            "delete_many",
+            lambda: self.client.delete(*keys),
+            0,
+            "Error al eliminar del caché",
+        )
 
     def delete_pattern(self, pattern: str) -> int:
         """
@@ -85,14 +222,16 @@ class RedisClient:
         Returns:
             Número de claves eliminadas
         """
-        try:
+
+        def delete():
             keys = self.client.keys(pattern)
             if keys:
                 return self.client.delete(*keys)
             return 0
-        except Exception as e:
-            print(f"Error al eliminar patrón del caché: {e}")
-            return 0
+
+        return self._run(
+            "delete_pattern", delete, 0, "Error al eliminar patrón del caché"
+        )
 
     def exists(self, key: str) -> bool:
         """
@@ -104,19 +243,26 @@ class RedisClient:
         Returns:
             True si existe
         """
-        return self.client.exists(key) > 0
+        return self._run(
+            "exists",
+            lambda: self.client.exists(key) > 0,
+            False,
+            "Error al consultar el caché",
+        )
 
     def ping(self) -> bool:
         """
         Verifica la conexión con Redis.
 
+        Con el circuito abierto retorna False sin contactar a Redis; al
+        expirar el bloqueo, el ping sirve como llamada de prueba.
+
         Returns:
             True si la conexión es exitosa
         """
-        try:
-            return self.client.ping()
-        except Exception:  # noqa: E722
-            return False
+        return self._run(
+            "ping", lambda: self.client.ping(), False, "Error al verificar Redis"
+        )
 
     def clear_all(self) -> bool:
         """
@@ -128,12 +274,12 @@ class RedisClient:
         Returns:
             True si se limpió correctamente
         """
-        try:
-            self.client.flushdb()
-            return True
-        except Exception as e:
-            print(f"Error al limpiar caché: {e}")
-            return False
+        return self._run(
+            "clear_all",
+            lambda: self.client.flushdb() and True,
+            False,
+            "Error al limpiar caché",
+        )
 
 
 # Instancia global del cliente
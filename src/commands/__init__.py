@@ -0,0 +1,6 @@
+"""
+Comandos de mantenimiento ejecutables desde la terminal
+
+Uso:
+    python -m src.commands.<comando> --help
+"""
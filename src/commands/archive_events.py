@@ -0,0 +1,72 @@
+"""
+Comando para archivar eventos pasados.
+
+Mueve los eventos cuya fecha es anterior al horizonte configurado
+(ARCHIVE_HORIZON_DAYS), junto con sus asistencias, a las tablas
+`events_archive` y `attendances_archive`, en lotes acotados.
+
+Uso:
+    python -m src.commands.archive_events
+    python -m src.commands.archive_events --horizon-days 90 --batch-size 200
+    python -m src.commands.archive_events --max-batches 10
+
+Pensado para ejecutarse periódicamente (cron, Kubernetes CronJob, etc.).
+"""
+import argparse
+import logging
+
+from src.config.setting import settings
+from src.database.connection import SessionLocal, init_db
+from src.services.archive_service import ArchiveService
+
+logger = logging.getLogger(__name__)
+
+
+def main(argv=None):
+    """Punto de entrada del comando"""
+    parser = argparse.ArgumentParser(
+        description="Mueve eventos pasados y sus asistencias al archivo"
+    )
+    parser.add_argument(
+        "--horizon-days",
+        type=int,
+        default=settings.ARCHIVE_HORIZON_DAYS,
+        help="Archivar eventos con fecha anterior a hoy menos N días",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=settings.ARCHIVE_BATCH_SIZE,
+        help="Eventos por transacción",
+    )
+    parser.add_argument(
+        "--max-batches",
+        type=int,
+        default=None,
+        help="Detenerse tras N lotes (por defecto, hasta terminar)",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=settings.LOG_LEVEL)
+    init_db()
+
+    db = SessionLocal()
+    try:
+        summary = ArchiveService(db).archive_past_events(
+            horizon_days=args.horizon_days,
+            batch_size=args.batch_size,
+            max_batches=args.max_batches,
+        )
+    finally:
+        db.close()
+
+    logger.info(
+        f"Archivado completado: {summary.archived_events} eventos y "
+        f"{summary.archived_attendances} asistencias en {summary.batches} lotes "
+        f"(anteriores a {summary.cutoff:%Y-%m-%d %H:%M})"
+    )
+    return summary
+
+
+if __name__ == "__main__":
+    main()
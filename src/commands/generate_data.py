@@ -0,0 +1,502 @@
+"""
+Comando para generar datos sintéticos de eventos, participantes y asistencias.
+
+Carga volúmenes grandes directamente en la base de datos, sin pasar por la
+API, para benchmarks y entornos de staging:
+
+- Popularidad Zipf: el evento de rango r recibe una demanda proporcional a
+  1 / r^s (`--zipf-exponent`), limitada por el número de participantes.
+- Curvas de llenado: los eventos más populares (y algunos al azar) se
+  agotan; el resto llena una fracción de su capacidad según una
+  distribución beta.
+- Fechas de registro: entre la publicación del evento y su fecha (o su
+  agotamiento, o hoy), con un pico al publicarse y un repunte al acercarse
+  el evento.
+
+Las filas se insertan con INSERT de varias filas por lote; en MySQL,
+`--load-data` usa LOAD DATA LOCAL INFILE (requiere `local_infile` activo
+en el servidor). Con la misma semilla, la misma fecha de referencia
+(`--reference-date`, por defecto hoy) y la misma base de partida se
+generan los mismos datos. Al final se reconstruyen las estadísticas de
+los eventos generados.
+
+Uso:
+    python -m src.commands.generate_data --events 1000 --participants 100000 --attendances 1000000
+    python -m src.commands.generate_data --attendances 1000000 --seed 7 --replace
+    python -m src.commands.generate_data --attendances 5000000 --load-data   # MySQL
+"""
+import argparse
+import csv
+import logging
+import math
+import os
+import random
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.engine import Connection, Engine
+
+from src.config.setting import settings
+from src.database.connection import Base, SessionLocal, get_engine, init_db
+from src.models.archive import ArchivedEvent
+from src.models.attendance import Attendance
+from src.models.event import Event
+from src.models.participant import Participant
+from src.services.statistics_service import StatisticsService
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 10000
+
+# Fracción de eventos (los más populares) que se agotan siempre
+SOLD_OUT_TOP_FRACTION = 0.05
+# Probabilidad de que cualquier otro evento se agote
+SOLD_OUT_PROBABILITY = 0.1
+# Fracción de registros en el pico inicial (al publicarse el evento)
+EARLY_BURST_FRACTION = 0.35
+MIN_CAPACITY = 10
+
+FIRST_NAMES = (
+    "Ana", "Carlos", "María", "Juan", "Laura", "Andrés", "Valentina", "Diego",
+    "Camila", "Santiago", "Daniela", "Felipe", "Sofía", "Mateo", "Isabella",
+    "Sebastián", "Mariana", "Nicolás", "Gabriela", "Alejandro",
+)  # fmt: skip
+LAST_NAMES = (
+    "García", "Rodríguez", "Martínez", "López", "González", "Pérez", "Sánchez",
+    "Ramírez", "Torres", "Flores", "Rivera", "Gómez", "Díaz", "Cruz", "Morales",
+    "Ortiz", "Gutiérrez", "Castro", "Vargas", "Rojas",
+)  # fmt: skip
+EVENT_KINDS = (
+    "Conferencia", "Taller", "Concierto", "Meetup", "Seminario", "Festival",
+    "Hackatón", "Feria", "Charla", "Congreso",
+)  # fmt: skip
+EVENT_TOPICS = (
+    "Python", "Datos", "Jazz", "Emprendimiento", "Diseño", "Nube", "Rock",
+    "Salud", "Fotografía", "Seguridad", "Gastronomía", "IA",
+)  # fmt: skip
+CITIES = (
+    "Bogotá", "Medellín", "Cali", "Barranquilla", "Cartagena", "Bucaramanga",
+    "Pereira", "Manizales", "Santa Marta", "Villavicencio",
+)  # fmt: skip
+
+
+class EventPlan(NamedTuple):
+    """Evento a generar con sus registros"""
+
+    id: int
+    date: datetime
+    created_at: datetime
+    capacity: int
+    registrations: int
+    # Fin de la ventana de registro: fecha del evento, agotamiento u hoy
+    closes_at: datetime
+
+
+def zipf_weights(count: int, exponent: float) -> List[float]:
+    """Peso de cada rango (1..count) en una distribución Zipf"""
+    return [1 / rank**exponent for rank in range(1, count + 1)]
+
+
+def allocate(total: int, weights: Sequence[float], cap: int) -> List[int]:
+    """
+    Reparte `total` unidades en proporción a `weights` sin superar `cap`.
+
+    El excedente de los que llegan al tope se reparte entre los demás.
+
+    Raises:
+        ValueError: Si `total` no cabe (más que len(weights) * cap)
+    """
+    if total > len(weights) * cap:
+        raise ValueError(
+            f"No caben {total} asistencias en {len(weights)} eventos "
+            f"con {cap} participantes"
+        )
+    counts = [0] * len(weights)
+    remaining = total
+    active = list(range(len(weights)))
+    while remaining > 0:
+        weight_sum = sum(weights[index] for index in active)
+        assigned = 0
+        for index in active:
+            share = int(remaining * weights[index] / weight_sum)
+            take = min(share, cap - counts[index])
+            counts[index] += take
+            assigned += take
+        if assigned == 0:
+            # Quedan menos unidades que eventos: una a cada uno por peso
+            for index in active[:remaining]:
+                counts[index] += 1
+            assigned = min(remaining, len(active))
+        remaining -= assigned
+        active = [index for index in active if counts[index] < cap]
+    return counts
+
+
+def plan_events(
+    rng: random.Random,
+    first_id: int,
+    events: int,
+    participants: int,
+    attendances: int,
+    zipf_exponent: float,
+    now: datetime,
+) -> List[EventPlan]:
+    """
+    Fechas, capacidad y número de registros de cada evento.
+
+    Los rangos de popularidad se asignan a IDs al azar, así que los
+    eventos populares no son siempre los primeros.
+    """
+    demand = allocate(attendances, zipf_weights(events, zipf_exponent), participants)
+    ids = list(range(first_id, first_id + events))
+    rng.shuffle(ids)
+    sold_out_top = max(1, int(events * SOLD_OUT_TOP_FRACTION))
+
+    plans = []
+    for rank, (event_id, registrations) in enumerate(zip(ids, demand)):
+        event_date = now + timedelta(days=rng.uniform(-180, 365))
+        created_at = min(
+            event_date - timedelta(days=rng.uniform(14, 120)), now - timedelta(days=1)
+        )
+        closes_at = min(event_date, now)
+        sold_out = registrations > 0 and (
+            rank < sold_out_top or rng.random() < SOLD_OUT_PROBABILITY
+        )
+        if sold_out:
+            capacity = max(registrations, MIN_CAPACITY)
+            # Se agotó antes de la fecha del evento
+            closes_at = created_at + (closes_at - created_at) * rng.uniform(0.2, 0.9)
+        else:
+            fill = 0.05 + 0.9 * rng.betavariate(2, 2)
+            # Capacidad redondeada a decenas, como la publicaría un organizador
+            capacity = max(math.ceil(registrations / fill / 10) * 10, MIN_CAPACITY)
+        plans.append(
+            EventPlan(
+                id=event_id,
+                date=event_date.replace(microsecond=0),
+                created_at=created_at.replace(microsecond=0),
+                capacity=capacity,
+                registrations=registrations,
+                closes_at=closes_at.replace(microsecond=0),
+            )
+        )
+    plans.sort(key=lambda plan: plan.id)
+    return plans
+
+
+def registration_times(
+    rng: random.Random, plan: EventPlan, count: int
+) -> List[datetime]:
+    """
+    Fechas de registro ordenadas: un pico al publicarse el evento y un
+    repunte a medida que se acerca el cierre.
+    """
+    opens_at = plan.created_at
+    span = max((plan.closes_at - opens_at).total_seconds(), 1)
+    times = []
+    for _ in range(count):
+        if rng.random() < EARLY_BURST_FRACTION:
+            position = rng.betavariate(1, 6)
+        else:
+            position = rng.betavariate(4, 1.5)
+        times.append(opens_at + timedelta(seconds=int(span * position)))
+    times.sort()
+    return times
+
+
+def event_rows(rng: random.Random, plans: Iterable[EventPlan]) -> Iterator[tuple]:
+    for plan in plans:
+        kind = rng.choice(EVENT_KINDS)
+        topic = rng.choice(EVENT_TOPICS)
+        city = rng.choice(CITIES)
+        yield (
+            plan.id,
+            f"{kind} de {topic} {city} #{plan.id}",
+            f"{kind} sobre {topic.lower()} en {city}",
+            f"{city}, sede {rng.randint(1, 20)}",
+            plan.date,
+            plan.capacity,
+            plan.created_at,
+            plan.created_at,
+        )
+
+
+def participant_rows(
+    rng: random.Random, first_id: int, count: int, since: datetime
+) -> Iterator[tuple]:
+    for participant_id in range(first_id, first_id + count):
+        first_name = rng.choice(FIRST_NAMES)
+        last_name = rng.choice(LAST_NAMES)
+        created_at = since - timedelta(seconds=rng.randint(0, 365 * 86400))
+        yield (
+            participant_id,
+            f"{first_name} {last_name}",
+            f"participante{participant_id}@example.com",
+            f"+573{rng.randint(0, 999999999):09d}",
+            created_at,
+            created_at,
+        )
+
+
+def attendance_rows(
+    rng: random.Random,
+    plans: Iterable[EventPlan],
+    first_participant_id: int,
+    participants: int,
+) -> Iterator[tuple]:
+    population = range(first_participant_id, first_participant_id + participants)
+    for plan in plans:
+        attendees = rng.sample(population, plan.registrations)
+        for participant_id, registered_at in zip(
+            attendees, registration_times(rng, plan, plan.registrations)
+        ):
+            yield (plan.id, participant_id, registered_at)
+
+
+EVENT_COLUMNS = (
+    "id",
+    "name",
+    "description",
+    "location",
+    "date",
+    "capacity",
+    "created_at",
+    "updated_at",
+)
+PARTICIPANT_COLUMNS = ("id", "name", "email", "phone", "created_at", "updated_at")
+ATTENDANCE_COLUMNS = ("event_id", "participant_id", "registered_at")
+
+
+def _chunks(rows: Iterable[tuple]) -> Iterator[List[tuple]]:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == CHUNK_SIZE:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def insert_rows(
+    connection: Connection, model, columns: Sequence[str], rows: Iterable[tuple]
+) -> int:
+    """
+    Inserta las filas por lotes de CHUNK_SIZE.
+
+    executemany con pymysql se envía como un INSERT de varias filas por
+    lote; en SQLite, como una sentencia preparada reutilizada.
+    """
+    statement = insert(model)
+    inserted = 0
+    for chunk in _chunks(rows):
+        connection.execute(statement, [dict(zip(columns, row)) for row in chunk])
+        inserted += len(chunk)
+    return inserted
+
+
+def load_data_infile(
+    connection: Connection, model, columns: Sequence[str], rows: Iterable[tuple]
+) -> int:
+    """Carga las filas en MySQL con LOAD DATA LOCAL INFILE desde un CSV"""
+    inserted = 0
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".csv", encoding="utf-8", newline="", delete=False
+    ) as file:
+        writer = csv.writer(file, lineterminator="\n")
+        for row in rows:
+            writer.writerow(row)
+            inserted += 1
+    try:
+        connection.exec_driver_sql(
+            f"LOAD DATA LOCAL INFILE '{file.name}' "
+            f"INTO TABLE {model.__tablename__} CHARACTER SET utf8mb4 "
+            "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' "
+            "LINES TERMINATED BY '\\n' "
+            f"({', '.join(columns)})"
+        )
+    finally:
+        os.remove(file.name)
+    return inserted
+
+
+def _next_id(connection: Connection, *models) -> int:
+    """Primer ID libre en todas las tablas indicadas (p. ej. activa y archivo)"""
+    return (
+        max(
+            connection.execute(select(func.max(model.id))).scalar() or 0
+            for model in models
+        )
+        + 1
+    )
+
+
+def _loader_engine(load_data: bool) -> Engine:
+    if not load_data:
+        return get_engine()
+    engine = get_engine()
+    if engine.dialect.name != "mysql":
+        raise ValueError("--load-data solo está disponible con MySQL")
+    return create_engine(engine.url, connect_args={"local_infile": True})
+
+
+def generate(
+    events: int,
+    participants: int,
+    attendances: int,
+    seed: int = 42,
+    zipf_exponent: float = 1.1,
+    replace: bool = False,
+    load_data: bool = False,
+    reference_date: Optional[datetime] = None,
+) -> List[EventPlan]:
+    """
+    Genera e inserta los datos y reconstruye las estadísticas.
+
+    Args:
+        events: Eventos a generar
+        participants: Participantes a generar
+        attendances: Asistencias a repartir entre los eventos
+        seed: Semilla; la misma semilla genera los mismos datos
+        zipf_exponent: Exponente s de la popularidad (mayor, más concentrada)
+        replace: Recrear las tablas antes de generar
+        load_data: Usar LOAD DATA LOCAL INFILE (MySQL)
+        reference_date: "Hoy" para las fechas generadas; por defecto, la
+            medianoche UTC de hoy
+
+    Returns:
+        Los eventos generados
+    """
+    if events < 1 or participants < 1:
+        raise ValueError("Se necesita al menos un evento y un participante")
+
+    rng = random.Random(seed)
+    engine = _loader_engine(load_data)
+    if replace:
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+
+    load = load_data_infile if load_data else insert_rows
+    now = reference_date or datetime.combine(
+        datetime.utcnow().date(), datetime.min.time()
+    )
+    with engine.begin() as connection:
+        # El archivo conserva los IDs de los eventos archivados
+        first_event_id = _next_id(connection, Event, ArchivedEvent)
+        first_participant_id = _next_id(connection, Participant)
+        plans = plan_events(
+            rng, first_event_id, events, participants, attendances, zipf_exponent, now
+        )
+        earliest = min(plan.created_at for plan in plans)
+
+        if engine.dialect.name == "sqlite":
+            connection.exec_driver_sql("PRAGMA synchronous = OFF")
+        elif engine.dialect.name == "mysql":
+            # Las filas son consistentes por construcción
+            connection.exec_driver_sql("SET unique_checks = 0, foreign_key_checks = 0")
+
+        for model, columns, rows in (
+            (Event, EVENT_COLUMNS, event_rows(rng, plans)),
+            (
+                Participant,
+                PARTICIPANT_COLUMNS,
+                participant_rows(rng, first_participant_id, participants, earliest),
+            ),
+            (
+                Attendance,
+                ATTENDANCE_COLUMNS,
+                attendance_rows(rng, plans, first_participant_id, participants),
+            ),
+        ):
+            start = time.perf_counter()
+            inserted = load(connection, model, columns, rows)
+            elapsed = time.perf_counter() - start
+            logger.info(
+                f"{model.__tablename__}: {inserted} filas en {elapsed:.1f}s "
+                f"({inserted / max(elapsed, 1e-9):,.0f} filas/s)"
+            )
+
+        if engine.dialect.name == "mysql":
+            connection.exec_driver_sql("SET unique_checks = 1, foreign_key_checks = 1")
+
+    if engine is not get_engine():
+        engine.dispose()
+
+    start = time.perf_counter()
+    db = SessionLocal()
+    try:
+        service = StatisticsService(db)
+        event_ids = [plan.id for plan in plans]
+        for offset in range(0, len(event_ids), 1000):
+            service.rebuild(event_ids[offset : offset + 1000])
+            db.commit()
+    finally:
+        db.close()
+    logger.info(f"Estadísticas reconstruidas en {time.perf_counter() - start:.1f}s")
+    return plans
+
+
+def main(argv=None):
+    """Punto de entrada del comando"""
+    parser = argparse.ArgumentParser(
+        description="Genera eventos, participantes y asistencias sintéticos"
+    )
+    parser.add_argument("--events", type=int, default=1000)
+    parser.add_argument("--participants", type=int, default=100000)
+    parser.add_argument("--attendances", type=int, default=1000000)
+    parser.add_argument(
+        "--seed", type=int, default=42, help="Misma semilla, mismos datos"
+    )
+    parser.add_argument(
+        "--zipf-exponent",
+        type=float,
+        default=1.1,
+        help="Concentración de la popularidad de los eventos",
+    )
+    parser.add_argument(
+        "--reference-date",
+        type=date.fromisoformat,
+        help="Fecha tomada como hoy (AAAA-MM-DD); por defecto, la actual",
+    )
+    parser.add_argument(
+        "--replace",
+        action="store_true",
+        help="Elimina y recrea las tablas antes de generar (borra los datos)",
+    )
+    parser.add_argument(
+        "--load-data",
+        action="store_true",
+        help="Carga con LOAD DATA LOCAL INFILE (solo MySQL)",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=settings.LOG_LEVEL)
+    init_db()
+
+    start = time.perf_counter()
+    plans = generate(
+        events=args.events,
+        participants=args.participants,
+        attendances=args.attendances,
+        seed=args.seed,
+        zipf_exponent=args.zipf_exponent,
+        replace=args.replace,
+        load_data=args.load_data,
+        reference_date=datetime.combine(args.reference_date, datetime.min.time())
+        if args.reference_date
+        else None,
+    )
+    sold_out = sum(1 for plan in plans if plan.registrations == plan.capacity)
+    logger.info(
+        f"Generados {len(plans)} eventos ({sold_out} agotados), "
+        f"{args.participants} participantes y {args.attendances} asistencias "
+        f"en {time.perf_counter() - start:.1f}s"
+    )
+    return plans
+
+
+if __name__ == "__main__":
+    main()
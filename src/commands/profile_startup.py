@@ -0,0 +1,116 @@
+"""
+Comando para perfilar el arranque de la aplicación.
+
+Mide en un proceso nuevo (arranque en frío):
+- El tiempo de importación por módulo (python -X importtime), ordenado
+  por tiempo acumulado.
+- El tiempo hasta responder el primer health check y la duración de cada
+  paso del arranque (perfil de src.observability.startup).
+
+Uso:
+    python -m src.commands.profile_startup
+    python -m src.commands.profile_startup --top 40 --prefix src.
+    python -m src.commands.profile_startup --module src.commands.archive_events
+"""
+import argparse
+import json
+import subprocess
+import sys
+from typing import List, NamedTuple
+
+COLD_START_SCRIPT = """
+import json, time
+start = time.perf_counter()
+from fastapi.testclient import TestClient
+from src.main import app
+from src.observability.startup import startup
+with TestClient(app) as client:
+    client.get("/health/")
+    first_health_ms = (time.perf_counter() - start) * 1000
+    startup.wait("init_db", timeout=60)
+print(json.dumps({"first_health_ms": first_health_ms, **startup.snapshot()}))
+"""
+
+
+class ImportTime(NamedTuple):
+    """Tiempo de importación de un módulo, en microsegundos"""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def profile_imports(module: str) -> List[ImportTime]:
+    """Importa `module` en un proceso nuevo y retorna el tiempo por módulo"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        times.append(ImportTime(name.strip(), int(self_us), int(cumulative_us)))
+    return times
+
+
+def profile_cold_start() -> dict:
+    """Arranca la aplicación en un proceso nuevo y retorna su perfil"""
+    result = subprocess.run(
+        [sys.executable, "-c", COLD_START_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    """Punto de entrada del comando"""
+    parser = argparse.ArgumentParser(
+        description="Perfila la importación y el arranque de la aplicación"
+    )
+    parser.add_argument(
+        "--module", default="src.main", help="Módulo a importar (src.main)"
+    )
+    parser.add_argument(
+        "--top", type=int, default=25, help="Módulos a mostrar por tiempo acumulado"
+    )
+    parser.add_argument(
+        "--prefix", default="", help="Mostrar solo módulos con este prefijo (src.)"
+    )
+    parser.add_argument(
+        "--skip-cold-start",
+        action="store_true",
+        help="No medir el arranque completo de la aplicación",
+    )
+    args = parser.parse_args(argv)
+
+    times = profile_imports(args.module)
+    total = next(t for t in times if t.module == args.module)
+    print(f"Importar {args.module}: {total.cumulative_us / 1000:.1f} ms")
+    print(f"{'acumulado':>12} {'propio':>10}  módulo")
+    selected = [t for t in times if t.module.startswith(args.prefix)]
+    for entry in sorted(selected, key=lambda t: t.cumulative_us, reverse=True)[
+        : args.top
+    ]:
+        print(
+            f"{entry.cumulative_us / 1000:>10.1f}ms "
+            f"{entry.self_us / 1000:>8.1f}ms  {entry.module}"
+        )
+
+    if args.skip_cold_start or args.module != "src.main":
+        return times
+
+    profile = profile_cold_start()
+    print(f"\nPrimer health check: {profile['first_health_ms']:.1f} ms")
+    for name, step in profile["steps"].items():
+        print(f"  {name:<20} {step.get('duration_ms', 0):>10.1f} ms  {step['status']}")
+    return times
+
+
+if __name__ == "__main__":
+    main()
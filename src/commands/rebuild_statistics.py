@@ -0,0 +1,63 @@
+"""
+Comando para reconstruir la proyección de estadísticas de eventos.
+
+Recalcula `event_statistics` y `event_daily_registrations` a partir de la
+tabla de asistencias. Sirve como backfill al desplegar la proyección sobre
+datos existentes y para corregir cualquier desviación.
+
+Uso:
+    python -m src.commands.rebuild_statistics
+    python -m src.commands.rebuild_statistics --batch-size 500
+    python -m src.commands.rebuild_statistics --event-id 12 --event-id 15
+"""
+import argparse
+import logging
+
+from src.config.setting import settings
+from src.database.connection import SessionLocal, init_db
+from src.services.statistics_service import StatisticsService
+
+logger = logging.getLogger(__name__)
+
+
+def main(argv=None):
+    """Punto de entrada del comando"""
+    parser = argparse.ArgumentParser(
+        description="Reconstruye las estadísticas de eventos desde las asistencias"
+    )
+    parser.add_argument(
+        "--event-id",
+        type=int,
+        action="append",
+        dest="event_ids",
+        help="Reconstruir solo este evento (se puede repetir)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="Eventos por transacción al reconstruir todos",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=settings.LOG_LEVEL)
+    init_db()
+
+    db = SessionLocal()
+    try:
+        service = StatisticsService(db)
+        if args.event_ids:
+            service.rebuild(args.event_ids)
+            db.commit()
+            processed = len(args.event_ids)
+        else:
+            processed = service.rebuild_all(batch_size=args.batch_size)
+    finally:
+        db.close()
+
+    logger.info(f"Estadísticas reconstruidas para {processed} eventos")
+    return processed
+
+
+if __name__ == "__main__":
+    main()
@@ -51,6 +51,251 @@ class Settings(BaseSettings):
     Útil para debugging, desactivar en producción.
     """
 
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0
+    """
+    Las sentencias SQL que tardan más que esto se registran en el log
+    (normalizadas y con los tipos de sus parámetros, sin los valores).
+    """
+
+    N_PLUS_ONE_THRESHOLD: int = 10
+    """
+    Si una misma sentencia normalizada se ejecuta más veces que esto en una
+    petición, se registra un aviso de posible N+1. Fuera de producción las
+    respuestas incluyen además X-Query-Count y X-Query-Time.
+    """
+
+    EVENT_DELETE_BATCH_SIZE: int = 5000
+    """
+    Número de asistencias eliminadas por transacción cuando un evento
+    se elimina en segundo plano (DELETE /events/{id}?background=true).
+    """
+
+    ARCHIVE_HORIZON_DAYS: int = 30
+    """
+    Días después de la fecha de un evento a partir de los cuales se mueve,
+    junto con sus asistencias, a las tablas de archivo.
+    """
+
+    ARCHIVE_BATCH_SIZE: int = 500
+    """
+    Número de eventos archivados por transacción.
+    """
+
+    ATTENDANCE_BULK_MAX_ITEMS: int = 1000
+    """
+    Máximo de participantes por petición de registro masivo
+    (POST /attendances/bulk).
+    """
+
+    LOOKUP_MAX_ITEMS: int = 200
+    """
+    Máximo de IDs o emails por petición en las búsquedas por lote
+    (GET /events?ids=, GET /events/statistics, POST /participants/lookup).
+    """
+
+    PARTICIPANT_IMPORT_BATCH_SIZE: int = 1000
+    """
+    Filas escritas por transacción al importar participantes
+    (POST /participants/import).
+    """
+
+    PARTICIPANT_IMPORT_MAX_ERRORS: int = 100
+    """
+    Máximo de errores por fila incluidos en el resumen de una importación.
+    Los errores adicionales solo se cuentan.
+    """
+
+    PARTICIPANT_IMPORT_MAX_RECORD_SIZE: int = 65536
+    """
+    Máximo de caracteres de un registro CSV que ocupa varias líneas. Un
+    campo entre comillas sin cerrar se reporta como fila inválida al llegar
+    a este tamaño, en lugar de acumular el resto del archivo.
+    """
+
+    EXPORT_CHUNK_SIZE: int = 1000
+    """
+    Filas leídas del cursor y enviadas por bloque en las exportaciones
+    en streaming (CSV / NDJSON).
+    """
+
+    # ============================================
+    # ARRANQUE
+    # ============================================
+    STARTUP_INIT_DB_IN_BACKGROUND: bool = True
+    """
+    Si es True, la creación de tablas (init_db) corre en segundo plano y el
+    servidor responde de inmediato (p. ej. /health). Las peticiones que usan
+    la base de datos esperan a que termine.
+    """
+
+    STARTUP_DB_WAIT_TIMEOUT: float = 30.0
+    """
+    Segundos que una petición espera a que termine init_db en segundo plano.
+    """
+
+    # ============================================
+    # HEALTH CHECKS
+    # ============================================
+    HEALTH_CHECK_INTERVAL: float = 5.0
+    """
+    Segundos entre verificaciones de dependencias (base de datos, Redis).
+    /health/ready y /health/detailed sirven el último resultado sin I/O.
+    """
+
+    HEALTH_CHECK_TIMEOUT: float = 2.0
+    """
+    Tiempo máximo (segundos) de cada verificación de dependencias.
+    """
+
+    HEALTH_POOL_SATURATION_WARNING: float = 0.9
+    """
+    Fracción de conexiones del pool en uso a partir de la cual el estado
+    se reporta como "degraded".
+    """
+
+    # ============================================
+    # MÉTRICAS
+    # ============================================
+    METRICS_ENABLED: bool = True
+    """
+    Expone /metrics (formato Prometheus) y registra métricas de peticiones,
+    base de datos y caché. Con varios workers, definir además la variable
+    de entorno PROMETHEUS_MULTIPROC_DIR (ver gunicorn.conf.py).
+    """
+
+    # ============================================
+    # TRAZAS
+    # ============================================
+    TRACING_ENABLED: bool = True
+    """
+    Mide cada petición por categoría (controller, service, db, cache,
+    serialize). Fuera de producción agrega además el encabezado
+    Server-Timing a la respuesta.
+    """
+
+    TRACING_SAMPLE_RATE: float = 0.0
+    """
+    Fracción de peticiones (0.0 a 1.0) cuyos spans se exportan. Las
+    peticiones con un `traceparent` W3C muestreado se exportan siempre.
+    Con 0.0 solo se acumulan los totales del encabezado Server-Timing.
+    """
+
+    TRACING_EXPORTER: str = "console"
+    """
+    Destino de las trazas muestreadas en formato OTLP/JSON:
+    "console" (stdout), "file" (TRACING_EXPORT_PATH) o "none".
+    """
+
+    TRACING_EXPORT_PATH: str = "traces.jsonl"
+
+    # ============================================
+    # DIAGNÓSTICO
+    # ============================================
+    DIAGNOSTICS_TOKEN: str = ""
+    """
+    Token secreto para las herramientas de diagnóstico (encabezado
+    X-Diagnostics-Token). Vacío desactiva /diagnostics y el perfilado.
+    """
+
+    PROFILING_ENABLED: bool = False
+    """
+    Permite perfilar una petición enviando X-Profile: cprofile|sampling
+    junto con X-Diagnostics-Token. La respuesta incluye X-Profile-Id.
+    """
+
+    PROFILING_DIR: str = "profiles"
+    PROFILING_MAX_FILES: int = 100
+    """
+    Directorio de los perfiles guardados y cuántos se conservan (se
+    eliminan los más antiguos).
+    """
+
+    PROFILING_SAMPLE_INTERVAL_MS: float = 1.0
+    """
+    Intervalo entre muestras del profiler de muestreo (X-Profile: sampling).
+    """
+
+    MEMORY_MAX_SNAPSHOTS: int = 5
+    """
+    Instantáneas de tracemalloc conservadas por proceso
+    (POST /diagnostics/memory/snapshots); se descartan las más antiguas.
+    """
+
+    # ============================================
+    # CAPTURA DE TRÁFICO
+    # ============================================
+    TRAFFIC_CAPTURE_ENABLED: bool = False
+    """
+    Registra una muestra de las peticiones (método, ruta, parámetros,
+    cuerpo sin datos personales, estado y duración) para reproducirlas con
+    `python -m loadtest.replay`.
+    """
+
+    TRAFFIC_CAPTURE_SAMPLE_RATE: float = 0.1
+    """
+    Fracción de peticiones capturadas (0.0 a 1.0)
+    """
+
+    TRAFFIC_CAPTURE_PATH: str = "traffic/capture-{pid}.jsonl"
+    """
+    Archivo JSONL de la captura; `{pid}` se reemplaza por el PID para que
+    cada worker escriba en su propio archivo.
+    """
+
+    TRAFFIC_CAPTURE_MAX_BODY_BYTES: int = 4096
+    TRAFFIC_CAPTURE_MAX_FILE_MB: int = 100
+    """
+    Los cuerpos más grandes solo registran su tamaño. Al llegar el archivo
+    al máximo se dejan de escribir muestras.
+    """
+
+    TRAFFIC_CAPTURE_HASH_KEY: str = ""
+    """
+    Clave del HMAC que reemplaza emails y teléfonos. Vacía usa una clave
+    aleatoria por proceso; definirla para que un mismo email tenga el
+    mismo reemplazo en todos los workers y reinicios.
+    """
+
+    # ============================================
+    # COMPRESIÓN DE RESPUESTAS
+    # ============================================
+    COMPRESSION_ENABLED: bool = True
+    """
+    Comprime las respuestas con gzip (o brotli, si el paquete está
+    instalado y el cliente lo acepta).
+    """
+
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    """
+    Tamaño mínimo del cuerpo en bytes para comprimir. Por debajo de este
+    tamaño la compresión no compensa su costo de CPU.
+    """
+
+    COMPRESSION_CONTENT_TYPES: List[str] = [
+        "application/json",
+        "application/x-ndjson",
+        "text/csv",
+        "text/html",
+        "text/plain",
+    ]
+    """
+    Tipos de contenido que se comprimen. Los formatos ya comprimidos
+    (p. ej. application/gzip) no se incluyen.
+    """
+
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5
+    """
+    Nivel de gzip (1-9) y calidad de brotli (0-11). Valores intermedios
+    equilibran tamaño y CPU para contenido dinámico.
+    """
+
+    COMPRESSION_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+    """
+    Tamaño máximo (por proceso) del caché de cuerpos ya comprimidos.
+    Las respuestas repetidas se comprimen una sola vez. 0 lo desactiva.
+    """
+
     # ============================================
     # CONFIGURACIÓN DE REDIS (CACHÉ)
     # ============================================
@@ -64,6 +309,20 @@ class Settings(BaseSettings):
     Por defecto: 300 segundos (5 minutos)
     """
 
+    REDIS_SOCKET_TIMEOUT: float = 1.0
+    """
+    Timeout (segundos) de conexión y de cada comando a Redis. El caché es
+    opcional: es preferible omitirlo a bloquear la petición.
+    """
+
+    REDIS_BREAKER_FAILURE_THRESHOLD: int = 5
+    REDIS_BREAKER_RESET_TIMEOUT: float = 30.0
+    """
+    Circuit breaker de Redis: tras REDIS_BREAKER_FAILURE_THRESHOLD fallos
+    consecutivos el caché se omite durante REDIS_BREAKER_RESET_TIMEOUT
+    segundos antes de volver a intentar.
+    """
+
     # ============================================
     # CONFIGURACIÓN DE CORS
     # ============================================
@@ -82,6 +341,25 @@ class Settings(BaseSettings):
     Opciones: DEBUG, INFO, WARNING, ERROR, CRITICAL
     """
 
+    LOG_FORMAT: str = "json"
+    """
+    Formato de los logs: "json" (una línea por registro, con request_id)
+    o "text" (legible, para desarrollo local).
+    """
+
+    LOG_QUEUE_SIZE: int = 10000
+    """
+    Registros en espera de ser escritos por el hilo de logging. Si la cola
+    se llena, los registros nuevos se descartan en lugar de frenar las
+    peticiones.
+    """
+
+    LOG_BUSINESS_EXCEPTIONS_PER_MINUTE: int = 10
+    """
+    Máximo de logs por minuto para cada tipo de error de negocio (404,
+    409...) y ruta. El resto se omite y se informa la cantidad omitida.
+    """
+
     class Config:
         """Configuración de Pydantic Settings"""
 
@@ -3,8 +3,10 @@ Controllers para los endpoints de la API
 """
 from . import (
     attendance_controller,
+    diagnostics_controller,
     event_controller,
     health_controller,
+    metrics_controller,
     participant_controller,
 )
 
@@ -13,4 +15,6 @@ __all__ = [
     "participant_controller",
     "attendance_controller",
     "health_controller",
+    "metrics_controller",
+    "diagnostics_controller",
 ]
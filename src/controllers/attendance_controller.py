@@ -4,17 +4,30 @@ Controller para endpoints de Asistencias
 from typing import List
 
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from src.database.connection import get_db
+from src.observability.tracing import TracedRoute
 from src.schemas.attendance import (
+    AttendanceBulkCreate,
+    AttendanceBulkResponse,
     AttendanceCreate,
     AttendanceDetail,
+    AttendanceMultiEventCreate,
     AttendanceResponse,
 )
+from src.schemas.serialization import model_response
 from src.services.attendance_service import AttendanceService
+from src.services.event_service import EventService
+from src.services.export_service import (
+    MEDIA_TYPES,
+    ExportFormat,
+    export_filename,
+    stream_with_own_session,
+)
 
-router = APIRouter(prefix="/attendances", tags=["Attendances"])
+router = APIRouter(prefix="/attendances", tags=["Attendances"], route_class=TracedRoute)
 
 
 @router.post(
@@ -26,6 +39,47 @@ def register_attendance(attendance: AttendanceCreate, db: Session = Depends(get_
     return service.register_attendance(attendance)
 
 
+@router.post("/bulk", response_model=AttendanceBulkResponse)
+def register_attendances_bulk(
+    bulk: AttendanceBulkCreate, db: Session = Depends(get_db)
+):
+    """
+    Registra varios participantes a un evento en una sola transacción.
+
+    Retorna el resultado por participante: `created`, `duplicate`,
+    `not_found` u `over_capacity`.
+    """
+    service = AttendanceService(db)
+    return model_response(
+        AttendanceBulkResponse, service.register_attendances_bulk(bulk)
+    )
+
+
+@router.post(
+    "/multi-event",
+    response_model=AttendanceBulkResponse,
+    responses={409: {"model": AttendanceBulkResponse}},
+)
+def register_attendance_multi_event(
+    multi: AttendanceMultiEventCreate, db: Session = Depends(get_db)
+):
+    """
+    Registra un participante a varios eventos en una sola transacción.
+
+    Con `mode=all_or_nothing` (por defecto) responde 409 sin registrar nada
+    si algún evento no existe, está lleno o ya tiene al participante. Con
+    `mode=best_effort` registra los eventos posibles.
+    """
+    service = AttendanceService(db)
+    result = service.register_attendance_multi_event(multi)
+    conflict = multi.mode == "all_or_nothing" and result.created < len(result.items)
+    return model_response(
+        AttendanceBulkResponse,
+        result,
+        status_code=status.HTTP_409_CONFLICT if conflict else status.HTTP_200_OK,
+    )
+
+
 @router.delete("/{attendance_id}", status_code=status.HTTP_204_NO_CONTENT)
 def cancel_attendance(attendance_id: int, db: Session = Depends(get_db)):
     """Cancela una asistencia."""
@@ -35,13 +89,48 @@ def cancel_attendance(attendance_id: int, db: Session = Depends(get_db)):
 
 @router.get("/event/{event_id}", response_model=List[AttendanceDetail])
 def get_event_attendances(event_id: int, db: Session = Depends(get_db)):
-    """Obtiene todos los participantes registrados en un evento específico."""
+    """Obtiene los participantes de un evento (activo o archivado)."""
     service = AttendanceService(db)
-    return service.get_event_attendances(event_id)
+    return model_response(
+        List[AttendanceDetail], service.get_event_attendances(event_id)
+    )
+
+
+@router.get("/event/{event_id}/export")
+def export_event_attendances(
+    event_id: int,
+    format: ExportFormat = "csv",
+    gzip: bool = False,
+    db: Session = Depends(get_db),
+):
+    """
+    Descarga los participantes de un evento en CSV o NDJSON, en streaming.
+
+    Con `gzip=true` el archivo se envía comprimido (.gz).
+    """
+    EventService(db).get_event(event_id)
+    filename = export_filename(f"event-{event_id}-attendees", format, gzip)
+    return StreamingResponse(
+        stream_with_own_session(
+            db.get_bind(),
+            lambda export: export.stream_event_attendees(event_id, format, gzip),
+        ),
+        media_type="application/gzip" if gzip else MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @router.get("/participant/{participant_id}", response_model=List[AttendanceDetail])
-def get_participant_attendances(participant_id: int, db: Session = Depends(get_db)):
-    """Obtiene todos los eventos en los que está registrado un participante."""
+def get_participant_attendances(
+    participant_id: int, include_archived: bool = False, db: Session = Depends(get_db)
+):
+    """
+    Obtiene todos los eventos en los que está registrado un participante.
+
+    Con `include_archived=true` incluye también los eventos archivados.
+    """
     service = AttendanceService(db)
-    return service.get_participant_attendances(participant_id)
+    return model_response(
+        List[AttendanceDetail],
+        service.get_participant_attendances(participant_id, include_archived),
+    )
@@ -0,0 +1,128 @@
+"""
+Controller para las herramientas de diagnóstico
+
+- /diagnostics/profiles: perfiles de peticiones (ver X-Profile)
+- /diagnostics/memory: tracemalloc, GC y objetos ORM vivos
+
+Todos los endpoints requieren el encabezado X-Diagnostics-Token con el
+valor de DIAGNOSTICS_TOKEN.
+"""
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import FileResponse
+
+from src.config.setting import settings
+from src.exceptions.custom_exceptions import EventiaException, NotFoundException
+from src.observability.memory import GROUP_BY, memory_diagnostics, orm_object_counts
+from src.observability.profiling import ProfileStore, check_token
+
+router = APIRouter(prefix="/diagnostics", tags=["Diagnostics"])
+
+profile_store = ProfileStore(settings.PROFILING_DIR, settings.PROFILING_MAX_FILES)
+
+
+def require_token(x_diagnostics_token: Optional[str] = Header(None)) -> None:
+    """Verifica el token de diagnóstico"""
+    if not check_token(x_diagnostics_token, settings.DIAGNOSTICS_TOKEN):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Token de diagnóstico inválido",
+        )
+
+
+@router.get("/profiles", dependencies=[Depends(require_token)])
+def list_profiles():
+    """Perfiles guardados, del más reciente al más antiguo."""
+    return profile_store.list()
+
+
+@router.get("/profiles/{profile_id}", dependencies=[Depends(require_token)])
+def get_profile(profile_id: str):
+    """Descarga un perfil (.pstats o .speedscope.json)."""
+    path = profile_store.path(profile_id)
+    if path is None:
+        raise NotFoundException(f"Perfil {profile_id} no encontrado")
+    return FileResponse(path, filename=path.rsplit("/", 1)[-1])
+
+
+# ============================================
+# MEMORIA
+# ============================================
+@router.get("/memory", dependencies=[Depends(require_token)])
+def memory_status():
+    """RSS del proceso, estado de tracemalloc e instantáneas disponibles."""
+    return memory_diagnostics.status()
+
+
+@router.post("/memory/start", dependencies=[Depends(require_token)])
+def start_memory_tracking(frames: int = Query(10, ge=1, le=100)):
+    """
+    Activa tracemalloc (con `frames` niveles de traceback) y la medición
+    de pausas del GC. Mientras está activo, cada asignación cuesta más.
+    """
+    return memory_diagnostics.start(frames)
+
+
+@router.post("/memory/stop", dependencies=[Depends(require_token)])
+def stop_memory_tracking():
+    """Desactiva tracemalloc y la medición de pausas; descarta instantáneas."""
+    return memory_diagnostics.stop()
+
+
+@router.post("/memory/snapshots", dependencies=[Depends(require_token)])
+def take_memory_snapshot():
+    """Toma una instantánea de tracemalloc y retorna su ID."""
+    try:
+        return memory_diagnostics.take_snapshot()
+    except RuntimeError as e:
+        raise EventiaException(str(e), status_code=status.HTTP_409_CONFLICT)
+
+
+@router.get("/memory/snapshots/{snapshot_id}", dependencies=[Depends(require_token)])
+def get_memory_top(
+    snapshot_id: int,
+    group_by: str = Query("lineno", enum=list(GROUP_BY)),
+    limit: int = Query(20, ge=1, le=500),
+):
+    """Sitios que más memoria asignan en la instantánea."""
+    return memory_diagnostics.top(_get_snapshot(snapshot_id), group_by, limit)
+
+
+@router.get(
+    "/memory/snapshots/{snapshot_id}/diff/{base_id}",
+    dependencies=[Depends(require_token)],
+)
+def get_memory_diff(
+    snapshot_id: int,
+    base_id: int,
+    group_by: str = Query("lineno", enum=list(GROUP_BY)),
+    limit: int = Query(20, ge=1, le=500),
+):
+    """Sitios cuya memoria más creció (o bajó) desde la instantánea `base_id`."""
+    return memory_diagnostics.diff(
+        _get_snapshot(base_id), _get_snapshot(snapshot_id), group_by, limit
+    )
+
+
+@router.get("/memory/gc", dependencies=[Depends(require_token)])
+def get_gc_stats():
+    """Recolecciones por generación y, con el seguimiento activo, sus pausas."""
+    return memory_diagnostics.gc_stats()
+
+
+@router.get("/memory/objects", dependencies=[Depends(require_token)])
+def get_orm_object_counts():
+    """
+    Instancias vivas de cada modelo ORM y sesiones abiertas.
+
+    Recorre todo el heap del proceso: puede tardar decenas de ms.
+    """
+    return orm_object_counts()
+
+
+def _get_snapshot(snapshot_id: int):
+    snapshot = memory_diagnostics.get_snapshot(snapshot_id)
+    if snapshot is None:
+        raise NotFoundException(f"Instantánea {snapshot_id} no encontrada")
+    return snapshot
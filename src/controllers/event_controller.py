@@ -1,17 +1,32 @@
 """
 Controller para endpoints de Eventos
 """
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
-from src.database.connection import get_db
-from src.exceptions.custom_exceptions import EventiaException
-from src.schemas.event import EventCreate, EventResponse, EventStatistics, EventUpdate
+from src.config.setting import settings
+from src.database.connection import SessionLocal, get_db
+from src.exceptions.custom_exceptions import EventiaException, ValidationException
+from src.observability.tracing import TracedRoute
+from src.schemas.event import (
+    EVENT_FIELDS,
+    EVENT_LIST_DEFAULT_FIELDS,
+    EventCreate,
+    EventDailyRegistrations,
+    EventDeletionStatus,
+    EventPartialResponse,
+    EventResponse,
+    EventStatistics,
+    EventUpdate,
+)
+from src.schemas.fields import parse_fields, to_partial
+from src.schemas.serialization import model_response
 from src.services.event_service import EventService
 
-router = APIRouter(prefix="/events", tags=["Events"])
+router = APIRouter(prefix="/events", tags=["Events"], route_class=TracedRoute)
 
 
 @router.post("/", response_model=EventResponse, status_code=status.HTTP_201_CREATED)
@@ -21,23 +36,85 @@ def create_event(event: EventCreate, db: Session = Depends(get_db)):
     return service.create_event(event)
 
 
-@router.get("/", response_model=List[EventResponse])
-def get_all_events(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """Obtiene todos los eventos con paginación."""
+@router.get(
+    "/",
+    response_model=List[EventPartialResponse],
+    response_model_exclude_unset=True,
+)
+def get_all_events(
+    skip: int = 0,
+    limit: int = 100,
+    ids: Optional[str] = None,
+    fields: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    """
+    Obtiene todos los eventos con paginación.
+
+    Con `ids=1,2,3` obtiene esos eventos (activos o archivados) en una sola
+    petición, en el orden indicado; `skip` y `limit` se ignoran.
+
+    Con `fields=id,name,date` solo se consultan y retornan esos campos. Sin
+    `fields` se retornan todos excepto `description`.
+    """
+    selected = parse_fields(fields, EVENT_FIELDS, EVENT_LIST_DEFAULT_FIELDS)
+    service = EventService(db)
+    if ids is not None:
+        events = service.get_events_by_ids(_parse_ids(ids))
+    else:
+        events = service.get_all_events(skip, limit, selected)
+    return model_response(
+        List[EventPartialResponse],
+        [to_partial(EventPartialResponse, event, selected) for event in events],
+        exclude_unset=True,
+    )
+
+
+@router.get("/statistics", response_model=List[EventStatistics])
+def get_events_statistics(ids: str, db: Session = Depends(get_db)):
+    """Obtiene las estadísticas de varios eventos (`ids=1,2,3`) en una petición."""
     service = EventService(db)
-    events = service.get_all_events(skip, limit)
-    for event in events:
-        event.available_capacity = service.get_available_capacity(event.id)
-    return events
+    return model_response(
+        List[EventStatistics], service.get_statistics_by_ids(_parse_ids(ids))
+    )
 
 
-@router.get("/{event_id}", response_model=EventResponse)
-def get_event(event_id: int, db: Session = Depends(get_db)):
-    """Obtiene un evento específico por su ID."""
+def _parse_ids(ids: str) -> List[int]:
+    """Convierte una lista de IDs separados por coma"""
+    try:
+        parsed = [int(value) for value in ids.split(",") if value.strip()]
+    except ValueError:
+        raise ValidationException(
+            "ids debe ser una lista de enteros separados por coma"
+        )
+    if not parsed or len(parsed) > settings.LOOKUP_MAX_ITEMS:
+        raise ValidationException(
+            f"ids debe tener entre 1 y {settings.LOOKUP_MAX_ITEMS} elementos"
+        )
+    return parsed
+
+
+@router.get(
+    "/{event_id}",
+    response_model=EventPartialResponse,
+    response_model_exclude_unset=True,
+)
+def get_event(
+    event_id: int, fields: Optional[str] = None, db: Session = Depends(get_db)
+):
+    """
+    Obtiene un evento específico por su ID (incluye eventos archivados).
+
+    Con `fields=id,name,date` solo se consultan y retornan esos campos.
+    """
+    selected = parse_fields(fields, EVENT_FIELDS)
     service = EventService(db)
-    event = service.get_event(event_id)
-    event.available_capacity = service.get_available_capacity(event_id)
-    return event
+    event = service.get_event_detail(event_id, selected if fields else None)
+    return model_response(
+        EventPartialResponse,
+        to_partial(EventPartialResponse, event, selected),
+        exclude_unset=True,
+    )
 
 
 @router.put("/{event_id}", response_model=EventResponse)
@@ -49,13 +126,50 @@ def update_event(event_id: int, event: EventUpdate, db: Session = Depends(get_db
     return updated_event
 
 
-@router.delete("/{event_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_event(event_id: int, db: Session = Depends(get_db)):
-    """Elimina un evento."""
+@router.delete(
+    "/{event_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={status.HTTP_202_ACCEPTED: {"model": EventDeletionStatus}},
+)
+def delete_event(
+    event_id: int,
+    background_tasks: BackgroundTasks,
+    background: bool = False,
+    db: Session = Depends(get_db),
+):
+    """
+    Elimina un evento.
+
+    Con `background=true` responde 202 de inmediato y borra las asistencias
+    por lotes en segundo plano (recomendado para eventos muy grandes).
+    El progreso se consulta en `GET /events/{event_id}/deletion`.
+    """
     service = EventService(db)
+    if background:
+        deletion = service.schedule_event_deletion(event_id)
+        background_tasks.add_task(_delete_event_in_background, db.get_bind(), event_id)
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED, content=deletion.model_dump()
+        )
     service.delete_event(event_id)
 
 
+@router.get("/{event_id}/deletion", response_model=EventDeletionStatus)
+def get_event_deletion_status(event_id: int, db: Session = Depends(get_db)):
+    """Consulta el estado de la eliminación en segundo plano de un evento."""
+    service = EventService(db)
+    return service.get_deletion_status(event_id)
+
+
+def _delete_event_in_background(bind, event_id: int):
+    """Tarea en segundo plano: usa su propia sesión, la de la petición ya cerró."""
+    db = SessionLocal(bind=bind)
+    try:
+        EventService(db).delete_event_in_batches(event_id)
+    finally:
+        db.close()
+
+
 @router.get("/{event_id}/statistics", response_model=EventStatistics)
 def get_event_statistics(event_id: int, db: Session = Depends(get_db)):
     """
@@ -83,3 +197,12 @@ def get_event_statistics(event_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=e.status_code, detail=e.message)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error interno: {str(e)}")
+
+
+@router.get(
+    "/{event_id}/statistics/daily", response_model=List[EventDailyRegistrations]
+)
+def get_event_daily_registrations(event_id: int, db: Session = Depends(get_db)):
+    """Obtiene los registros netos por día de un evento."""
+    service = EventService(db)
+    return service.get_daily_registrations(event_id)
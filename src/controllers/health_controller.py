@@ -1,12 +1,19 @@
 """
 Controller para endpoints de Health Check
+
+- /health/live: el proceso responde (sin I/O), para la sonda de liveness
+- /health/ready: dependencias verificadas en segundo plano, para readiness
+- /health/detailed: detalle de dependencias, pool y arranque
+
+Ninguno hace I/O por petición: /ready y /detailed sirven la última
+instantánea del monitor de dependencias (src.observability.health).
 """
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, status
+from fastapi.responses import ORJSONResponse
 
-from src.cache.redis_client import cache
 from src.config.setting import settings
-from src.database.connection import get_db
+from src.observability.health import health_monitor
+from src.observability.startup import startup
 
 router = APIRouter(prefix="/health", tags=["Health"])
 
@@ -22,32 +29,45 @@ def health_check():
     }
 
 
+@router.get("/live", status_code=status.HTTP_200_OK)
+async def liveness():
+    """Sonda de liveness: el proceso atiende peticiones. No hace I/O."""
+    return {"status": "alive"}
+
+
+@router.get(
+    "/ready",
+    status_code=status.HTTP_200_OK,
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"description": "No listo"}},
+)
+async def readiness():
+    """
+    Sonda de readiness: 200 si la instancia puede recibir tráfico, 503 si no.
+
+    Sirve la última verificación del monitor de dependencias
+    (cada HEALTH_CHECK_INTERVAL segundos) sin consultar la base de datos
+    ni Redis en la petición.
+    """
+    readiness = health_monitor.readiness()
+    return ORJSONResponse(
+        readiness,
+        status_code=(
+            status.HTTP_200_OK
+            if readiness["ready"]
+            else status.HTTP_503_SERVICE_UNAVAILABLE
+        ),
+    )
+
+
 @router.get("/detailed", status_code=status.HTTP_200_OK)
-def detailed_health_check(db: Session = Depends(get_db)):
-    """Verifica estado de API, base de datos y Redis."""
-    health_status = {
-        "status": "healthy",
+async def detailed_health_check():
+    """Estado de API, base de datos, Redis, pool de conexiones y arranque."""
+    snapshot = health_monitor.snapshot or {"status": "starting", "checks": {}}
+    return {
         "service": settings.APP_NAME,
         "version": settings.APP_VERSION,
         "environment": settings.APP_ENV,
-        "checks": {},
+        **snapshot,
+        "stale": health_monitor.snapshot is not None and health_monitor.is_stale(),
+        "startup": startup.snapshot(),
     }
-
-    try:
-        db.execute("SELECT 1")
-        health_status["checks"]["database"] = "healthy"
-    except Exception as e:
-        health_status["checks"]["database"] = f"unhealthy: {str(e)}"
-        health_status["status"] = "unhealthy"
-
-    try:
-        if cache.ping():
-            health_status["checks"]["redis"] = "healthy"
-        else:
-            health_status["checks"]["redis"] = "unhealthy: no response"
-            health_status["status"] = "degraded"
-    except Exception as e:
-        health_status["checks"]["redis"] = f"unhealthy: {str(e)}"
-        health_status["status"] = "degraded"
-
-    return health_status
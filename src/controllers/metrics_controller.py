@@ -0,0 +1,16 @@
+"""
+Controller para el endpoint de métricas (formato Prometheus)
+"""
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from src.observability.metrics import render_metrics
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics():
+    """Métricas de peticiones, base de datos y caché para Prometheus."""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
@@ -1,20 +1,41 @@
 """
 Controller para endpoints de Participantes
 """
-from typing import List
+from typing import List, Literal, Optional
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from src.database.connection import get_db
+from src.observability.tracing import TracedRoute
+from src.schemas.fields import parse_fields, to_partial
 from src.schemas.participant import (
+    PARTICIPANT_FIELDS,
     ParticipantCreate,
+    ParticipantImportSummary,
+    ParticipantLookup,
+    ParticipantLookupResponse,
+    ParticipantPartialResponse,
     ParticipantResponse,
     ParticipantUpdate,
 )
+from src.schemas.serialization import model_response
+from src.services.export_service import (
+    MEDIA_TYPES,
+    ExportFormat,
+    export_filename,
+    stream_with_own_session,
+)
+from src.services.participant_import_service import (
+    ParticipantImportService,
+    detect_format,
+)
 from src.services.participant_service import ParticipantService
 
-router = APIRouter(prefix="/participants", tags=["Participants"])
+router = APIRouter(
+    prefix="/participants", tags=["Participants"], route_class=TracedRoute
+)
 
 
 @router.post(
@@ -26,20 +47,108 @@ def create_participant(participant: ParticipantCreate, db: Session = Depends(get
     return service.create_participant(participant)
 
 
-@router.get("/", response_model=List[ParticipantResponse])
+@router.post("/import", response_model=ParticipantImportSummary)
+async def import_participants(
+    request: Request,
+    format: Optional[Literal["csv", "ndjson"]] = None,
+    on_duplicate: Literal["skip", "update"] = "skip",
+    db: Session = Depends(get_db),
+):
+    """
+    Importa participantes desde un cuerpo CSV o NDJSON procesado en streaming.
+
+    **Parámetros:**
+    - **format**: `csv` o `ndjson`; por defecto se deduce del Content-Type
+    - **on_duplicate**: `skip` omite emails existentes, `update` los actualiza
+
+    El CSV debe tener encabezado con las columnas `name`, `email` y
+    opcionalmente `phone`. Retorna un resumen con los errores por línea.
+    """
+    service = ParticipantImportService(db)
+    return await service.import_stream(
+        request.stream(),
+        format or detect_format(request.headers.get("content-type")),
+        on_duplicate,
+    )
+
+
+@router.post("/lookup", response_model=ParticipantLookupResponse)
+def lookup_participants(lookup: ParticipantLookup, db: Session = Depends(get_db)):
+    """Busca varios participantes por IDs y/o emails en una sola petición."""
+    service = ParticipantService(db)
+    return model_response(
+        ParticipantLookupResponse, service.lookup_participants(lookup)
+    )
+
+
+@router.get(
+    "/",
+    response_model=List[ParticipantPartialResponse],
+    response_model_exclude_unset=True,
+)
 def get_all_participants(
-    skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
+    skip: int = 0,
+    limit: int = 100,
+    fields: Optional[str] = None,
+    db: Session = Depends(get_db),
 ):
-    """Obtiene todos los participantes con paginación."""
+    """
+    Obtiene todos los participantes con paginación.
+
+    Con `fields=id,name,email` solo se consultan y retornan esos campos.
+    """
+    selected = parse_fields(fields, PARTICIPANT_FIELDS)
     service = ParticipantService(db)
-    return service.get_all_participants(skip, limit)
+    participants = service.get_all_participants(
+        skip, limit, selected if fields else None
+    )
+    return model_response(
+        List[ParticipantPartialResponse],
+        [to_partial(ParticipantPartialResponse, p, selected) for p in participants],
+        exclude_unset=True,
+    )
+
+
+@router.get("/export")
+def export_participants(
+    format: ExportFormat = "csv", gzip: bool = False, db: Session = Depends(get_db)
+):
+    """
+    Descarga todos los participantes en CSV o NDJSON, en streaming.
+
+    Con `gzip=true` el archivo se envía comprimido (.gz).
+    """
+    filename = export_filename("participants", format, gzip)
+    return StreamingResponse(
+        stream_with_own_session(
+            db.get_bind(), lambda export: export.stream_participants(format, gzip)
+        ),
+        media_type="application/gzip" if gzip else MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
 
+@router.get(
+    "/{participant_id}",
+    response_model=ParticipantPartialResponse,
+    response_model_exclude_unset=True,
+)
+def get_participant(
+    participant_id: int, fields: Optional[str] = None, db: Session = Depends(get_db)
+):
+    """
+    Obtiene un participante específico por su ID.
 
-@router.get("/{participant_id}", response_model=ParticipantResponse)
-def get_participant(participant_id: int, db: Session = Depends(get_db)):
-    """Obtiene un participante específico por su ID."""
+    Con `fields=id,name,email` solo se consultan y retornan esos campos.
+    """
+    selected = parse_fields(fields, PARTICIPANT_FIELDS)
     service = ParticipantService(db)
-    return service.get_participant(participant_id)
+    participant = service.get_participant(participant_id, selected if fields else None)
+    return model_response(
+        ParticipantPartialResponse,
+        to_partial(ParticipantPartialResponse, participant, selected),
+        exclude_unset=True,
+    )
 
 
 @router.put("/{participant_id}", response_model=ParticipantResponse)
@@ -1,6 +1,23 @@
 """
 Configuración de base de datos
 """
-from .connection import Base, SessionLocal, engine, get_db, init_db
+from .connection import Base, SessionLocal, get_db, get_engine, init_db
+from .dialect import insert_ignore, is_unique_violation, upsert
 
-__all__ = ["Base", "engine", "SessionLocal", "get_db", "init_db"]
+__all__ = [
+    "Base",
+    "get_engine",
+    "SessionLocal",
+    "get_db",
+    "init_db",
+    "insert_ignore",
+    "is_unique_violation",
+    "upsert",
+]
+
+
+def __getattr__(name: str):
+    """`src.database.engine` se crea al accederlo (ver get_engine)"""
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
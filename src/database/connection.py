@@ -1,32 +1,89 @@
-from typing import Generator
+import threading
+from typing import Generator, Optional
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.config.setting import settings
+from src.database import instrumentation  # noqa: F401  (registra los eventos)
+from src.observability.startup import startup
+
+_engine: Optional[Engine] = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> Engine:
+    """
+    Motor de base de datos, creado en el primer uso.
+
+    Crearlo importa el driver (pymysql) y prepara el pool de conexiones;
+    diferirlo acelera la importación de la aplicación y de los comandos
+    que no usan la base de datos.
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = create_engine(
+                    settings.DATABASE_URL,
+                    echo=settings.DB_ECHO,
+                    pool_pre_ping=True,
+                    pool_size=10,
+                    max_overflow=20,
+                )
+    return _engine
+
+
+def __getattr__(name: str):
+    """Compatibilidad: `connection.engine` crea el motor al accederlo"""
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _LazySessionmaker(sessionmaker):
+    """sessionmaker que usa get_engine() si no se indica otro bind"""
+
+    def __call__(self, **local_kw) -> Session:
+        if local_kw.get("bind") is None and self.kw.get("bind") is None:
+            local_kw["bind"] = get_engine()
+        return super().__call__(**local_kw)
 
-# Motor de base de datos
-engine = create_engine(
-    settings.DATABASE_URL,
-    echo=settings.DB_ECHO,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-)
 
 # Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: los valores por defecto de Python (created_at,
+# registered_at...) ya quedan en el objeto tras el flush, así que no hace
+# falta un refresh (SELECT adicional) después de cada commit.
+SessionLocal = _LazySessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False
+)
 
 # Base para los modelos
 Base = declarative_base()
 
 
+@event.listens_for(Engine, "connect")
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    """
+    Activa las claves foráneas en SQLite (desactivadas por defecto) para que
+    ON DELETE CASCADE se comporte igual que en MySQL.
+    """
+    if type(dbapi_connection).__module__.startswith("sqlite3"):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     Generador de sesiones de base de datos.
     Se usa como dependencia en FastAPI.
     """
+    # Si la inicialización de la BD sigue en curso (arranque en segundo
+    # plano), la petición la espera en lugar de fallar
+    startup.wait("init_db", timeout=settings.STARTUP_DB_WAIT_TIMEOUT)
     db = SessionLocal()
     try:
         yield db
@@ -38,4 +95,4 @@ def init_db():
     """
     Inicializa la base de datos creando todas las tablas.
     """
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
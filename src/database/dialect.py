@@ -0,0 +1,150 @@
+"""
+Utilidades dependientes del dialecto de base de datos.
+
+Permiten que los servicios confíen en las restricciones de la BD
+(UNIQUE, FOREIGN KEY) sin acoplarse a MySQL o SQLite.
+"""
+import importlib
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+# Códigos de error de MySQL para entradas duplicadas
+# 1062: ER_DUP_ENTRY, 1586: ER_DUP_ENTRY_WITH_KEY_NAME
+MYSQL_DUPLICATE_ENTRY_CODES = {1062, 1586}
+
+# Código SQLSTATE de PostgreSQL para unique_violation
+POSTGRES_UNIQUE_VIOLATION = "23505"
+
+
+def is_unique_violation(error: IntegrityError) -> bool:
+    """
+    Indica si un IntegrityError fue causado por una restricción de unicidad.
+
+    Funciona con MySQL (pymysql), SQLite y PostgreSQL. Otros errores de
+    integridad (NOT NULL, FOREIGN KEY) retornan False para que el llamador
+    los propague en lugar de traducirlos a un conflicto 409.
+
+    Args:
+        error: Excepción lanzada por SQLAlchemy al hacer flush/commit
+
+    Returns:
+        True si la causa es una clave duplicada
+    """
+    orig = getattr(error, "orig", None)
+    if orig is None:
+        return False
+
+    # MySQL: args = (código, mensaje)
+    args = getattr(orig, "args", ())
+    if args and isinstance(args[0], int):
+        return args[0] in MYSQL_DUPLICATE_ENTRY_CODES
+
+    # PostgreSQL: pgcode / sqlstate
+    sqlstate = getattr(orig, "pgcode", None) or getattr(orig, "sqlstate", None)
+    if sqlstate:
+        return sqlstate == POSTGRES_UNIQUE_VIOLATION
+
+    # SQLite: sqlite_errorname (Python 3.11+) o el texto del mensaje
+    error_name = getattr(orig, "sqlite_errorname", None)
+    if error_name:
+        return error_name in (
+            "SQLITE_CONSTRAINT_UNIQUE",
+            "SQLITE_CONSTRAINT_PRIMARYKEY",
+        )
+    return "UNIQUE constraint failed" in str(orig)
+
+
+def _dialect_insert(dialect: str, model):
+    """
+    INSERT específico del dialecto (con ON CONFLICT / ON DUPLICATE KEY).
+
+    El módulo del dialecto se importa al primer uso: solo se carga el de
+    la base de datos en uso y no el de los tres al importar la aplicación.
+    """
+    return importlib.import_module(f"sqlalchemy.dialects.{dialect}").insert(model)
+
+
+def upsert(
+    db: Session,
+    model,
+    rows: List[Dict[str, Any]],
+    conflict_columns: Sequence[str],
+    update_values: Callable[[Any], Dict[str, Any]],
+) -> None:
+    """
+    Inserta filas y, si la clave ya existe, las actualiza en el mismo comando.
+
+    Usa INSERT ... ON DUPLICATE KEY UPDATE en MySQL e
+    INSERT ... ON CONFLICT DO UPDATE en SQLite y PostgreSQL.
+
+    Args:
+        db: Sesión de base de datos
+        model: Modelo ORM destino
+        rows: Filas a insertar (una sola sentencia multi-fila)
+        conflict_columns: Columnas de la clave única (SQLite/PostgreSQL)
+        update_values: Función que recibe los valores propuestos
+            (`inserted` en MySQL, `excluded` en SQLite/PostgreSQL) y
+            retorna el diccionario columna -> expresión a actualizar
+
+    Ejemplo:
+        upsert(db, Contador, rows, ["clave"],
+               lambda new: {"total": Contador.total + new.total})
+    """
+    if not rows:
+        return
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        stmt = _dialect_insert(dialect, model).values(rows)
+        stmt = stmt.on_duplicate_key_update(**update_values(stmt.inserted))
+    elif dialect in ("sqlite", "postgresql"):
+        stmt = _dialect_insert(dialect, model).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(conflict_columns), set_=update_values(stmt.excluded)
+        )
+    else:
+        raise NotImplementedError(f"upsert no soportado para el dialecto {dialect}")
+    db.execute(stmt)
+
+
+def insert_ignore(
+    db: Session,
+    model,
+    rows: List[Dict[str, Any]],
+    conflict_columns: Sequence[str],
+) -> Optional[int]:
+    """
+    Inserta filas omitiendo las que violan la clave única indicada.
+
+    Usa INSERT ... ON CONFLICT DO NOTHING en SQLite y PostgreSQL. En MySQL
+    usa ON DUPLICATE KEY UPDATE sin cambios en lugar de INSERT IGNORE, que
+    también silenciaría errores distintos a la clave duplicada.
+
+    Args:
+        db: Sesión de base de datos
+        model: Modelo ORM destino
+        rows: Filas a insertar (una sola sentencia multi-fila)
+        conflict_columns: Columnas de la clave única
+
+    Returns:
+        Número de filas insertadas, o None en MySQL: con CLIENT_FOUND_ROWS
+        (activo por defecto en SQLAlchemy) una fila duplicada también cuenta
+        como afectada
+    """
+    if not rows:
+        return 0
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        column = conflict_columns[0]
+        stmt = _dialect_insert(dialect, model).values(rows)
+        stmt = stmt.on_duplicate_key_update(**{column: getattr(model, column)})
+    elif dialect in ("sqlite", "postgresql"):
+        stmt = _dialect_insert(dialect, model).values(rows)
+        stmt = stmt.on_conflict_do_nothing(index_elements=list(conflict_columns))
+    else:
+        raise NotImplementedError(
+            f"insert_ignore no soportado para el dialecto {dialect}"
+        )
+    result = db.execute(stmt)
+    return None if dialect == "mysql" else result.rowcount
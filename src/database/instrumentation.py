@@ -0,0 +1,85 @@
+"""
+Instrumentación de consultas SQL.
+
+Mide cada sentencia ejecutada por cualquier Engine (eventos
+before/after_cursor_execute de SQLAlchemy) y la notifica a los
+observadores registrados, p. ej. las métricas de Prometheus.
+
+Uso:
+    from src.database.instrumentation import add_query_observer
+
+    add_query_observer(lambda query: print(query.operation, query.duration))
+"""
+import time
+from typing import Any, Callable, List, NamedTuple, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE"}
+
+
+class QueryEvent(NamedTuple):
+    """Una sentencia ejecutada"""
+
+    statement: str
+    parameters: Any
+    duration: float
+    error: Optional[BaseException] = None
+
+    @property
+    def operation(self) -> str:
+        """SELECT, INSERT, UPDATE, DELETE u OTHER (para etiquetas de métricas)"""
+        keyword = self.statement.lstrip().split(None, 1)[0].upper()
+        return keyword if keyword in OPERATIONS else "OTHER"
+
+
+QueryObserver = Callable[[QueryEvent], None]
+
+_observers: List[QueryObserver] = []
+
+
+def add_query_observer(observer: QueryObserver) -> None:
+    """Registra un observador de consultas (una sola vez)"""
+    if observer not in _observers:
+        _observers.append(observer)
+
+
+def remove_query_observer(observer: QueryObserver) -> None:
+    """Elimina un observador registrado"""
+    if observer in _observers:
+        _observers.remove(observer)
+
+
+def _notify(query: QueryEvent) -> None:
+    for observer in list(_observers):
+        observer(query)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_started_at"].pop()
+    if _observers:
+        _notify(QueryEvent(statement, parameters, time.perf_counter() - started))
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(context):
+    conn = context.connection
+    if conn is None or not conn.info.get("query_started_at"):
+        return
+    started = conn.info["query_started_at"].pop()
+    if _observers and context.statement:
+        _notify(
+            QueryEvent(
+                context.statement,
+                context.parameters,
+                time.perf_counter() - started,
+                context.original_exception,
+            )
+        )
@@ -8,31 +8,56 @@ Autor: [Tu nombre]
 Versión: 1.0.0
 """
 import logging
+import time
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from src.config.setting import settings
 from src.controllers import (
     attendance_controller,
+    diagnostics_controller,
     event_controller,
     health_controller,
+    metrics_controller,
     participant_controller,
 )
 from src.database.connection import init_db
 from src.exceptions.custom_exceptions import EventiaException
+from src.middleware.compression import CompressionMiddleware
 from src.middleware.error_handler import (
     eventia_exception_handler,
     general_exception_handler,
 )
+from src.middleware.request_id import RequestIdMiddleware
+from src.observability.capture import (
+    Scrubber,
+    TrafficCaptureMiddleware,
+    TrafficRecorder,
+)
+from src.observability.health import health_monitor
+from src.observability.logs import configure_logging
+from src.observability.metrics import MetricsMiddleware, install_observers
+from src.observability.profiling import ProfilingMiddleware
+from src.observability.queries import QueryDiagnosticsMiddleware
+from src.observability.queries import install_observers as install_query_log
+from src.observability.startup import startup
+from src.observability.tracing import TracingMiddleware, create_exporter
+from src.observability.tracing import install_observers as install_tracing
+
+# Tiempo de importación de la aplicación (FastAPI, controllers, servicios,
+# modelos). El detalle por módulo: python -m src.commands.profile_startup
+startup.record("imports", time.perf_counter() - startup.started_at)
 
 # ============================================
 # CONFIGURACIÓN DE LOGGING
 # ============================================
-logging.basicConfig(
+# JSON por un QueueHandler: el formateo y la escritura ocurren en otro hilo
+configure_logging(
     level=settings.LOG_LEVEL,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
+    json_format=settings.LOG_FORMAT == "json",
+    queue_size=settings.LOG_QUEUE_SIZE,
 )
 
 logger = logging.getLogger(__name__)
@@ -79,6 +104,8 @@ app = FastAPI(
     license_info={
         "name": "MIT",
     },
+    # orjson serializa más rápido que json de la librería estándar
+    default_response_class=ORJSONResponse,
 )
 
 # ============================================
@@ -92,6 +119,86 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ============================================
+# CONFIGURAR COMPRESIÓN
+# ============================================
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        content_types=settings.COMPRESSION_CONTENT_TYPES,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        cache_max_bytes=settings.COMPRESSION_CACHE_MAX_BYTES,
+    )
+
+# ============================================
+# CONFIGURAR PERFILADO BAJO DEMANDA
+# ============================================
+if settings.PROFILING_ENABLED and settings.DIAGNOSTICS_TOKEN:
+    # Interno a las trazas y métricas: el perfil no incluye su medición
+    app.add_middleware(
+        ProfilingMiddleware,
+        token=settings.DIAGNOSTICS_TOKEN,
+        store=diagnostics_controller.profile_store,
+        sample_interval=settings.PROFILING_SAMPLE_INTERVAL_MS / 1000,
+    )
+
+# ============================================
+# CONFIGURAR DIAGNÓSTICO DE CONSULTAS
+# ============================================
+app.add_middleware(
+    QueryDiagnosticsMiddleware,
+    expose_headers=settings.APP_ENV != "production",
+    n_plus_one_threshold=settings.N_PLUS_ONE_THRESHOLD,
+)
+install_query_log(settings.SLOW_QUERY_THRESHOLD_MS)
+
+# ============================================
+# CONFIGURAR CAPTURA DE TRÁFICO
+# ============================================
+if settings.TRAFFIC_CAPTURE_ENABLED:
+    app.add_middleware(
+        TrafficCaptureMiddleware,
+        recorder=TrafficRecorder(
+            settings.TRAFFIC_CAPTURE_PATH,
+            Scrubber(settings.TRAFFIC_CAPTURE_HASH_KEY),
+            max_file_bytes=settings.TRAFFIC_CAPTURE_MAX_FILE_MB * 1024 * 1024,
+        ),
+        sample_rate=settings.TRAFFIC_CAPTURE_SAMPLE_RATE,
+        max_body_bytes=settings.TRAFFIC_CAPTURE_MAX_BODY_BYTES,
+    )
+
+# ============================================
+# CONFIGURAR TRAZAS
+# ============================================
+if settings.TRACING_ENABLED:
+    # Fuera de la compresión, para que `total` en Server-Timing la incluya.
+    # Como X-Query-Count, el encabezado no se expone en producción
+    app.add_middleware(
+        TracingMiddleware,
+        server_timing=settings.APP_ENV != "production",
+        sample_rate=settings.TRACING_SAMPLE_RATE,
+        exporter=create_exporter(
+            settings.TRACING_EXPORTER, settings.TRACING_EXPORT_PATH, settings.APP_NAME
+        ),
+    )
+    install_tracing()
+
+# ============================================
+# CONFIGURAR MÉTRICAS
+# ============================================
+if settings.METRICS_ENABLED:
+    # Se agrega después de la compresión para medir también su tiempo
+    app.add_middleware(MetricsMiddleware)
+    install_observers()
+
+# ============================================
+# CONFIGURAR ID DE PETICIÓN
+# ============================================
+# El más externo: todos los logs de la petición llevan su request_id
+app.add_middleware(RequestIdMiddleware)
+
 # ============================================
 # REGISTRAR EXCEPTION HANDLERS
 # ============================================
@@ -116,6 +223,12 @@ app.include_router(participant_controller.router, tags=["Participants"])
 
 app.include_router(attendance_controller.router, tags=["Attendances"])
 
+if settings.METRICS_ENABLED:
+    app.include_router(metrics_controller.router)
+
+if settings.DIAGNOSTICS_TOKEN:
+    app.include_router(diagnostics_controller.router)
+
 
 # ============================================
 # EVENTOS DEL CICLO DE VIDA
@@ -127,9 +240,11 @@ async def startup_event():
 
     Tareas realizadas:
     1. Logging de inicio
-    2. Inicialización de base de datos (crear tablas)
+    2. Inicialización de base de datos (crear tablas), en segundo plano
+       salvo que STARTUP_INIT_DB_IN_BACKGROUND sea False
     3. Verificación de configuración
 
+    Cada paso queda medido en el perfil de arranque (`/health/detailed`).
     Este evento se ejecuta UNA VEZ al levantar el servidor.
     """
     logger.info("=" * 60)
@@ -138,14 +253,23 @@ async def startup_event():
     logger.info(f"🔧 Debug Mode: {settings.DEBUG}")
     logger.info("=" * 60)
 
-    # Inicializar base de datos
-    try:
+    # Inicializar base de datos: no bloquea el primer health check; las
+    # peticiones que usan la BD esperan a que termine (ver get_db)
+    if settings.STARTUP_INIT_DB_IN_BACKGROUND:
+        logger.info("🗄️  Inicializando base de datos en segundo plano...")
+        startup.run_in_background("init_db", init_db)
+        # Si falla (p. ej. la BD aún no acepta conexiones), el monitor de
+        # dependencias lo reintenta hasta que la instancia quede lista
+        health_monitor.retry_startup_step("init_db", init_db)
+    else:
         logger.info("🗄️  Inicializando base de datos...")
-        init_db()
-        logger.info("✅ Base de datos inicializada correctamente")
-    except Exception as e:
-        logger.error(f"❌ Error al inicializar base de datos: {e}")
-        raise
+        try:
+            with startup.step("init_db"):
+                init_db()
+            logger.info("✅ Base de datos inicializada correctamente")
+        except Exception as e:
+            logger.error(f"❌ Error al inicializar base de datos: {e}")
+            raise
 
     # Verificar configuración
     logger.info("⚙️  Verificando configuración...")
@@ -155,6 +279,10 @@ async def startup_event():
     logger.info(f"   - Redis: {settings.REDIS_HOST}:{settings.REDIS_PORT}")
     logger.info(f"   - CORS Origins: {len(settings.CORS_ORIGINS)} configurados")
 
+    # Verificación periódica de dependencias para /health/ready
+    health_monitor.start()
+
+    startup.mark_ready()
     logger.info("=" * 60)
     logger.info(f"✨ {settings.APP_NAME} iniciado exitosamente")
     logger.info(f"📚 Documentación: http://{settings.HOST}:{settings.PORT}/docs")
@@ -172,6 +300,7 @@ async def shutdown_event():
 
     Este evento se ejecuta cuando se detiene el servidor (Ctrl+C).
     """
+    await health_monitor.stop()
     logger.info("=" * 60)
     logger.info(f"🛑 Cerrando {settings.APP_NAME}...")
     logger.info("👋 Aplicación detenida correctamente")
@@ -311,5 +440,7 @@ ACCEDER A LA DOCUMENTACIÓN:
 HEALTH CHECKS:
 --------------
 - Básico: http://localhost:8000/health
+- Liveness: http://localhost:8000/health/live
+- Readiness: http://localhost:8000/health/ready
 - Detallado: http://localhost:8000/health/detailed
 """
@@ -1,6 +1,13 @@
 """
 Middlewares de la aplicación
 """
+from .compression import CompressionMiddleware
 from .error_handler import eventia_exception_handler, general_exception_handler
+from .request_id import RequestIdMiddleware
 
-__all__ = ["eventia_exception_handler", "general_exception_handler"]
+__all__ = [
+    "CompressionMiddleware",
+    "eventia_exception_handler",
+    "general_exception_handler",
+    "RequestIdMiddleware",
+]
@@ -0,0 +1,261 @@
+"""
+Middleware de compresión de respuestas (gzip y, si está instalado, brotli).
+
+Comprime solo respuestas con un Content-Type de la lista permitida y de
+al menos COMPRESSION_MINIMUM_SIZE bytes; el resto pasa sin cambios. Las
+respuestas que ya traen Content-Encoding (o que son archivos .gz, como
+las exportaciones con gzip=true) no se vuelven a comprimir.
+
+Las respuestas completas se comprimen una sola vez por contenido: los
+bytes comprimidos se guardan en un caché LRU en memoria indexado por el
+hash del cuerpo. Las respuestas calientes (las que se arman desde Redis
+y devuelven siempre el mismo cuerpo hasta que se invalida) solo pagan el
+hash en cada petición. Las respuestas en streaming se comprimen por bloque.
+"""
+import gzip
+import hashlib
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli es opcional: sin él solo se ofrece gzip
+    brotli = None
+
+
+def supported_encodings() -> List[str]:
+    """Codificaciones disponibles, en orden de preferencia"""
+    return (["br"] if brotli is not None else []) + ["gzip"]
+
+
+def negotiate_encoding(accept_encoding: str, available: Iterable[str]) -> Optional[str]:
+    """
+    Elige la codificación a partir del encabezado Accept-Encoding.
+
+    Respeta los valores q (q=0 excluye la codificación) y, a igual q,
+    el orden de preferencia de `available`.
+    """
+    weights = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name:
+            weights[name.strip()] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in available:
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class CompressedBodyCache:
+    """
+    Caché LRU de cuerpos comprimidos, limitado por tamaño total en bytes.
+
+    La clave es (codificación, hash del cuerpo sin comprimir), de modo que
+    una entrada nunca queda desactualizada: si el cuerpo cambia, cambia
+    la clave y la entrada vieja termina desalojada.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: "OrderedDict[Tuple[str, bytes], bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compress(
+        self, encoding: str, body: bytes, compress: Callable[[bytes], bytes]
+    ) -> bytes:
+        """Retorna el cuerpo comprimido, comprimiéndolo solo si no está en caché"""
+        if self.max_bytes <= 0:
+            return compress(body)
+        key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                return cached
+
+        compressed = compress(body)
+        if len(compressed) <= self.max_bytes:
+            with self._lock:
+                if key not in self._entries:
+                    self._entries[key] = compressed
+                    self.size += len(compressed)
+                    while self.size > self.max_bytes:
+                        _, evicted = self._entries.popitem(last=False)
+                        self.size -= len(evicted)
+        return compressed
+
+    def clear(self) -> None:
+        """Vacía el caché"""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+class CompressionMiddleware:
+    """
+    Middleware ASGI que comprime respuestas según Accept-Encoding.
+
+    Args:
+        app: Aplicación ASGI
+        minimum_size: Tamaño mínimo del cuerpo (bytes) para comprimir
+        content_types: Tipos de contenido comprimibles (sin parámetros)
+        gzip_level: Nivel de compresión gzip (1-9)
+        brotli_quality: Calidad de brotli (0-11)
+        cache_max_bytes: Tamaño máximo del caché de cuerpos comprimidos
+            (0 lo desactiva)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        content_types: Iterable[str] = ("application/json",),
+        gzip_level: int = 6,
+        brotli_quality: int = 5,
+        cache_max_bytes: int = 0,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.content_types = {content_type.lower() for content_type in content_types}
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.cache = CompressedBodyCache(cache_max_bytes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), supported_encodings()
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def compress(self, encoding: str, body: bytes) -> bytes:
+        """Comprime un cuerpo completo"""
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+
+    def compressor(self, encoding: str) -> Callable[[bytes, bool], bytes]:
+        """
+        Compresor incremental para respuestas en streaming.
+
+        Cada bloque se vacía (flush) para que el cliente lo reciba sin
+        esperar al siguiente.
+        """
+        if encoding == "br":
+            stream = brotli.Compressor(quality=self.brotli_quality)
+            return lambda data, last: (
+                stream.process(data) + (stream.finish() if last else stream.flush())
+            )
+        stream = zlib.compressobj(self.gzip_level, wbits=31)
+        return lambda data, last: stream.compress(data) + stream.flush(
+            zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH
+        )
+
+    def should_compress(self, headers: Headers) -> bool:
+        """Decide según los encabezados de la respuesta"""
+        if "content-encoding" in headers or "content-range" in headers:
+            return False
+        content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        return content_type in self.content_types
+
+
+class _CompressionResponder:
+    """Intercepta los mensajes de una respuesta y la comprime si corresponde"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.upstream = send
+        self.start: Optional[Message] = None
+        self.compress_chunk: Optional[Callable[[bytes, bool], bytes]] = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if self.passthrough:
+            await self.upstream(message)
+            return
+
+        if message["type"] == "http.response.start":
+            self.start = message
+            if not self.middleware.should_compress(Headers(raw=message["headers"])):
+                await self._pass_through(message)
+            return
+
+        if message["type"] != "http.response.body":
+            await self.upstream(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compress_chunk is None:
+            if not more_body:
+                await self._send_complete(body)
+                return
+            # Streaming: se comprime por bloque
+            headers = MutableHeaders(raw=self.start["headers"])
+            self._set_encoding_headers(headers)
+            del headers["content-length"]
+            self.compress_chunk = self.middleware.compressor(self.encoding)
+            await self.upstream(self.start)
+
+        await self.upstream(
+            {
+                "type": "http.response.body",
+                "body": self.compress_chunk(body, not more_body),
+                "more_body": more_body,
+            }
+        )
+
+    async def _send_complete(self, body: bytes) -> None:
+        """Respuesta completa en un solo mensaje"""
+        if len(body) < self.middleware.minimum_size:
+            await self._pass_through(self.start)
+            await self.upstream({"type": "http.response.body", "body": body})
+            return
+
+        compressed = self.middleware.cache.get_or_compress(
+            self.encoding,
+            body,
+            lambda data: self.middleware.compress(self.encoding, data),
+        )
+        headers = MutableHeaders(raw=self.start["headers"])
+        self._set_encoding_headers(headers)
+        headers["content-length"] = str(len(compressed))
+        await self.upstream(self.start)
+        await self.upstream({"type": "http.response.body", "body": compressed})
+
+    async def _pass_through(self, start: Message) -> None:
+        """Envía la respuesta sin comprimir"""
+        self.passthrough = True
+        headers = MutableHeaders(raw=start["headers"])
+        if self.middleware.should_compress(headers):
+            headers.add_vary_header("Accept-Encoding")
+        await self.upstream(start)
+
+    def _set_encoding_headers(self, headers: MutableHeaders) -> None:
+        headers["content-encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
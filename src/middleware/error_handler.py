@@ -9,11 +9,19 @@ import logging
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 
+from src.config.setting import settings
 from src.exceptions.custom_exceptions import EventiaException
+from src.observability.logs import LogRateLimiter
 
 # Configurar logger
 logger = logging.getLogger(__name__)
 
+# Los errores de negocio pueden llegar por miles (p. ej. 409 durante una
+# avalancha de registros): se limitan por tipo de excepción y ruta
+business_log_limiter = LogRateLimiter(
+    limit=settings.LOG_BUSINESS_EXCEPTIONS_PER_MINUTE, window=60.0
+)
+
 
 async def eventia_exception_handler(
     request: Request, exc: EventiaException
@@ -46,11 +54,25 @@ async def eventia_exception_handler(
         En main.py:
         app.add_exception_handler(EventiaException, eventia_exception_handler)
     """
-    # Log del error (nivel WARNING porque son errores esperados de negocio)
-    logger.warning(
-        f"EventiaException: {exc.__class__.__name__} - {exc.message} "
-        f"(Path: {request.url.path}, Method: {request.method})"
-    )
+    # Log del error (nivel WARNING porque son errores esperados de negocio),
+    # limitado por tipo y ruta; el siguiente registro informa los omitidos
+    error = exc.__class__.__name__
+    route = getattr(request.scope.get("route"), "path", request.url.path)
+    if logger.isEnabledFor(logging.WARNING):
+        allowed, suppressed = business_log_limiter.allow((error, route))
+        if allowed:
+            logger.warning(
+                "EventiaException: %s - %s",
+                error,
+                exc.message,
+                extra={
+                    "error": error,
+                    "path": request.url.path,
+                    "method": request.method,
+                    "status_code": exc.status_code,
+                    "suppressed": suppressed,
+                },
+            )
 
     return JSONResponse(
         status_code=exc.status_code,
@@ -98,9 +120,11 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
     """
     # Log completo del error con stack trace (nivel ERROR)
     logger.error(
-        f"Unhandled exception: {exc.__class__.__name__} - {str(exc)} "
-        f"(Path: {request.url.path}, Method: {request.method})",
+        "Unhandled exception: %s - %s",
+        exc.__class__.__name__,
+        exc,
         exc_info=True,  # Incluye el stack trace completo
+        extra={"path": request.url.path, "method": request.method},
     )
 
     # En desarrollo, incluir más detalles
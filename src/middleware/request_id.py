@@ -0,0 +1,49 @@
+"""
+Middleware de ID de petición.
+
+Toma el encabezado `X-Request-ID` del cliente (o del balanceador) si es
+válido, o genera uno nuevo. El ID queda disponible para los logs de la
+petición (ver src.observability.logs) y se retorna en la respuesta.
+"""
+import re
+import uuid
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.observability.logs import request_id_var
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._-]{1,128}$")
+
+
+class RequestIdMiddleware:
+    """Middleware ASGI que asigna un ID a cada petición"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for key, value in scope["headers"]:
+            if key == b"x-request-id":
+                request_id = value.decode("latin-1")
+                break
+        if request_id is None or not _VALID_REQUEST_ID.match(request_id):
+            request_id = uuid.uuid4().hex
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        # Sin reset: cada petición corre en su propia tarea, y así el ID
+        # sigue disponible para el handler de errores 500, que está fuera
+        # de los middlewares
+        request_id_var.set(request_id)
+        await self.app(scope, receive, send_wrapper)
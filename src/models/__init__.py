@@ -1,8 +1,20 @@
 """
 Modelos de base de datos para Eventia Core API
 """
+from .archive import ArchivedAttendance, ArchivedEvent
 from .attendance import Attendance
+from .deletion import EventDeletion
 from .event import Event
 from .participant import Participant
+from .statistics import EventDailyRegistration, EventStatistic
 
-__all__ = ["Event", "Participant", "Attendance"]
+__all__ = [
+    "Event",
+    "Participant",
+    "Attendance",
+    "ArchivedEvent",
+    "ArchivedAttendance",
+    "EventStatistic",
+    "EventDailyRegistration",
+    "EventDeletion",
+]
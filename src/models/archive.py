@@ -0,0 +1,75 @@
+"""
+Modelos de base de datos para el archivo histórico de eventos
+
+Los eventos que ya ocurrieron (más allá del horizonte configurado) se
+mueven con sus asistencias a estas tablas, de forma que `events` y
+`attendances` solo contengan el conjunto de trabajo activo.
+"""
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy.orm import relationship
+
+from src.database.connection import Base
+
+
+class ArchivedEvent(Base):
+    """
+    Modelo de Evento archivado
+
+    Conserva el mismo ID que tenía en la tabla `events`, para que las
+    consultas por ID puedan recurrir al archivo de forma transparente.
+    """
+
+    __tablename__ = "events_archive"
+
+    # Columnas (mismas que Event)
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    name = Column(String(200), nullable=False)
+    description = Column(Text, nullable=True)
+    location = Column(String(300), nullable=False)
+    date = Column(DateTime, nullable=False, index=True)
+    capacity = Column(Integer, nullable=False)
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+    archived_at = Column(DateTime, server_default=func.now())
+
+    # Relaciones
+    attendances = relationship(
+        "ArchivedAttendance", back_populates="event", passive_deletes=True
+    )
+
+    # Atributo no persistido: permite distinguirlo de Event en las respuestas
+    archived = True
+
+    def __repr__(self):
+        return f"<ArchivedEvent(id={self.id}, name='{self.name}', date={self.date})>"
+
+
+class ArchivedAttendance(Base):
+    """
+    Modelo de Asistencia archivada
+
+    No tiene clave foránea hacia `participants`: eliminar un participante
+    no debe fallar por su historial archivado.
+    """
+
+    __tablename__ = "attendances_archive"
+
+    # Columnas
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    event_id = Column(
+        Integer,
+        ForeignKey("events_archive.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    participant_id = Column(Integer, nullable=False, index=True)
+    registered_at = Column(DateTime)
+
+    # Relaciones
+    event = relationship("ArchivedEvent", back_populates="attendances")
+
+    def __repr__(self):
+        return (
+            f"<ArchivedAttendance(event_id={self.event_id}, "
+            f"participant_id={self.participant_id})>"
+        )
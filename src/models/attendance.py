@@ -21,8 +21,12 @@ class Attendance(Base):
 
     # Columnas
     id = Column(Integer, primary_key=True, index=True)
-    event_id = Column(Integer, ForeignKey("events.id"), nullable=False)
-    participant_id = Column(Integer, ForeignKey("participants.id"), nullable=False)
+    event_id = Column(
+        Integer, ForeignKey("events.id", ondelete="CASCADE"), nullable=False
+    )
+    participant_id = Column(
+        Integer, ForeignKey("participants.id", ondelete="CASCADE"), nullable=False
+    )
     registered_at = Column(DateTime, default=datetime.utcnow)
 
     # Relaciones
@@ -30,8 +34,10 @@ class Attendance(Base):
     participant = relationship("Participant", back_populates="attendances")
 
     # Restricción de unicidad: un participante solo puede registrarse una vez por evento
+    # sqlite_autoincrement: sin reutilizar IDs, que el archivo conserva
     __table_args__ = (
         UniqueConstraint("event_id", "participant_id", name="unique_event_participant"),
+        {"sqlite_autoincrement": True},
     )
 
     def __repr__(self):
@@ -0,0 +1,36 @@
+"""
+Modelo de base de datos para las eliminaciones de eventos en segundo plano
+
+El estado se guarda en la base de datos y no en el caché: sobrevive a una
+caída de Redis y sigue consultable después de que el evento se eliminó.
+"""
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String, Text
+
+from src.database.connection import Base
+
+# Estados en los que el evento aún existe pero ya no admite registros
+ACTIVE_DELETION_STATUSES = ("pending", "running")
+
+
+class EventDeletion(Base):
+    """
+    Modelo de Eliminación de Evento
+
+    Una fila por evento con el progreso de su eliminación por lotes. No usa
+    clave foránea: la fila debe sobrevivir al borrado del evento.
+    """
+
+    __tablename__ = "event_deletions"
+
+    # Columnas
+    event_id = Column(Integer, primary_key=True, autoincrement=False)
+    status = Column(String(20), nullable=False, index=True)
+    deleted_attendances = Column(Integer, nullable=False, default=0)
+    detail = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<EventDeletion(event_id={self.event_id}, status='{self.status}')>"
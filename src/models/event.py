@@ -10,20 +10,31 @@ class Event(Base):
     """Modelo de Evento"""
 
     __tablename__ = "events"
+    # Sin reutilizar IDs en SQLite: el archivo conserva el ID de los eventos
+    # archivados, y un ID reutilizado chocaría con él
+    __table_args__ = {"sqlite_autoincrement": True}
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(200), nullable=False, index=True)
     description = Column(Text, nullable=True)
     location = Column(String(300), nullable=False)
-    date = Column(DateTime, nullable=False)
+    date = Column(DateTime, nullable=False, index=True)
     capacity = Column(Integer, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relación con asistencias
+    # passive_deletes: la BD borra las asistencias (ON DELETE CASCADE) sin
+    # cargarlas en la sesión
     attendances = relationship(
-        "Attendance", back_populates="event", cascade="all, delete-orphan"
+        "Attendance",
+        back_populates="event",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
+    # Atributo no persistido: contraparte de ArchivedEvent.archived
+    archived = False
+
     def __repr__(self):
         return f"<Event(id={self.id}, name='{self.name}', date={self.date})>"
@@ -24,8 +24,13 @@ class Participant(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relaciones
+    # passive_deletes: la BD borra las asistencias (ON DELETE CASCADE) sin
+    # cargarlas en la sesión
     attendances = relationship(
-        "Attendance", back_populates="participant", cascade="all, delete-orphan"
+        "Attendance",
+        back_populates="participant",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def __repr__(self):
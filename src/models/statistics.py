@@ -0,0 +1,59 @@
+"""
+Modelos de base de datos para las estadísticas de eventos
+
+Proyección mantenida de forma incremental: se actualiza en la misma
+transacción que los registros y cancelaciones de asistencias, de modo que
+consultar las estadísticas de un evento sea leer una sola fila indexada.
+"""
+from datetime import datetime
+
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer
+
+from src.database.connection import Base
+
+
+class EventStatistic(Base):
+    """
+    Modelo de Estadísticas de Evento
+
+    Una fila por evento con el número de participantes registrados.
+    """
+
+    __tablename__ = "event_statistics"
+
+    # Columnas
+    event_id = Column(
+        Integer, ForeignKey("events.id", ondelete="CASCADE"), primary_key=True
+    )
+    registered_count = Column(Integer, nullable=False, default=0)
+    last_registration_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return (
+            f"<EventStatistic(event_id={self.event_id}, "
+            f"registered_count={self.registered_count})>"
+        )
+
+
+class EventDailyRegistration(Base):
+    """
+    Modelo de Registros Diarios por Evento
+
+    Número neto de registros (registros menos cancelaciones) por día.
+    """
+
+    __tablename__ = "event_daily_registrations"
+
+    # Columnas
+    event_id = Column(
+        Integer, ForeignKey("events.id", ondelete="CASCADE"), primary_key=True
+    )
+    day = Column(Date, primary_key=True)
+    registrations = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return (
+            f"<EventDailyRegistration(event_id={self.event_id}, day={self.day}, "
+            f"registrations={self.registrations})>"
+        )
@@ -0,0 +1,6 @@
+"""
+Observabilidad: perfil de arranque y diagnóstico de la aplicación
+"""
+from .startup import StartupProfile, startup
+
+__all__ = ["StartupProfile", "startup"]
@@ -0,0 +1,313 @@
+"""
+Captura de tráfico real para reproducirlo después (loadtest/replay.py).
+
+Con TRAFFIC_CAPTURE_ENABLED, una fracción TRAFFIC_CAPTURE_SAMPLE_RATE de
+las peticiones se agrega a TRAFFIC_CAPTURE_PATH, una por línea:
+
+    {"ts":1760000000.123,"method":"POST","route":"/attendances/",
+     "path":"/attendances/","query":{},"body":{"event_id":1,"participant_id":5},
+     "body_shape":{"event_id":"int","participant_id":"int"},"body_bytes":38,
+     "status":201,"duration_ms":12.4}
+
+Datos personales: los emails (en cualquier texto) y los teléfonos (campos
+`phone`, sean texto o números, o valores con formato +NNN...) se
+reemplazan por un HMAC del valor con formato válido. El mismo valor da
+siempre el mismo reemplazo, así que se conservan las relaciones entre
+peticiones (crear un participante y luego buscarlo) sin guardar el valor
+original. Los cuerpos
+que no son JSON o superan TRAFFIC_CAPTURE_MAX_BODY_BYTES solo guardan su
+forma y tamaño, y no se pueden reproducir.
+
+La petición solo paga copiar el cuerpo y encolar la muestra: el análisis
+del JSON, la limpieza y la escritura ocurren en un hilo propio. Si la cola
+se llena, la muestra se descarta.
+"""
+import atexit
+import hashlib
+import hmac
+import json
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
+from typing import Any, Dict, NamedTuple, Optional, Sequence
+from urllib.parse import parse_qsl
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+PHONE_FIELDS = frozenset({"phone", "phones"})
+_EMAIL = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)*\.[A-Za-z]{2,}")
+_PHONE = re.compile(r"^\+\d[\d\s().-]{6,19}$")
+
+
+class Scrubber:
+    """
+    Reemplaza emails y teléfonos por un HMAC-SHA256 del valor.
+
+    Args:
+        key: Clave del HMAC; vacía usa una aleatoria por proceso (los
+            reemplazos no coinciden entre workers ni reinicios)
+    """
+
+    def __init__(self, key: str = ""):
+        self.key = key.encode() if key else os.urandom(32)
+
+    def _digest(self, value: str) -> str:
+        return hmac.new(
+            self.key, value.strip().lower().encode(), hashlib.sha256
+        ).hexdigest()
+
+    def email(self, value: str) -> str:
+        return f"{self._digest(value)[:16]}@scrubbed.example.com"
+
+    def phone(self, value: str) -> str:
+        return f"+57{int(self._digest(value)[:12], 16) % 10**10:010d}"
+
+    def scrub(self, value: Any, field: Optional[str] = None) -> Any:
+        """Copia de `value` (JSON) sin emails ni teléfonos"""
+        if isinstance(value, dict):
+            return {key: self.scrub(item, key) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.scrub(item, field) for item in value]
+        if (field or "").lower() in PHONE_FIELDS and value is not None:
+            # También números (p. ej. un cuerpo que la validación rechaza)
+            return self.phone(str(value))
+        if not isinstance(value, str):
+            return value
+        if _PHONE.match(value):
+            return self.phone(value)
+        return _EMAIL.sub(lambda match: self.email(match.group()), value)
+
+
+def body_shape(value: Any) -> Any:
+    """Forma de un cuerpo JSON: tipos en lugar de valores"""
+    if isinstance(value, dict):
+        return {key: body_shape(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [body_shape(value[0])] if value else []
+    return type(value).__name__
+
+
+class CapturedRequest(NamedTuple):
+    """Petición muestreada, tal como la deja el middleware en la cola"""
+
+    ts: float
+    method: str
+    route: Optional[str]
+    path: str
+    query_string: bytes
+    content_type: str
+    body: Optional[bytes]  # None si superó el máximo
+    body_bytes: int
+    status: int
+    duration: float
+
+
+class TrafficRecorder:
+    """
+    Escribe las peticiones capturadas desde un hilo propio.
+
+    Args:
+        path: Archivo JSONL; `{pid}` se reemplaza por el PID del worker
+        scrubber: Limpieza de datos personales
+        max_file_bytes: Tamaño a partir del cual se deja de escribir
+        queue_size: Muestras en espera; con la cola llena se descartan
+    """
+
+    def __init__(
+        self,
+        path: str,
+        scrubber: Scrubber,
+        max_file_bytes: int = 100 * 1024 * 1024,
+        queue_size: int = 10000,
+    ):
+        self.path = path
+        self.scrubber = scrubber
+        self.max_file_bytes = max_file_bytes
+        self.queue: "queue.Queue[Optional[CapturedRequest]]" = queue.Queue(queue_size)
+        self.dropped = 0
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def submit(self, request: CapturedRequest) -> None:
+        """Encola una muestra sin bloquear"""
+        if self._pid != os.getpid():
+            # Primer uso en este proceso (los hilos no sobreviven a un fork)
+            self._start()
+        try:
+            self.queue.put_nowait(request)
+        except queue.Full:
+            self.dropped += 1
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(self.path.format(pid=self._pid),),
+                name="traffic-capture",
+                daemon=True,
+            )
+            self._thread.start()
+            atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """Escribe las muestras pendientes y detiene el hilo"""
+        thread = self._thread
+        if thread is None or self._pid != os.getpid():
+            return
+        self.queue.put(None)
+        thread.join(timeout=5)
+        self._thread = None
+        self._pid = None
+
+    def _run(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as file:
+            written = file.tell()
+            while True:
+                request = self.queue.get()
+                if request is None:
+                    break
+                try:
+                    line = json.dumps(self.to_record(request), separators=(",", ":"))
+                except Exception as e:  # una muestra rara no detiene la captura
+                    logger.warning(f"No se pudo capturar {request.path}: {e}")
+                    continue
+                if written + len(line) + 1 > self.max_file_bytes:
+                    self.dropped += 1
+                    continue
+                file.write(line + "\n")
+                written += len(line) + 1
+                if self.queue.empty():
+                    file.flush()
+
+    def to_record(self, request: CapturedRequest) -> Dict[str, Any]:
+        """Registro JSON de la muestra, sin datos personales"""
+        query: Dict[str, Any] = {}
+        for key, value in parse_qsl(request.query_string.decode("latin-1"), True):
+            value = self.scrubber.scrub(value, key)
+            if key not in query:
+                query[key] = value
+            elif isinstance(query[key], list):
+                query[key].append(value)
+            else:
+                # Parámetro repetido (?ids=1&ids=2): lista de valores
+                query[key] = [query[key], value]
+
+        record: Dict[str, Any] = {
+            "ts": round(request.ts, 3),
+            "method": request.method,
+            "route": request.route,
+            "path": self.scrubber.scrub(request.path),
+            "query": query,
+        }
+        if request.body_bytes:
+            body = None
+            if request.body is not None and "json" in request.content_type:
+                try:
+                    body = json.loads(request.body)
+                except ValueError:
+                    pass
+            if body is not None:
+                record["body"] = self.scrubber.scrub(body)
+                record["body_shape"] = body_shape(body)
+            else:
+                record["content_type"] = request.content_type
+            record["body_bytes"] = request.body_bytes
+        record["status"] = request.status
+        record["duration_ms"] = round(request.duration * 1000, 2)
+        return record
+
+
+class TrafficCaptureMiddleware:
+    """
+    Middleware ASGI que captura una muestra de las peticiones.
+
+    Args:
+        app: Aplicación ASGI
+        recorder: Destino de las muestras
+        sample_rate: Fracción de peticiones capturadas (0.0 a 1.0)
+        max_body_bytes: Cuerpos más grandes solo registran su tamaño
+        exclude_paths: Prefijos de rutas que no se capturan
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        recorder: TrafficRecorder,
+        sample_rate: float = 0.1,
+        max_body_bytes: int = 4096,
+        exclude_paths: Sequence[str] = ("/metrics", "/health", "/diagnostics"),
+    ):
+        self.app = app
+        self.recorder = recorder
+        self.sample_rate = sample_rate
+        self.max_body_bytes = max_body_bytes
+        self.exclude_paths = tuple(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["path"].startswith(self.exclude_paths)
+            or random.random() >= self.sample_rate
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        ts = time.time()
+        start = time.perf_counter()
+        chunks = []
+        body_bytes = 0
+        status = 500
+
+        async def receive_wrapper() -> Message:
+            nonlocal body_bytes
+            message = await receive()
+            if message["type"] == "http.request":
+                chunk = message.get("body", b"")
+                body_bytes += len(chunk)
+                if body_bytes <= self.max_body_bytes:
+                    chunks.append(chunk)
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            content_type = ""
+            for key, value in scope["headers"]:
+                if key == b"content-type":
+                    content_type = value.decode("latin-1")
+                    break
+            self.recorder.submit(
+                CapturedRequest(
+                    ts=ts,
+                    method=scope["method"],
+                    route=getattr(scope.get("route"), "path", None),
+                    path=scope["path"],
+                    query_string=scope.get("query_string", b""),
+                    content_type=content_type,
+                    body=b"".join(chunks)
+                    if body_bytes <= self.max_body_bytes
+                    else None,
+                    body_bytes=body_bytes,
+                    status=status,
+                    duration=time.perf_counter() - start,
+                )
+            )
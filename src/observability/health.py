@@ -0,0 +1,239 @@
+"""
+Monitor de dependencias para los health checks.
+
+Una tarea en segundo plano verifica la base de datos y Redis cada
+HEALTH_CHECK_INTERVAL segundos y guarda el resultado. Los endpoints
+/health/ready y /health/detailed sirven esa instantánea sin hacer I/O,
+de modo que las sondas del orquestador no cuestan nada y no se acumulan
+durante un incidente: como mucho hay una verificación en curso por
+dependencia.
+
+El monitor también reintenta los pasos de arranque que fallaron (p. ej.
+init_db si la base de datos aún no aceptaba conexiones), con espera
+exponencial, para que la instancia llegue a estar lista sin reiniciarla.
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from sqlalchemy import text
+
+from src.cache.redis_client import cache
+from src.config.setting import settings
+from src.database.connection import get_engine
+from src.observability.startup import startup
+
+logger = logging.getLogger(__name__)
+
+HEALTHY = "healthy"
+DEGRADED = "degraded"
+UNHEALTHY = "unhealthy"
+
+
+def check_database() -> None:
+    """Ejecuta SELECT 1 con una conexión del pool"""
+    with get_engine().connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+def check_redis() -> None:
+    """Ping a Redis a través del circuit breaker del caché"""
+    if not cache.ping():
+        raise ConnectionError(f"sin respuesta (circuito {cache.breaker.state})")
+
+
+def pool_status() -> Dict[str, Any]:
+    """
+    Uso del pool de conexiones de la base de datos.
+
+    `saturation` es la fracción de conexiones en uso sobre el máximo
+    (pool_size + max_overflow). Solo disponible con QueuePool.
+    """
+    pool = get_engine().pool
+    if not hasattr(pool, "checkedout"):
+        return {"type": type(pool).__name__}
+    checked_out = pool.checkedout()
+    capacity = pool.size() + max(pool._max_overflow, 0)
+    return {
+        "type": type(pool).__name__,
+        "size": pool.size(),
+        "checked_out": checked_out,
+        "overflow": max(pool.overflow(), 0),
+        "capacity": capacity,
+        "saturation": round(checked_out / capacity, 3) if capacity else 0.0,
+    }
+
+
+class HealthMonitor:
+    """
+    Verifica las dependencias periódicamente y guarda la última instantánea.
+
+    Args:
+        interval: Segundos entre verificaciones
+        timeout: Tiempo máximo de cada verificación
+        max_retry_delay: Espera máxima entre reintentos de un paso de arranque
+    """
+
+    def __init__(self, interval: float, timeout: float, max_retry_delay: float = 60.0):
+        self.interval = interval
+        self.timeout = timeout
+        self.max_retry_delay = max_retry_delay
+        self.snapshot: Optional[Dict[str, Any]] = None
+        self._checked_at = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._retries: Dict[str, Callable[[], Any]] = {}
+        self._attempts: Dict[str, Tuple[int, float]] = {}
+
+    def start(self) -> None:
+        """Lanza la tarea periódica en el event loop actual"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Detiene la tarea periódica"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def retry_startup_step(self, name: str, func: Callable[[], Any]) -> None:
+        """
+        Reintenta `func` desde el monitor mientras el paso de arranque `name`
+        esté fallido, esperando interval, 2x, 4x... hasta max_retry_delay.
+        """
+        self._retries[name] = func
+
+    async def retry_failed_steps(self) -> None:
+        """Reintenta los pasos de arranque fallidos cuya espera ya venció"""
+        steps = startup.snapshot()["steps"]
+        for name, func in self._retries.items():
+            if steps.get(name, {}).get("status") != "failed":
+                self._attempts.pop(name, None)
+                continue
+            attempts, retry_at = self._attempts.get(name, (0, 0.0))
+            if time.monotonic() < retry_at:
+                continue
+            try:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._run_step, name, func
+                )
+            except Exception as e:
+                delay = min(self.interval * 2**attempts, self.max_retry_delay)
+                self._attempts[name] = (attempts + 1, time.monotonic() + delay)
+                logger.warning(
+                    f"Reintento del paso de arranque {name} falló: {e}; "
+                    f"siguiente en {delay:.0f}s"
+                )
+            else:
+                self._attempts.pop(name, None)
+                logger.info(f"Paso de arranque {name} completado al reintentar")
+
+    @staticmethod
+    def _run_step(name: str, func: Callable[[], Any]) -> None:
+        with startup.step(name):
+            func()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.retry_failed_steps()
+                await self.refresh()
+            except Exception as e:  # el monitor nunca debe morir
+                logger.error(f"Error al verificar dependencias: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def refresh(self) -> Dict[str, Any]:
+        """Verifica todas las dependencias y actualiza la instantánea"""
+        database, redis = await asyncio.gather(
+            self._check("database", check_database),
+            self._check("redis", check_redis),
+        )
+        pool = pool_status()
+
+        if database["status"] != HEALTHY:
+            status = UNHEALTHY
+        elif (
+            redis["status"] != HEALTHY
+            or pool.get("saturation", 0) >= settings.HEALTH_POOL_SATURATION_WARNING
+        ):
+            status = DEGRADED
+        else:
+            status = HEALTHY
+
+        self.snapshot = {
+            "status": status,
+            "checked_at": datetime.utcnow().isoformat(),
+            "checks": {
+                "database": database,
+                "redis": {**redis, "breaker": cache.breaker.snapshot()},
+            },
+            "pool": pool,
+        }
+        self._checked_at = time.monotonic()
+        return self.snapshot
+
+    async def _check(self, name: str, check: Callable[[], None]) -> Dict[str, Any]:
+        """
+        Ejecuta una verificación en un hilo, con timeout.
+
+        Si la verificación anterior de la misma dependencia sigue colgada,
+        no se lanza otra: se reporta como no saludable.
+        """
+        previous = self._inflight.get(name)
+        if previous is not None and not previous.done():
+            return {"status": UNHEALTHY, "error": "verificación anterior sin terminar"}
+
+        start = time.perf_counter()
+        future = asyncio.get_running_loop().run_in_executor(None, check)
+        # Consume el error si la verificación termina después del timeout
+        future.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self._inflight[name] = future
+        try:
+            await asyncio.wait_for(asyncio.shield(future), self.timeout)
+        except asyncio.TimeoutError:
+            return {"status": UNHEALTHY, "error": f"timeout ({self.timeout}s)"}
+        except Exception as e:
+            return {"status": UNHEALTHY, "error": str(e)}
+        return {
+            "status": HEALTHY,
+            "latency_ms": round((time.perf_counter() - start) * 1000, 2),
+        }
+
+    def is_stale(self) -> bool:
+        """La instantánea es vieja si el monitor dejó de actualizarla"""
+        return time.monotonic() - self._checked_at > 3 * self.interval
+
+    def readiness(self) -> Dict[str, Any]:
+        """
+        Estado de preparación para recibir tráfico.
+
+        Listo si el arranque terminó, la instantánea es reciente y la base de
+        datos responde. Un paso de arranque fallido deja la instancia sin
+        estar lista hasta que un reintento del monitor lo complete. Redis es
+        opcional: sin él el estado es "degraded" pero la instancia sigue
+        lista.
+        """
+        if startup.pending() or self.snapshot is None:
+            return {"ready": False, "status": "starting"}
+        failed = [
+            name
+            for name, step in startup.snapshot()["steps"].items()
+            if step["status"] == "failed"
+        ]
+        if failed:
+            return {"ready": False, "status": "startup_failed", "failed": failed}
+        if self.is_stale():
+            return {**self.snapshot, "ready": False, "status": "stale"}
+        return {**self.snapshot, "ready": self.snapshot["status"] != UNHEALTHY}
+
+
+# Instancia global del monitor
+health_monitor = HealthMonitor(
+    interval=settings.HEALTH_CHECK_INTERVAL, timeout=settings.HEALTH_CHECK_TIMEOUT
+)
@@ -0,0 +1,165 @@
+"""
+Logging estructurado (JSON) sin bloquear las peticiones.
+
+Los loggers de la aplicación escriben en un QueueHandler: en el hilo de
+la petición solo se resuelve el mensaje y se encola el registro. El
+formateo a JSON y la escritura a stdout ocurren en el hilo de un
+QueueListener. Si la cola se llena (ráfaga de logs), los registros se
+descartan y se cuentan en lugar de frenar las peticiones.
+
+Cada registro lleva el `request_id` de la petición en curso (ver
+src.middleware.request_id).
+
+Uso:
+    from src.observability.logs import configure_logging
+
+    configure_logging(level="INFO", json_format=True, queue_size=10000)
+"""
+import atexit
+import logging
+import queue
+import sys
+import threading
+import time
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, Tuple
+
+from pythonjsonlogger import jsonlogger
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(message)s"
+JSON_FIELDS = "%(asctime)s %(levelname)s %(name)s %(request_id)s %(message)s"
+
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+
+def get_request_id() -> Optional[str]:
+    """ID de la petición en curso, o None fuera de una petición"""
+    return request_id_var.get()
+
+
+class RequestIdFilter(logging.Filter):
+    """Agrega `request_id` a cada registro (en el hilo que lo emite)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get() or "-"
+        return True
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    QueueHandler que no formatea en el hilo que emite el registro.
+
+    El QueueHandler estándar formatea el registro completo antes de
+    encolarlo; aquí solo se resuelve el mensaje (los argumentos pueden
+    ser objetos que cambian después) y el JSON se genera en el listener.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogRateLimiter:
+    """
+    Limita los registros repetidos por clave en ventanas fijas.
+
+    Permite `limit` registros por clave cada `window` segundos; el resto
+    se cuentan y el primer registro permitido de la ventana siguiente
+    informa cuántos se omitieron.
+
+    Args:
+        limit: Registros permitidos por clave y ventana (0: ninguno)
+        window: Duración de la ventana en segundos
+    """
+
+    def __init__(self, limit: int, window: float = 60.0):
+        self.limit = limit
+        self.window = window
+        # clave -> (inicio de la ventana, permitidos, omitidos)
+        self._windows: Dict[Tuple, Tuple[float, int, int]] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, key: Tuple) -> Tuple[bool, int]:
+        """
+        Indica si se puede registrar un evento con esta clave.
+
+        Returns:
+            (permitido, omitidos desde el último registro permitido)
+        """
+        now = time.monotonic()
+        with self._lock:
+            started, allowed, suppressed = self._windows.get(key, (now, 0, 0))
+            if now - started >= self.window:
+                started, allowed = now, 0
+            if allowed < self.limit:
+                self._windows[key] = (started, allowed + 1, 0)
+                return True, suppressed
+            self._windows[key] = (started, allowed, suppressed + 1)
+            return False, 0
+
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[NonBlockingQueueHandler] = None
+
+
+def configure_logging(level: str, json_format: bool, queue_size: int) -> None:
+    """
+    Configura el logger raíz con un QueueHandler y un QueueListener.
+
+    Args:
+        level: Nivel mínimo (DEBUG, INFO, WARNING...)
+        json_format: JSON (una línea por registro) o texto legible
+        queue_size: Registros en espera antes de descartar
+    """
+    global _listener, _queue_handler
+    if _listener is not None:
+        return
+
+    if json_format:
+        formatter = jsonlogger.JsonFormatter(
+            JSON_FIELDS,
+            rename_fields={"asctime": "timestamp", "levelname": "level"},
+            json_ensure_ascii=False,
+        )
+    else:
+        formatter = logging.Formatter(TEXT_FORMAT, datefmt="%Y-%m-%d %H:%M:%S")
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(formatter)
+
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    _queue_handler = NonBlockingQueueHandler(log_queue)
+    _queue_handler.addFilter(RequestIdFilter())
+    _listener = QueueListener(log_queue, output, respect_handler_level=True)
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(_queue_handler)
+    _listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging() -> None:
+    """Escribe los registros pendientes y detiene el listener"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+        if _queue_handler is not None:
+            logging.getLogger().removeHandler(_queue_handler)
+
+
+def dropped_records() -> int:
+    """Registros descartados por cola llena desde el arranque"""
+    return _queue_handler.dropped if _queue_handler is not None else 0
@@ -0,0 +1,267 @@
+"""
+Diagnóstico de memoria del proceso.
+
+- tracemalloc: se activa y desactiva en caliente. Con él activo se toman
+  instantáneas y se consultan los sitios que más memoria asignan o la
+  diferencia entre dos instantáneas (lo que creció entre ambas).
+- GC: recolecciones por generación (gc.get_stats) y, mientras el
+  seguimiento está activo, duración de las pausas (gc.callbacks).
+- ORM: instancias vivas de cada modelo y sesiones abiertas.
+
+Desactivado (el estado inicial) no cuesta nada: no hay tracemalloc ni
+callbacks del GC registrados. El estado es por proceso: con varios
+workers cada uno tiene el suyo (las respuestas incluyen el `pid`).
+"""
+import gc
+import itertools
+import linecache
+import os
+import threading
+import time
+import tracemalloc
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from src.config.setting import settings
+from src.database.connection import Base
+
+GROUP_BY = ("lineno", "filename", "traceback")
+
+# Asignaciones del propio diagnóstico que no interesan en los reportes
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, linecache.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def rss_bytes() -> Optional[int]:
+    """Memoria residente actual (Linux), o None si no está disponible"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _peak_rss_bytes() -> Optional[int]:
+    """Memoria residente máxima del proceso, o None si no está disponible"""
+    try:
+        import resource  # solo Unix
+    except ImportError:
+        return None
+    # ru_maxrss está en KB en Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class GcPauses:
+    """Duración de las pausas del GC por generación (gc.callbacks)"""
+
+    def __init__(self):
+        self.reset()
+        self._started_at = 0.0
+
+    def reset(self) -> None:
+        self.collections = [0, 0, 0]
+        self.total = [0.0, 0.0, 0.0]
+        self.max = [0.0, 0.0, 0.0]
+
+    def __call__(self, phase: str, info: Dict[str, int]) -> None:
+        if phase == "start":
+            self._started_at = time.perf_counter()
+            return
+        generation = info["generation"]
+        pause = time.perf_counter() - self._started_at
+        self.collections[generation] += 1
+        self.total[generation] += pause
+        self.max[generation] = max(self.max[generation], pause)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "generation": generation,
+                "collections": self.collections[generation],
+                "total_ms": round(self.total[generation] * 1000, 3),
+                "max_ms": round(self.max[generation] * 1000, 3),
+                "avg_ms": round(
+                    self.total[generation] * 1000 / self.collections[generation], 3
+                )
+                if self.collections[generation]
+                else 0.0,
+            }
+            for generation in range(3)
+        ]
+
+
+class MemoryDiagnostics:
+    """
+    Estado del diagnóstico de memoria del proceso.
+
+    Args:
+        max_snapshots: Instantáneas conservadas; se descartan las más viejas
+    """
+
+    def __init__(self, max_snapshots: int = 5):
+        self.max_snapshots = max_snapshots
+        self.snapshots: "OrderedDict[int, tracemalloc.Snapshot]" = OrderedDict()
+        self.gc_pauses = GcPauses()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @property
+    def tracking(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int = 10) -> Dict[str, Any]:
+        """Activa tracemalloc y la medición de pausas del GC"""
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(frames)
+            if self.gc_pauses not in gc.callbacks:
+                self.gc_pauses.reset()
+                gc.callbacks.append(self.gc_pauses)
+        return self.status()
+
+    def stop(self) -> Dict[str, Any]:
+        """Desactiva tracemalloc y descarta las instantáneas"""
+        with self._lock:
+            tracemalloc.stop()
+            self.snapshots.clear()
+            if self.gc_pauses in gc.callbacks:
+                gc.callbacks.remove(self.gc_pauses)
+        return self.status()
+
+    def status(self) -> Dict[str, Any]:
+        """Resumen: RSS, tracemalloc e instantáneas disponibles"""
+        current, peak = tracemalloc.get_traced_memory()
+        return {
+            "pid": os.getpid(),
+            "rss_bytes": rss_bytes(),
+            "peak_rss_bytes": _peak_rss_bytes(),
+            "tracemalloc": {
+                "tracing": self.tracking,
+                "frames": tracemalloc.get_traceback_limit(),
+                "traced_bytes": current,
+                "peak_traced_bytes": peak,
+                "overhead_bytes": tracemalloc.get_tracemalloc_memory(),
+            },
+            "snapshots": list(self.snapshots),
+        }
+
+    def take_snapshot(self) -> Dict[str, Any]:
+        """
+        Toma una instantánea de tracemalloc.
+
+        Raises:
+            RuntimeError: Si tracemalloc no está activo
+        """
+        if not self.tracking:
+            raise RuntimeError("tracemalloc no está activo")
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+        with self._lock:
+            snapshot_id = next(self._ids)
+            self.snapshots[snapshot_id] = snapshot
+            while len(self.snapshots) > self.max_snapshots:
+                self.snapshots.popitem(last=False)
+        return {
+            "id": snapshot_id,
+            "traces": len(snapshot.traces),
+            "size_bytes": sum(trace.size for trace in snapshot.traces),
+        }
+
+    def get_snapshot(self, snapshot_id: int) -> Optional[tracemalloc.Snapshot]:
+        return self.snapshots.get(snapshot_id)
+
+    def top(
+        self, snapshot: tracemalloc.Snapshot, group_by: str = "lineno", limit: int = 20
+    ) -> List[Dict[str, Any]]:
+        """Sitios que más memoria asignan en la instantánea"""
+        return [
+            {
+                "location": _location(stat.traceback, group_by),
+                "size_bytes": stat.size,
+                "count": stat.count,
+                **_traceback(stat.traceback, group_by),
+            }
+            for stat in snapshot.statistics(group_by)[:limit]
+        ]
+
+    def diff(
+        self,
+        base: tracemalloc.Snapshot,
+        current: tracemalloc.Snapshot,
+        group_by: str = "lineno",
+        limit: int = 20,
+    ) -> List[Dict[str, Any]]:
+        """Sitios cuya memoria más cambió de `base` a `current`"""
+        return [
+            {
+                "location": _location(stat.traceback, group_by),
+                "size_bytes": stat.size,
+                "size_diff_bytes": stat.size_diff,
+                "count": stat.count,
+                "count_diff": stat.count_diff,
+                **_traceback(stat.traceback, group_by),
+            }
+            for stat in current.compare_to(base, group_by)[:limit]
+        ]
+
+    def gc_stats(self) -> Dict[str, Any]:
+        """Contadores y estadísticas del GC por generación"""
+        return {
+            "pid": os.getpid(),
+            "enabled": gc.isenabled(),
+            "count": gc.get_count(),
+            "threshold": gc.get_threshold(),
+            "generations": gc.get_stats(),
+            "garbage": len(gc.garbage),
+            "pauses": self.gc_pauses.snapshot() if self.tracking else None,
+        }
+
+
+def _location(traceback: tracemalloc.Traceback, group_by: str) -> str:
+    frame = traceback[0]
+    if group_by == "filename":
+        return frame.filename
+    return f"{frame.filename}:{frame.lineno}"
+
+
+def _traceback(traceback: tracemalloc.Traceback, group_by: str) -> Dict[str, Any]:
+    if group_by != "traceback":
+        return {}
+    return {"traceback": [f"{frame.filename}:{frame.lineno}" for frame in traceback]}
+
+
+def orm_object_counts() -> Dict[str, Any]:
+    """
+    Instancias vivas de cada modelo ORM y sesiones abiertas.
+
+    Recorre todos los objetos del GC: O(tamaño del heap), solo bajo demanda.
+    """
+    models = {mapper.class_: mapper.class_.__name__ for mapper in Base.registry.mappers}
+    counts = dict.fromkeys(sorted(models.values()), 0)
+    sessions = 0
+    identity_map = 0
+    for obj in gc.get_objects():
+        cls = type(obj)
+        name = models.get(cls)
+        if name is not None:
+            counts[name] += 1
+        elif isinstance(obj, Session):
+            sessions += 1
+            identity_map += len(obj.identity_map)
+    return {
+        "pid": os.getpid(),
+        "models": counts,
+        "total": sum(counts.values()),
+        "sessions": sessions,
+        "session_identity_map_size": identity_map,
+    }
+
+
+# Instancia global por proceso
+memory_diagnostics = MemoryDiagnostics(max_snapshots=settings.MEMORY_MAX_SNAPSHOTS)
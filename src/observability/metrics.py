@@ -0,0 +1,208 @@
+"""
+Métricas en formato Prometheus.
+
+- Peticiones HTTP: total, latencia (histograma) y en curso, por método y
+  plantilla de ruta (`/events/{event_id}`, no la ruta real, para acotar
+  la cardinalidad) y código de estado.
+- Base de datos: consultas y su duración por tipo de sentencia.
+- Caché: operaciones, su duración y aciertos/fallos de lectura.
+
+Con varios workers (gunicorn o uvicorn --workers) definir la variable de
+entorno PROMETHEUS_MULTIPROC_DIR con un directorio vacío y compartido:
+cada proceso escribe allí sus valores y /metrics los agrega. Ver
+gunicorn.conf.py para limpiar los valores de los workers que terminan.
+"""
+import os
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.cache.redis_client import cache
+from src.database.instrumentation import QueryEvent, add_query_observer
+
+# Buckets con más resolución entre 50 ms y 1 s, donde se decide el p99
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.15,
+    0.2,
+    0.3,
+    0.5,
+    0.75,
+    1.0,
+    1.5,
+    2.5,
+    5.0,
+    10.0,
+)
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+CACHE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+# ============================================
+# MÉTRICAS HTTP
+# ============================================
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "Peticiones HTTP atendidas",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Latencia de las peticiones HTTP",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "Peticiones HTTP en curso",
+    ["method", "route"],
+    multiprocess_mode="livesum",
+)
+
+# ============================================
+# MÉTRICAS DE BASE DE DATOS
+# ============================================
+DB_QUERIES = Counter(
+    "db_queries_total",
+    "Sentencias SQL ejecutadas",
+    ["operation", "status"],
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Duración de las sentencias SQL",
+    ["operation"],
+    buckets=QUERY_BUCKETS,
+)
+
+# ============================================
+# MÉTRICAS DE CACHÉ
+# ============================================
+CACHE_OPERATIONS = Counter(
+    "cache_operations_total",
+    "Operaciones de caché (ok, error o skipped con el circuito abierto)",
+    ["operation", "outcome"],
+)
+CACHE_OPERATION_DURATION = Histogram(
+    "cache_operation_duration_seconds",
+    "Duración de las operaciones de caché",
+    ["operation"],
+    buckets=CACHE_BUCKETS,
+)
+CACHE_LOOKUPS = Counter(
+    "cache_lookups_total",
+    "Claves leídas del caché por resultado",
+    ["result"],
+)
+
+
+def route_template(scope: Scope) -> str:
+    """Plantilla de la ruta que atiende la petición, p. ej. /events/{event_id}"""
+    app = scope.get("app")
+    partial = None
+    for route in getattr(app, "routes", ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "path", UNMATCHED_ROUTE)
+        if match == Match.PARTIAL and partial is None:
+            partial = route  # la ruta existe con otro método (405)
+    return getattr(partial, "path", UNMATCHED_ROUTE)
+
+
+class MetricsMiddleware:
+    """Middleware ASGI que registra las métricas HTTP"""
+
+    def __init__(self, app: ASGIApp, exclude_paths=("/metrics",)):
+        self.app = app
+        self.exclude_paths = set(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        route = route_template(scope)
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method, route)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUEST_DURATION.labels(method, route).observe(
+                time.perf_counter() - start
+            )
+            HTTP_REQUESTS.labels(method, route, str(status_code)).inc()
+            in_progress.dec()
+
+
+def _observe_query(query: QueryEvent) -> None:
+    operation = query.operation
+    DB_QUERIES.labels(operation, "error" if query.error else "ok").inc()
+    DB_QUERY_DURATION.labels(operation).observe(query.duration)
+
+
+class _CacheMetrics:
+    """Observador del caché que alimenta las métricas"""
+
+    def on_operation(self, operation: str, outcome: str, duration: float) -> None:
+        CACHE_OPERATIONS.labels(operation, outcome).inc()
+        if outcome != "skipped":
+            CACHE_OPERATION_DURATION.labels(operation).observe(duration)
+
+    def on_lookup(self, hits: int, misses: int) -> None:
+        if hits:
+            CACHE_LOOKUPS.labels("hit").inc(hits)
+        if misses:
+            CACHE_LOOKUPS.labels("miss").inc(misses)
+
+
+_cache_metrics = _CacheMetrics()
+
+
+def install_observers() -> None:
+    """Registra los observadores de base de datos y caché"""
+    add_query_observer(_observe_query)
+    if _cache_metrics not in cache.observers:
+        cache.observers.append(_cache_metrics)
+
+
+def render_metrics() -> tuple:
+    """
+    Métricas en formato de exposición de Prometheus.
+
+    En modo multiproceso agrega los valores de todos los workers.
+
+    Returns:
+        (cuerpo, content-type)
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,339 @@
+"""
+Perfilado bajo demanda de peticiones reales.
+
+Con PROFILING_ENABLED y DIAGNOSTICS_TOKEN definidos, una petición que
+envía los encabezados
+
+    X-Profile: cprofile      (o "sampling")
+    X-Diagnostics-Token: <DIAGNOSTICS_TOKEN>
+
+se ejecuta bajo un profiler y la respuesta incluye `X-Profile-Id`. El
+perfil se guarda en PROFILING_DIR y se descarga desde
+GET /diagnostics/profiles/{profile_id}.
+
+- cprofile: cProfile en el hilo del event loop y en el hilo del
+  threadpool que ejecuta el endpoint; se guarda como `.pstats`
+  (`python -m pstats`, snakeviz). El perfil del event loop incluye lo
+  que otras peticiones ejecuten en él mientras tanto.
+- sampling: muestrea la pila del hilo que ejecuta el endpoint cada
+  PROFILING_SAMPLE_INTERVAL_MS; se guarda como `.speedscope.json`
+  (https://www.speedscope.app). Menor sobrecosto, para peticiones largas.
+
+Se perfila una petición a la vez; las demás siguen sin perfilar. Las
+peticiones sin el encabezado X-Profile solo pagan la lectura de una
+ContextVar en el endpoint.
+"""
+import asyncio
+import cProfile
+import functools
+import hmac
+import json
+import logging
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+TOKEN_HEADER = "X-Diagnostics-Token"
+
+CPROFILE = "cprofile"
+SAMPLING = "sampling"
+EXTENSIONS = {CPROFILE: ".pstats", SAMPLING: ".speedscope.json"}
+
+_PROFILE_ID = re.compile(r"^[0-9a-f]{32}$")
+
+
+def check_token(provided: Optional[str], expected: str) -> bool:
+    """Compara el token en tiempo constante; sin token configurado, nunca"""
+    if not expected or provided is None:
+        return False
+    return hmac.compare_digest(provided.encode(), expected.encode())
+
+
+class StackSampler:
+    """
+    Profiler de muestreo para hilos registrados.
+
+    Un hilo propio lee la pila de los hilos registrados cada `interval`
+    segundos (sys._current_frames) y acumula las muestras en formato
+    speedscope "sampled".
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.threads: Set[int] = set()
+        self.frames: List[Dict[str, Any]] = []
+        self.samples: List[List[int]] = []
+        self.weights: List[float] = []
+        self._frame_index: Dict[Tuple[str, str, int], int] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name="profile-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            frames = sys._current_frames()
+            for thread_id in list(self.threads):
+                frame = frames.get(thread_id)
+                if frame is not None:
+                    self.samples.append(self._stack(frame))
+                    self.weights.append((now - last) * 1000)
+            last = now
+
+    def _stack(self, frame) -> List[int]:
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            key = (code.co_name, code.co_filename, code.co_firstlineno)
+            index = self._frame_index.get(key)
+            if index is None:
+                index = self._frame_index[key] = len(self.frames)
+                self.frames.append({"name": key[0], "file": key[1], "line": key[2]})
+            stack.append(index)
+            frame = frame.f_back
+        stack.reverse()  # speedscope: de la raíz a la hoja
+        return stack
+
+    def to_speedscope(self, name: str) -> Dict[str, Any]:
+        """Perfil en formato de archivo de speedscope"""
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "eventia",
+            "shared": {"frames": self.frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "milliseconds",
+                    "startValue": 0,
+                    "endValue": sum(self.weights),
+                    "samples": self.samples,
+                    "weights": self.weights,
+                }
+            ],
+        }
+
+
+class ProfileSession:
+    """Perfil de una petición"""
+
+    def __init__(self, mode: str, name: str, sample_interval: float):
+        self.id = uuid.uuid4().hex
+        self.mode = mode
+        self.name = name
+        self.profiles: List[cProfile.Profile] = []
+        self.sampler = StackSampler(sample_interval) if mode == SAMPLING else None
+        self._lock = threading.Lock()
+
+    def run_in_thread(self, function: Callable, *args, **kwargs) -> Any:
+        """Ejecuta `function` perfilando el hilo actual"""
+        if self.sampler is not None:
+            thread_id = threading.get_ident()
+            self.sampler.threads.add(thread_id)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.sampler.threads.discard(thread_id)
+
+        profile = cProfile.Profile()
+        with self._lock:
+            self.profiles.append(profile)
+        return profile.runcall(function, *args, **kwargs)
+
+
+_current_session: ContextVar[Optional[ProfileSession]] = ContextVar(
+    "profile_session", default=None
+)
+
+
+def profiled(function: Callable) -> Callable:
+    """
+    Envuelve un endpoint síncrono para perfilarlo en el hilo del
+    threadpool donde FastAPI lo ejecuta. Los endpoints async ya quedan
+    en el perfil del event loop.
+    """
+    if asyncio.iscoroutinefunction(function):
+        return function
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        session = _current_session.get()
+        if session is None:
+            return function(*args, **kwargs)
+        return session.run_in_thread(function, *args, **kwargs)
+
+    return wrapper
+
+
+class ProfileStore:
+    """
+    Directorio de perfiles guardados, con un máximo de archivos.
+
+    Args:
+        directory: Directorio donde se guardan
+        max_files: Perfiles conservados; se eliminan los más antiguos
+    """
+
+    def __init__(self, directory: str, max_files: int = 100):
+        self.directory = directory
+        self.max_files = max_files
+
+    def save(self, session: ProfileSession) -> str:
+        """Guarda el perfil y retorna la ruta del archivo"""
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, session.id + EXTENSIONS[session.mode])
+        if session.sampler is not None:
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(session.sampler.to_speedscope(session.name), file)
+        else:
+            stats = pstats.Stats(*session.profiles)
+            stats.dump_stats(path)
+        self._prune()
+        return path
+
+    def _prune(self) -> None:
+        profiles = sorted(self.list(), key=lambda profile: profile["created_at"])
+        for profile in profiles[: max(len(profiles) - self.max_files, 0)]:
+            os.remove(os.path.join(self.directory, profile["file"]))
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Perfiles guardados, del más reciente al más antiguo"""
+        if not os.path.isdir(self.directory):
+            return []
+        profiles = []
+        for entry in os.scandir(self.directory):
+            profile_id, _, extension = entry.name.partition(".")
+            if not _PROFILE_ID.match(profile_id):
+                continue
+            stat = entry.stat()
+            profiles.append(
+                {
+                    "id": profile_id,
+                    "file": entry.name,
+                    "format": "speedscope" if "speedscope" in extension else "pstats",
+                    "size_bytes": stat.st_size,
+                    "created_at": stat.st_mtime,
+                }
+            )
+        return sorted(profiles, key=lambda profile: -profile["created_at"])
+
+    def path(self, profile_id: str) -> Optional[str]:
+        """Ruta del perfil con ese ID, o None si no existe"""
+        if not _PROFILE_ID.match(profile_id):
+            return None
+        for extension in EXTENSIONS.values():
+            path = os.path.join(self.directory, profile_id + extension)
+            if os.path.isfile(path):
+                return path
+        return None
+
+
+class ProfilingMiddleware:
+    """
+    Middleware ASGI que perfila las peticiones que lo solicitan.
+
+    Args:
+        app: Aplicación ASGI
+        token: Token requerido en X-Diagnostics-Token
+        store: Donde se guardan los perfiles
+        sample_interval: Segundos entre muestras (modo sampling)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        token: str,
+        store: ProfileStore,
+        sample_interval: float = 0.001,
+    ):
+        self.app = app
+        self.token = token
+        self.store = store
+        self.sample_interval = sample_interval
+        self._busy = threading.Lock()
+
+    def _requested_mode(self, scope: Scope) -> Optional[str]:
+        headers = dict(scope["headers"])
+        mode = headers.get(PROFILE_HEADER.lower().encode())
+        if mode is None:
+            return None
+        mode = mode.decode("latin-1").strip().lower()
+        token = headers.get(TOKEN_HEADER.lower().encode())
+        if mode not in EXTENSIONS or not check_token(
+            token.decode("latin-1") if token is not None else None, self.token
+        ):
+            return None
+        return mode
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        mode = self._requested_mode(scope) if scope["type"] == "http" else None
+        if mode is None:
+            await self.app(scope, receive, send)
+            return
+        if not self._busy.acquire(blocking=False):
+            logger.warning("Ya hay una petición en perfilado; se atiende sin perfil")
+            await self.app(scope, receive, send)
+            return
+
+        session = ProfileSession(
+            mode, f"{scope['method']} {scope['path']}", self.sample_interval
+        )
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[PROFILE_ID_HEADER] = session.id
+            await send(message)
+
+        token = _current_session.set(session)
+        loop_profile = cProfile.Profile() if mode == CPROFILE else None
+        try:
+            if session.sampler is not None:
+                session.sampler.start()
+            if loop_profile is not None:
+                loop_profile.enable()
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if loop_profile is not None:
+                loop_profile.disable()
+                session.profiles.append(loop_profile)
+            if session.sampler is not None:
+                session.sampler.stop()
+            _current_session.reset(token)
+            self._busy.release()
+
+        try:
+            path = await run_in_threadpool(self.store.save, session)
+            logger.info(
+                "Perfil %s guardado en %s",
+                session.id,
+                path,
+                extra={"profile_id": session.id},
+            )
+        except Exception as e:  # guardar el perfil no debe afectar la petición
+            logger.error(f"Error al guardar el perfil {session.id}: {e}")
@@ -0,0 +1,215 @@
+"""
+Diagnóstico de consultas SQL por petición.
+
+- Consultas lentas: toda sentencia que supera SLOW_QUERY_THRESHOLD_MS se
+  registra normalizada y con la forma de sus parámetros (tipos, no
+  valores, para no filtrar datos personales a los logs).
+- Conteo por petición: QueryDiagnosticsMiddleware cuenta las sentencias
+  de cada petición y, fuera de producción, las retorna en los encabezados
+  `X-Query-Count` y `X-Query-Time`.
+- N+1: si la misma sentencia normalizada se ejecuta más de
+  N_PLUS_ONE_THRESHOLD veces en una petición, se registra un aviso con
+  la ruta y la sentencia.
+
+La fixture `query_budget` de las pruebas usa `add_request_observer` para
+fijar el máximo de consultas por endpoint.
+"""
+import logging
+import re
+from collections import Counter
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Callable, List, Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.database.instrumentation import QueryEvent, add_query_observer
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|:\w+|\$\d+|\?")
+# IN (?, ?, ?) y los IN expandidos por SQLAlchemy quedan como IN (?)
+_IN_LIST = re.compile(r"\bIN \((?:\?(?:, )?)+\)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def normalize(statement: str) -> str:
+    """
+    Sentencia sin literales ni variaciones de placeholders ni espacios.
+
+    Dos ejecuciones de la misma consulta con distintos valores (o con
+    listas IN de distinto largo) dan la misma sentencia normalizada.
+    """
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    normalized = _STRING_LITERAL.sub("?", normalized)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    return _IN_LIST.sub("IN (?)", normalized)
+
+
+def parameter_shape(parameters: Any) -> str:
+    """
+    Forma de los parámetros: tipos en lugar de valores.
+
+    Ejemplos: "(int, str)", "{email: str}", "500 x (int, int)"
+    """
+    if isinstance(parameters, list):
+        if not parameters:
+            return "[]"
+        return f"{len(parameters)} x {parameter_shape(parameters[0])}"
+    if isinstance(parameters, dict):
+        items = ", ".join(
+            f"{key}: {type(value).__name__}" for key, value in parameters.items()
+        )
+        return "{" + items + "}"
+    if isinstance(parameters, tuple):
+        return "(" + ", ".join(type(value).__name__ for value in parameters) + ")"
+    return type(parameters).__name__
+
+
+class RequestQueries:
+    """Sentencias SQL ejecutadas durante una petición"""
+
+    def __init__(self, method: str, path: str):
+        self.method = method
+        self.path = path
+        self.route = path
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Counter = Counter()
+
+    def add(self, query: QueryEvent) -> None:
+        """Registra una sentencia"""
+        self.count += 1
+        self.duration += query.duration
+        self.statements[normalize(query.statement)] += 1
+
+    def repeated(self, threshold: int) -> List[tuple]:
+        """Sentencias ejecutadas más de `threshold` veces: [(sentencia, veces)]"""
+        return [
+            (statement, times)
+            for statement, times in self.statements.most_common()
+            if times > threshold
+        ]
+
+
+RequestObserver = Callable[[RequestQueries], None]
+
+_current_request: ContextVar[Optional[RequestQueries]] = ContextVar(
+    "request_queries", default=None
+)
+_request_observers: List[RequestObserver] = []
+
+
+def current_request_queries() -> Optional[RequestQueries]:
+    """Consultas de la petición en curso, o None fuera de una petición"""
+    return _current_request.get()
+
+
+def add_request_observer(observer: RequestObserver) -> None:
+    """Registra un observador que recibe las consultas de cada petición"""
+    if observer not in _request_observers:
+        _request_observers.append(observer)
+
+
+def remove_request_observer(observer: RequestObserver) -> None:
+    """Elimina un observador registrado"""
+    if observer in _request_observers:
+        _request_observers.remove(observer)
+
+
+class QueryDiagnosticsMiddleware:
+    """
+    Middleware ASGI que cuenta las consultas de cada petición.
+
+    Args:
+        app: Aplicación ASGI
+        expose_headers: Agrega X-Query-Count y X-Query-Time a la respuesta
+        n_plus_one_threshold: Repeticiones de una sentencia que se avisan
+    """
+
+    def __init__(
+        self, app: ASGIApp, expose_headers: bool = False, n_plus_one_threshold: int = 10
+    ):
+        self.app = app
+        self.expose_headers = expose_headers
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        queries = RequestQueries(scope["method"], scope["path"])
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and self.expose_headers:
+                headers = MutableHeaders(scope=message)
+                headers["X-Query-Count"] = str(queries.count)
+                headers["X-Query-Time"] = f"{queries.duration * 1000:.2f}"
+            await send(message)
+
+        token = _current_request.set(queries)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_request.reset(token)
+            queries.route = getattr(scope.get("route"), "path", scope["path"])
+            self._finish(queries)
+
+    def _finish(self, queries: RequestQueries) -> None:
+        for statement, times in queries.repeated(self.n_plus_one_threshold):
+            logger.warning(
+                "Posible N+1 en %s %s: sentencia ejecutada %d veces: %s",
+                queries.method,
+                queries.route,
+                times,
+                statement,
+                extra={
+                    "route": queries.route,
+                    "repetitions": times,
+                    "query_count": queries.count,
+                },
+            )
+        for observer in list(_request_observers):
+            observer(queries)
+
+
+class SlowQueryLogger:
+    """
+    Observador de consultas: cuenta cada sentencia en la petición en curso
+    y registra las que superan `threshold` segundos.
+    """
+
+    def __init__(self, threshold: float):
+        self.threshold = threshold
+
+    def __call__(self, query: QueryEvent) -> None:
+        queries = _current_request.get()
+        if queries is not None:
+            queries.add(query)
+        if query.duration >= self.threshold:
+            path = queries.path if queries is not None else None
+            logger.warning(
+                "Consulta lenta (%.1f ms): %s",
+                query.duration * 1000,
+                normalize(query.statement),
+                extra={
+                    "duration_ms": round(query.duration * 1000, 2),
+                    "parameters": parameter_shape(query.parameters),
+                    "path": path,
+                },
+            )
+
+
+_slow_query_logger = SlowQueryLogger(threshold=float("inf"))
+
+
+def install_observers(slow_query_threshold_ms: float) -> None:
+    """Registra el observador de consultas lentas y conteo por petición"""
+    _slow_query_logger.threshold = slow_query_threshold_ms / 1000
+    add_query_observer(_slow_query_logger)
@@ -0,0 +1,112 @@
+"""
+Perfil de arranque de la aplicación.
+
+Registra cuánto tarda cada paso del arranque (importación de módulos,
+inicialización de la base de datos, etc.) y permite ejecutar los pasos
+lentos en segundo plano, de modo que el servidor empiece a responder
+(p. ej. los health checks) sin esperar a que terminen.
+
+Uso:
+    from src.observability.startup import startup
+
+    with startup.step("verificar_configuracion"):
+        ...
+    startup.run_in_background("init_db", init_db)
+    startup.wait("init_db", timeout=30)  # antes de usar la base de datos
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from src import IMPORT_STARTED_AT
+
+logger = logging.getLogger(__name__)
+
+
+class StartupProfile:
+    """Tiempos y estado de los pasos de arranque"""
+
+    def __init__(self, started_at: Optional[float] = None):
+        self.started_at = time.perf_counter() if started_at is None else started_at
+        self.steps: Dict[str, Dict[str, Any]] = {}
+        self._done: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        name: str,
+        seconds: float,
+        status: str = "ok",
+        error: Optional[str] = None,
+    ) -> None:
+        """Registra la duración de un paso ya ejecutado"""
+        with self._lock:
+            self.steps[name] = {
+                "status": status,
+                "duration_ms": round(seconds * 1000, 2),
+                **({"error": error} if error else {}),
+            }
+        logger.info(f"Arranque: {name} ({status}) en {seconds * 1000:.1f} ms")
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        """Mide un paso síncrono del arranque"""
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            self.record(name, time.perf_counter() - start, "failed", str(e))
+            raise
+        self.record(name, time.perf_counter() - start)
+
+    def run_in_background(self, name: str, func: Callable[[], Any]) -> None:
+        """
+        Ejecuta un paso en un hilo aparte sin bloquear el arranque.
+
+        El resultado queda en `steps[name]` y `wait(name)` permite a quien
+        dependa del paso esperarlo.
+        """
+        done = threading.Event()
+        with self._lock:
+            self._done[name] = done
+            self.steps[name] = {"status": "running"}
+
+        def target():
+            try:
+                with self.step(name):
+                    func()
+            except Exception as e:
+                logger.error(f"Error en el paso de arranque {name}: {e}")
+            finally:
+                done.set()
+
+        threading.Thread(target=target, name=f"startup-{name}", daemon=True).start()
+
+    def wait(self, name: str, timeout: Optional[float] = None) -> bool:
+        """
+        Espera a que termine un paso en segundo plano.
+
+        Retorna True de inmediato si el paso no se lanzó en segundo plano.
+        """
+        done = self._done.get(name)
+        return True if done is None else done.wait(timeout)
+
+    def pending(self) -> bool:
+        """Indica si queda algún paso en segundo plano en curso"""
+        return any(not done.is_set() for done in self._done.values())
+
+    def mark_ready(self) -> None:
+        """Registra el tiempo total desde el inicio del arranque"""
+        self.record("ready", time.perf_counter() - self.started_at)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Estado del arranque para los health checks"""
+        with self._lock:
+            steps = {name: dict(step) for name, step in self.steps.items()}
+        return {"pending": self.pending(), "steps": steps}
+
+
+# Instancia global del perfil de arranque
+startup = StartupProfile(started_at=IMPORT_STARTED_AT)
@@ -0,0 +1,458 @@
+"""
+Trazas por petición: dónde se fue el tiempo de cada request.
+
+Cada petición HTTP abre una traza y mide, por categoría:
+
+- controller: el handler del endpoint (dependencias, validación,
+  controller y serialización de `response_model`)
+- service: métodos públicos de los servicios (`@traced_service`)
+- db: sentencias SQL (eventos de cursor de SQLAlchemy)
+- cache: operaciones de Redis
+- serialize: serialización JSON de `model_response`
+
+Los tiempos son inclusivos (service contiene db y cache) y se retornan
+en el encabezado `Server-Timing`, visible en las DevTools del navegador:
+
+    Server-Timing: controller;dur=12.4, service;dur=10.9,
+                   db;dur=8.1;desc="5 queries", serialize;dur=0.9, total;dur=13.2
+
+Solo una fracción de las peticiones (TRACING_SAMPLE_RATE, o las que
+llegan con un `traceparent` W3C muestreado) guarda cada span y la
+exporta en formato OTLP/JSON, una traza por línea, a la consola o a un
+archivo que puede leer el receptor `otlpjsonfile` de OpenTelemetry
+Collector. Sin muestreo solo se acumulan sumas por categoría; sin
+traza activa (tareas de fondo, comandos) cada punto de medición retorna
+tras leer una ContextVar.
+"""
+import functools
+import inspect
+import json
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, TextIO
+
+from fastapi.routing import APIRoute
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.cache.redis_client import cache
+from src.database.instrumentation import QueryEvent, add_query_observer
+from src.observability.profiling import profiled
+
+logger = logging.getLogger(__name__)
+
+CONTROLLER = "controller"
+SERVICE = "service"
+DB = "db"
+CACHE = "cache"
+SERIALIZE = "serialize"
+
+# Descripción de Server-Timing por categoría, con el número de spans
+_COUNT_LABELS = {DB: "queries", CACHE: "ops"}
+
+MAX_STATEMENT_LENGTH = 500
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+def _new_id(size: int) -> str:
+    return os.urandom(size).hex()
+
+
+class Span:
+    """Un tramo medido de la petición"""
+
+    __slots__ = (
+        "name",
+        "category",
+        "span_id",
+        "parent_id",
+        "start",
+        "end",
+        "attributes",
+        "error",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        category: str,
+        parent_id: Optional[str],
+        start: float,
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        self.name = name
+        self.category = category
+        self.span_id = _new_id(8)
+        self.parent_id = parent_id
+        self.start = start
+        self.end = start
+        self.attributes = attributes or {}
+        self.error: Optional[str] = None
+
+
+class Trace:
+    """
+    Traza de una petición.
+
+    Args:
+        trace_id: ID de 32 caracteres hexadecimales
+        parent_id: Span del llamador (traceparent), si lo hay
+        sampled: Si se guardan y exportan los spans
+    """
+
+    def __init__(self, trace_id: str, parent_id: Optional[str], sampled: bool):
+        self.trace_id = trace_id
+        self.sampled = sampled
+        self.totals: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+        self.spans: List[Span] = []
+        # Anclas para convertir perf_counter a tiempo Unix en la exportación
+        self.epoch_ns = time.time_ns()
+        self.started = time.perf_counter()
+        self.root = Span("request", "request", parent_id, self.started)
+
+    def add(self, category: str, duration: float) -> None:
+        """Suma una duración al total de su categoría"""
+        self.totals[category] = self.totals.get(category, 0.0) + duration
+        self.counts[category] = self.counts.get(category, 0) + 1
+
+    def server_timing(self) -> str:
+        """Valor del encabezado Server-Timing"""
+        entries = []
+        for category, total in self.totals.items():
+            entry = f"{category};dur={total * 1000:.2f}"
+            if category in _COUNT_LABELS:
+                entry += f';desc="{self.counts[category]} {_COUNT_LABELS[category]}"'
+            entries.append(entry)
+        entries.append(f"total;dur={(time.perf_counter() - self.started) * 1000:.2f}")
+        return ", ".join(entries)
+
+    def to_otlp(self, service_name: str) -> Dict[str, Any]:
+        """Traza en formato OTLP/JSON (ExportTraceServiceRequest)"""
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [_attribute("service.name", service_name)]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "eventia.tracing"},
+                            "spans": [
+                                self._span_to_otlp(span)
+                                for span in [self.root, *self.spans]
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def _span_to_otlp(self, span: Span) -> Dict[str, Any]:
+        data = {
+            "traceId": self.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": 2 if span is self.root else 1,  # SERVER / INTERNAL
+            "startTimeUnixNano": str(self._unix_nano(span.start)),
+            "endTimeUnixNano": str(self._unix_nano(span.end)),
+            "attributes": [
+                _attribute(key, value)
+                for key, value in {"category": span.category, **span.attributes}.items()
+            ],
+            "status": {"code": 2, "message": span.error} if span.error else {},
+        }
+        if span.parent_id:
+            data["parentSpanId"] = span.parent_id
+        return data
+
+    def _unix_nano(self, moment: float) -> int:
+        return self.epoch_ns + int((moment - self.started) * 1e9)
+
+
+def _attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+# ============================================
+# CONTEXTO DE LA PETICIÓN
+# ============================================
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("trace", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("span", default=None)
+# Categorías abiertas: un servicio que llama a otro no se suma dos veces
+_open_categories: ContextVar[FrozenSet[str]] = ContextVar(
+    "open_categories", default=frozenset()
+)
+
+
+def current_trace() -> Optional[Trace]:
+    """Traza de la petición en curso, o None fuera de una petición"""
+    return _current_trace.get()
+
+
+@contextmanager
+def span(name: str, category: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """
+    Mide un bloque de código dentro de la traza actual.
+
+    Uso:
+        with span("EventService.get_event", SERVICE):
+            ...
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+
+    open_categories = _open_categories.get()
+    nested = category in open_categories
+    categories_token = _open_categories.set(open_categories | {category})
+    current = None
+    span_token = None
+    if trace.sampled:
+        parent = _current_span.get() or trace.root
+        current = Span(name, category, parent.span_id, time.perf_counter(), attributes)
+        span_token = _current_span.set(current)
+    start = time.perf_counter()
+    try:
+        yield current
+    except BaseException as e:
+        if current is not None:
+            current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        end = time.perf_counter()
+        if not nested:
+            trace.add(category, end - start)
+        if current is not None:
+            current.end = end
+            trace.spans.append(current)
+            _current_span.reset(span_token)
+        _open_categories.reset(categories_token)
+
+
+def record(name: str, category: str, duration: float, **attributes: Any) -> None:
+    """
+    Registra un tramo ya medido que terminó ahora (p. ej. una consulta SQL).
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        return
+    trace.add(category, duration)
+    if trace.sampled:
+        end = time.perf_counter()
+        parent = _current_span.get() or trace.root
+        recorded = Span(name, category, parent.span_id, end - duration, attributes)
+        recorded.end = end
+        trace.spans.append(recorded)
+
+
+def traced_service(cls: type) -> type:
+    """
+    Decorador de clase: mide cada método público del servicio.
+
+    Los generadores se omiten: su cuerpo corre fuera de la llamada.
+    """
+    for attribute, function in list(vars(cls).items()):
+        if (
+            attribute.startswith("_")
+            or not inspect.isfunction(function)
+            or inspect.isgeneratorfunction(function)
+        ):
+            continue
+        setattr(cls, attribute, _traced(function, f"{cls.__name__}.{attribute}"))
+    return cls
+
+
+def _traced(function: Callable, name: str) -> Callable:
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if _current_trace.get() is None:
+            return function(*args, **kwargs)
+        with span(name, SERVICE):
+            return function(*args, **kwargs)
+
+    return wrapper
+
+
+class TracedRoute(APIRoute):
+    """
+    Ruta de FastAPI instrumentada: mide su handler como span `controller`
+    y permite perfilar el endpoint bajo demanda (ver profiling).
+    """
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs: Any):
+        super().__init__(path, profiled(endpoint), **kwargs)
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        name = f"{sorted(self.methods)[0]} {self.path}" if self.methods else self.path
+
+        async def traced_handler(request):
+            trace = _current_trace.get()
+            if trace is None:
+                return await handler(request)
+            trace.root.name = name
+            trace.root.attributes["http.route"] = self.path
+            with span(self.name, CONTROLLER):
+                return await handler(request)
+
+        return traced_handler
+
+
+# ============================================
+# EXPORTADORES
+# ============================================
+class SpanExporter:
+    """Escribe trazas muestreadas en formato OTLP/JSON, una por línea"""
+
+    def __init__(self, stream: TextIO, service_name: str):
+        self.stream = stream
+        self.service_name = service_name
+        self._lock = threading.Lock()
+
+    def export(self, trace: Trace) -> None:
+        line = json.dumps(trace.to_otlp(self.service_name), separators=(",", ":"))
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+
+def create_exporter(kind: str, path: str, service_name: str) -> Optional[SpanExporter]:
+    """
+    Crea el exportador configurado.
+
+    Args:
+        kind: "console" (stdout), "file" (`path`) o "none"
+        path: Archivo JSONL para el exportador "file"
+        service_name: Valor de `service.name` en las trazas
+    """
+    if kind == "console":
+        return SpanExporter(sys.stdout, service_name)
+    if kind == "file":
+        return SpanExporter(open(path, "a", encoding="utf-8"), service_name)
+    return None
+
+
+# ============================================
+# MIDDLEWARE
+# ============================================
+class TracingMiddleware:
+    """
+    Middleware ASGI que abre la traza de cada petición, agrega el
+    encabezado Server-Timing y exporta las trazas muestreadas.
+
+    Args:
+        app: Aplicación ASGI
+        sample_rate: Fracción de peticiones cuyos spans se exportan
+        exporter: Destino de las trazas muestreadas (None: no exportar)
+        server_timing: Si se agrega el encabezado Server-Timing
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = 0.0,
+        exporter: Optional[SpanExporter] = None,
+        server_timing: bool = True,
+    ):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.exporter = exporter
+        self.server_timing = server_timing
+
+    def _start_trace(self, scope: Scope) -> Trace:
+        traceparent = None
+        for key, value in scope["headers"]:
+            if key == b"traceparent":
+                traceparent = _TRACEPARENT.match(value.decode("latin-1").strip())
+                break
+        if traceparent:
+            trace_id, parent_id, flags = traceparent.groups()
+            sampled = bool(int(flags, 16) & 1)
+        else:
+            trace_id, parent_id = _new_id(16), None
+            sampled = self.sample_rate > 0 and random.random() < self.sample_rate
+        return Trace(trace_id, parent_id, sampled and self.exporter is not None)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trace = self._start_trace(scope)
+        trace.root.name = scope["method"]
+        trace.root.attributes.update(
+            {"http.method": scope["method"], "http.target": scope["path"]}
+        )
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                trace.root.attributes["http.status_code"] = message["status"]
+                if self.server_timing:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", trace.server_timing())
+            await send(message)
+
+        token = _current_trace.set(trace)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_trace.reset(token)
+            trace.root.end = time.perf_counter()
+            if trace.sampled:
+                try:
+                    self.exporter.export(trace)
+                except Exception as e:  # exportar nunca debe romper la petición
+                    logger.error(f"Error al exportar la traza: {e}")
+
+
+# ============================================
+# OBSERVADORES DE BASE DE DATOS Y CACHÉ
+# ============================================
+def _observe_query(query: QueryEvent) -> None:
+    if _current_trace.get() is None:
+        return
+    record(
+        query.operation,
+        DB,
+        query.duration,
+        **{"db.statement": query.statement[:MAX_STATEMENT_LENGTH]},
+    )
+
+
+class _CacheTracing:
+    """Observador del caché que registra cada operación en la traza"""
+
+    def on_operation(self, operation: str, outcome: str, duration: float) -> None:
+        if _current_trace.get() is not None:
+            record(f"redis.{operation}", CACHE, duration, **{"cache.outcome": outcome})
+
+    def on_lookup(self, hits: int, misses: int) -> None:
+        pass
+
+
+_cache_tracing = _CacheTracing()
+
+
+def install_observers() -> None:
+    """Registra los observadores de base de datos y caché"""
+    add_query_observer(_observe_query)
+    if _cache_tracing not in cache.observers:
+        cache.observers.append(_cache_tracing)
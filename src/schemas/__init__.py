@@ -2,7 +2,13 @@
 Schemas Pydantic para validación de entrada/salida
 """
 from .attendance import AttendanceCreate, AttendanceDetail, AttendanceResponse
-from .event import EventCreate, EventResponse, EventStatistics, EventUpdate
+from .event import (
+    EventCreate,
+    EventDeletionStatus,
+    EventResponse,
+    EventStatistics,
+    EventUpdate,
+)
 from .participant import ParticipantCreate, ParticipantResponse, ParticipantUpdate
 
 __all__ = [
@@ -10,6 +16,7 @@ __all__ = [
     "EventUpdate",
     "EventResponse",
     "EventStatistics",
+    "EventDeletionStatus",
     "ParticipantCreate",
     "ParticipantUpdate",
     "ParticipantResponse",
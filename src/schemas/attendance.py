@@ -2,8 +2,11 @@
 Schemas Pydantic para Asistencias
 """
 from datetime import datetime
+from typing import List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+from src.config.setting import settings
 
 
 class AttendanceCreate(BaseModel):
@@ -50,6 +53,129 @@ class AttendanceResponse(BaseModel):
         }
 
 
+class AttendanceBulkCreate(BaseModel):
+    """
+    Schema para registrar varios participantes a un evento en una sola petición.
+
+    Los IDs repetidos se registran una sola vez.
+    """
+
+    event_id: int = Field(..., gt=0, description="ID del evento al que se registran")
+    participant_ids: List[int] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.ATTENDANCE_BULK_MAX_ITEMS,
+        description="IDs de los participantes que se registran",
+    )
+
+    @field_validator("participant_ids")
+    @classmethod
+    def ids_must_be_positive(cls, value: List[int]) -> List[int]:
+        """Valida que todos los IDs sean positivos"""
+        if any(participant_id <= 0 for participant_id in value):
+            raise ValueError("Los IDs de participante deben ser mayores a 0")
+        return value
+
+    class Config:
+        """Configuración de Pydantic"""
+
+        json_schema_extra = {"example": {"event_id": 1, "participant_ids": [5, 7, 9]}}
+
+
+class AttendanceMultiEventCreate(BaseModel):
+    """
+    Schema para registrar un participante a varios eventos en una transacción.
+
+    - all_or_nothing: si algún evento falla no se registra ninguno
+    - best_effort: se registran los eventos posibles
+    """
+
+    participant_id: int = Field(
+        ..., gt=0, description="ID del participante que se registra"
+    )
+    event_ids: List[int] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.ATTENDANCE_BULK_MAX_ITEMS,
+        description="IDs de los eventos a los que se registra",
+    )
+    mode: Literal["all_or_nothing", "best_effort"] = Field(
+        "all_or_nothing", description="Comportamiento ante fallos parciales"
+    )
+
+    @field_validator("event_ids")
+    @classmethod
+    def ids_must_be_positive(cls, value: List[int]) -> List[int]:
+        """Valida que todos los IDs sean positivos"""
+        if any(event_id <= 0 for event_id in value):
+            raise ValueError("Los IDs de evento deben ser mayores a 0")
+        return value
+
+    class Config:
+        """Configuración de Pydantic"""
+
+        json_schema_extra = {
+            "example": {
+                "participant_id": 5,
+                "event_ids": [1, 2, 3],
+                "mode": "all_or_nothing",
+            }
+        }
+
+
+class AttendanceBulkItem(BaseModel):
+    """
+    Schema con el resultado del registro de un par evento-participante.
+    """
+
+    event_id: int = Field(..., description="ID del evento")
+    participant_id: int = Field(..., description="ID del participante")
+    status: Literal[
+        "created", "duplicate", "not_found", "over_capacity", "skipped"
+    ] = Field(
+        ...,
+        description=(
+            "Resultado del registro; `skipped` indica que no se registró "
+            "porque otro elemento falló en modo all_or_nothing"
+        ),
+    )
+    attendance_id: Optional[int] = Field(None, description="ID de la asistencia creada")
+
+
+class AttendanceBulkResponse(BaseModel):
+    """
+    Schema de respuesta de un registro masivo con el resultado por elemento.
+    """
+
+    created: int = Field(..., description="Número de asistencias creadas")
+    items: List[AttendanceBulkItem] = Field(
+        ..., description="Resultado por participante, en el orden recibido"
+    )
+
+    class Config:
+        """Configuración de Pydantic"""
+
+        json_schema_extra = {
+            "example": {
+                "created": 1,
+                "items": [
+                    {
+                        "event_id": 1,
+                        "participant_id": 5,
+                        "status": "created",
+                        "attendance_id": 42,
+                    },
+                    {
+                        "event_id": 1,
+                        "participant_id": 7,
+                        "status": "duplicate",
+                        "attendance_id": None,
+                    },
+                ],
+            }
+        }
+
+
 class AttendanceDetail(BaseModel):
     """
     Schema detallado de asistencia con información completa.
@@ -62,8 +188,16 @@ class AttendanceDetail(BaseModel):
     event_id: int = Field(..., description="ID del evento")
     event_name: str = Field(..., description="Nombre del evento")
     participant_id: int = Field(..., description="ID del participante")
-    participant_name: str = Field(..., description="Nombre del participante")
-    participant_email: str = Field(..., description="Email del participante")
+    participant_name: Optional[str] = Field(
+        None,
+        description="Nombre del participante (None si se eliminó después de "
+        "archivar el evento)",
+    )
+    participant_email: Optional[str] = Field(
+        None,
+        description="Email del participante (None si se eliminó después de "
+        "archivar el evento)",
+    )
     registered_at: datetime = Field(..., description="Fecha y hora de registro")
 
     class Config:
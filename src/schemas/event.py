@@ -1,8 +1,8 @@
 """
 Schemas Pydantic para Eventos
 """
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -104,6 +104,18 @@ class EventResponse(EventBase):
     available_capacity: Optional[int] = Field(
         None, description="Capacidad disponible actual"
     )
+    archived: bool = Field(
+        False, description="True si el evento se sirve desde el archivo histórico"
+    )
+
+    @field_validator("date")
+    @classmethod
+    def date_must_be_future(cls, v: datetime) -> datetime:
+        """
+        Anula la validación de EventBase: una respuesta puede describir
+        eventos que ya ocurrieron (por ejemplo, eventos archivados).
+        """
+        return v
 
     class Config:
         """Configuración de Pydantic"""
@@ -111,6 +123,31 @@ class EventResponse(EventBase):
         from_attributes = True  # Permite crear desde objetos ORM
 
 
+class EventPartialResponse(BaseModel):
+    """
+    Schema de respuesta parcial para eventos (parámetro `fields=`).
+
+    Todos los campos son opcionales; solo se serializan los pedidos.
+    """
+
+    id: Optional[int] = None
+    name: Optional[str] = None
+    description: Optional[str] = None
+    location: Optional[str] = None
+    date: Optional[datetime] = None
+    capacity: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    available_capacity: Optional[int] = None
+    archived: Optional[bool] = None
+
+
+# Campos seleccionables con `fields=`; los listados omiten por defecto la
+# descripción (columna Text sin límite)
+EVENT_FIELDS = list(EventResponse.model_fields)
+EVENT_LIST_DEFAULT_FIELDS = [field for field in EVENT_FIELDS if field != "description"]
+
+
 class EventStatistics(BaseModel):
     """
     Schema para estadísticas de un evento.
@@ -128,6 +165,9 @@ class EventStatistics(BaseModel):
     occupation_percentage: float = Field(
         ..., description="Porcentaje de ocupación (0-100)"
     )
+    last_registration_at: Optional[datetime] = Field(
+        None, description="Fecha del último registro"
+    )
 
     class Config:
         """Configuración de Pydantic"""
@@ -140,5 +180,66 @@ class EventStatistics(BaseModel):
                 "registered_participants": 75,
                 "available_capacity": 25,
                 "occupation_percentage": 75.0,
+                "last_registration_at": "2024-12-01T09:30:00",
+            }
+        }
+
+
+class EventDailyRegistrations(BaseModel):
+    """
+    Schema para los registros netos de un evento en un día.
+    """
+
+    day: date = Field(..., description="Día de los registros")
+    registrations: int = Field(..., description="Registros del día menos cancelaciones")
+
+    class Config:
+        """Configuración de Pydantic"""
+
+        from_attributes = True
+        json_schema_extra = {"example": {"day": "2024-12-01", "registrations": 12}}
+
+
+class EventDeletionStatus(BaseModel):
+    """
+    Schema para el estado de una eliminación de evento en segundo plano.
+
+    Se usa para eventos con muchas asistencias, donde el borrado se hace
+    por lotes después de responder la petición.
+    """
+
+    event_id: int = Field(..., description="ID del evento")
+    status: Literal["pending", "running", "completed", "failed"] = Field(
+        ..., description="Estado de la eliminación"
+    )
+    deleted_attendances: int = Field(
+        0, description="Asistencias eliminadas hasta el momento"
+    )
+    detail: Optional[str] = Field(None, description="Detalle del error, si lo hay")
+
+    class Config:
+        """Configuración de Pydantic"""
+
+        from_attributes = True  # Permite crear desde objetos ORM
+
+        json_schema_extra = {
+            "example": {
+                "event_id": 1,
+                "status": "running",
+                "deleted_attendances": 15000,
+                "detail": None,
             }
         }
+
+
+class EventArchiveSummary(BaseModel):
+    """
+    Schema con el resultado de una ejecución del archivado de eventos.
+    """
+
+    cutoff: datetime = Field(
+        ..., description="Se archivan eventos anteriores a esta fecha"
+    )
+    batches: int = Field(0, description="Lotes procesados")
+    archived_events: int = Field(0, description="Eventos movidos al archivo")
+    archived_attendances: int = Field(0, description="Asistencias movidas al archivo")
@@ -0,0 +1,62 @@
+"""
+Utilidades para respuestas parciales (parámetro `fields=`).
+
+Permiten que un cliente pida solo algunos campos de un recurso, p. ej.
+`GET /events?fields=id,name,date`. Los campos elegidos se usan tanto para
+limitar las columnas de la consulta SQL (load_only) como para construir
+la respuesta con un schema parcial serializado con exclude_unset.
+"""
+from typing import Any, Iterable, List, Optional, Sequence, Type
+
+from pydantic import BaseModel
+
+from src.exceptions.custom_exceptions import ValidationException
+
+
+def parse_fields(
+    raw: Optional[str], allowed: Sequence[str], default: Optional[Sequence[str]] = None
+) -> List[str]:
+    """
+    Convierte el parámetro `fields` en una lista de campos válidos.
+
+    Args:
+        raw: Valor recibido (campos separados por coma) o None
+        allowed: Campos que el recurso puede retornar
+        default: Campos usados cuando no se envía `fields` (por defecto, todos)
+
+    Raises:
+        ValidationException: Si hay campos desconocidos o la lista está vacía
+    """
+    if raw is None:
+        return list(default if default is not None else allowed)
+    requested = list(dict.fromkeys(f.strip() for f in raw.split(",") if f.strip()))
+    unknown = [field for field in requested if field not in allowed]
+    if unknown or not requested:
+        raise ValidationException(
+            f"Campos inválidos: {', '.join(unknown) or '(vacío)'}. "
+            f"Permitidos: {', '.join(allowed)}"
+        )
+    return requested
+
+
+def model_columns(model, fields: Iterable[str], required: Iterable[str] = ()) -> list:
+    """
+    Columnas del modelo ORM para load_only: los campos pedidos que son
+    columnas más los que se necesitan siempre (p. ej. id, capacity).
+    """
+    columns = model.__table__.columns.keys()
+    names = dict.fromkeys([*required, *fields])
+    return [getattr(model, name) for name in names if name in columns]
+
+
+def to_partial(schema: Type[BaseModel], obj: Any, fields: Iterable[str]) -> BaseModel:
+    """
+    Construye un schema parcial asignando solo los campos pedidos.
+
+    Los campos no asignados se omiten al serializar con exclude_unset,
+    y nunca se leen del objeto (no disparan cargas diferidas). Los campos
+    pedidos que el objeto no tiene también quedan sin asignar.
+    """
+    return schema(
+        **{field: getattr(obj, field) for field in fields if hasattr(obj, field)}
+    )
@@ -3,9 +3,11 @@ Schemas Pydantic para Participantes
 """
 import re
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
+
+from src.config.setting import settings
 
 
 class ParticipantBase(BaseModel):
@@ -155,3 +157,111 @@ class ParticipantResponse(ParticipantBase):
                 "updated_at": "2024-01-15T10:30:00",
             }
         }
+
+
+class ParticipantPartialResponse(BaseModel):
+    """
+    Schema de respuesta parcial para participantes (parámetro `fields=`).
+
+    Todos los campos son opcionales; solo se serializan los pedidos.
+    """
+
+    id: Optional[int] = None
+    name: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+# Campos seleccionables con `fields=`
+PARTICIPANT_FIELDS = list(ParticipantResponse.model_fields)
+
+
+class ParticipantLookup(BaseModel):
+    """
+    Schema para buscar varios participantes por IDs y/o emails.
+    """
+
+    ids: List[int] = Field(
+        default_factory=list,
+        max_length=settings.LOOKUP_MAX_ITEMS,
+        description="IDs de participantes",
+    )
+    emails: List[EmailStr] = Field(
+        default_factory=list,
+        max_length=settings.LOOKUP_MAX_ITEMS,
+        description="Emails de participantes",
+    )
+
+    @model_validator(mode="after")
+    def require_criteria(self) -> "ParticipantLookup":
+        """Valida que se envíe al menos un ID o email"""
+        if not self.ids and not self.emails:
+            raise ValueError("Debe indicar al menos un ID o un email")
+        return self
+
+    class Config:
+        """Configuración de Pydantic"""
+
+        json_schema_extra = {
+            "example": {"ids": [1, 2], "emails": ["juan.perez@example.com"]}
+        }
+
+
+class ParticipantLookupResponse(BaseModel):
+    """
+    Schema de respuesta de una búsqueda de varios participantes.
+    """
+
+    participants: List[ParticipantResponse] = Field(
+        ..., description="Participantes encontrados"
+    )
+    missing_ids: List[int] = Field(
+        default_factory=list, description="IDs sin participante"
+    )
+    missing_emails: List[str] = Field(
+        default_factory=list, description="Emails sin participante"
+    )
+
+
+class ParticipantImportError(BaseModel):
+    """
+    Schema con el error de una fila de una importación de participantes.
+    """
+
+    line: int = Field(..., description="Número de línea en el archivo (desde 1)")
+    error: str = Field(..., description="Descripción del error")
+
+
+class ParticipantImportSummary(BaseModel):
+    """
+    Schema con el resultado de una importación masiva de participantes.
+    """
+
+    processed: int = Field(0, description="Filas leídas (sin contar el encabezado)")
+    created: int = Field(0, description="Participantes creados")
+    updated: int = Field(0, description="Participantes existentes actualizados")
+    duplicates: int = Field(0, description="Filas omitidas por email existente")
+    failed: int = Field(0, description="Filas con errores")
+    errors: List[ParticipantImportError] = Field(
+        default_factory=list, description="Errores por fila (lista acotada)"
+    )
+    errors_truncated: bool = Field(
+        False, description="Indica si hubo más errores de los listados"
+    )
+
+    class Config:
+        """Configuración de Pydantic"""
+
+        json_schema_extra = {
+            "example": {
+                "processed": 3,
+                "created": 1,
+                "updated": 0,
+                "duplicates": 1,
+                "failed": 1,
+                "errors": [{"line": 4, "error": "email: value is not a valid email"}],
+                "errors_truncated": False,
+            }
+        }
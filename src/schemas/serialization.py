@@ -0,0 +1,62 @@
+"""
+Serialización rápida de respuestas JSON.
+
+Cuando un endpoint declara `response_model`, FastAPI vuelve a validar lo
+que retorna el controller (aunque ya sean objetos Pydantic), lo convierte
+a dicts y luego a JSON. Para listados grandes ese doble paso domina el
+tiempo de CPU de la petición.
+
+`model_response` serializa los modelos ya construidos directamente a
+bytes con el serializador de pydantic-core, sin validarlos de nuevo, y
+retorna un Response que FastAPI envía tal cual. El decorador del endpoint
+conserva `response_model` para la documentación OpenAPI.
+"""
+from functools import lru_cache
+from typing import Any, Mapping, Optional
+
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+
+from src.observability.tracing import SERIALIZE, span
+
+
+@lru_cache(maxsize=None)
+def get_adapter(schema: Any) -> TypeAdapter:
+    """
+    TypeAdapter cacheado por tipo (p. ej. `List[AttendanceDetail]`).
+
+    Construir un TypeAdapter compila su esquema de validación y
+    serialización, por lo que se hace una sola vez por tipo.
+    """
+    return TypeAdapter(schema)
+
+
+def dump_json(schema: Any, content: Any, exclude_unset: bool = False) -> bytes:
+    """Serializa `content` (ya del tipo `schema`) a JSON sin validarlo"""
+    with span("dump_json", SERIALIZE):
+        return get_adapter(schema).dump_json(content, exclude_unset=exclude_unset)
+
+
+def model_response(
+    schema: Any,
+    content: Any,
+    status_code: int = 200,
+    exclude_unset: bool = False,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Response:
+    """
+    Construye la respuesta JSON de modelos Pydantic ya construidos.
+
+    Args:
+        schema: Tipo del contenido, p. ej. `List[EventPartialResponse]`
+        content: Modelos (o lista de modelos) a serializar
+        status_code: Código HTTP de la respuesta
+        exclude_unset: Omite los campos no asignados (respuestas parciales)
+        headers: Encabezados adicionales
+    """
+    return Response(
+        content=dump_json(schema, content, exclude_unset),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
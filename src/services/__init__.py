@@ -1,8 +1,20 @@
 """
 Services con la lógica de negocio de la aplicación
 """
+from .archive_service import ArchiveService
 from .attendance_service import AttendanceService
 from .event_service import EventService
+from .export_service import ExportService
+from .participant_import_service import ParticipantImportService
 from .participant_service import ParticipantService
+from .statistics_service import StatisticsService
 
-__all__ = ["EventService", "ParticipantService", "AttendanceService"]
+__all__ = [
+    "EventService",
+    "ParticipantService",
+    "AttendanceService",
+    "ArchiveService",
+    "StatisticsService",
+    "ParticipantImportService",
+    "ExportService",
+]
@@ -0,0 +1,217 @@
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session, load_only
+
+from src.cache.redis_client import cache
+from src.config.setting import settings
+from src.exceptions.custom_exceptions import NotFoundException
+from src.models.archive import ArchivedAttendance, ArchivedEvent
+from src.models.attendance import Attendance
+from src.models.event import Event
+from src.models.participant import Participant
+from src.observability.tracing import traced_service
+from src.schemas.attendance import AttendanceDetail
+from src.schemas.event import EventArchiveSummary, EventStatistics
+from src.schemas.fields import model_columns
+from src.services.statistics_service import StatisticsService
+
+# Columnas copiadas de la tabla activa a la tabla de archivo
+EVENT_ARCHIVE_COLUMNS = [
+    "id",
+    "name",
+    "description",
+    "location",
+    "date",
+    "capacity",
+    "created_at",
+    "updated_at",
+]
+ATTENDANCE_ARCHIVE_COLUMNS = ["id", "event_id", "participant_id", "registered_at"]
+
+
+@traced_service
+class ArchiveService:
+    """Servicio para mover eventos pasados al archivo y consultarlos"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def archive_past_events(
+        self,
+        horizon_days: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        max_batches: Optional[int] = None,
+    ) -> EventArchiveSummary:
+        """
+        Mueve al archivo los eventos anteriores al horizonte configurado.
+
+        Trabaja por lotes acotados: cada lote copia eventos y asistencias con
+        INSERT ... SELECT, los elimina de las tablas activas y confirma.
+        """
+        horizon_days = (
+            settings.ARCHIVE_HORIZON_DAYS if horizon_days is None else horizon_days
+        )
+        batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+        summary = EventArchiveSummary(
+            cutoff=datetime.utcnow() - timedelta(days=horizon_days)
+        )
+
+        while max_batches is None or summary.batches < max_batches:
+            event_ids = [
+                row.id
+                for row in self.db.query(Event.id)
+                .filter(Event.date < summary.cutoff)
+                .order_by(Event.id)
+                .limit(batch_size)
+            ]
+            if not event_ids:
+                break
+            summary.archived_attendances += self._archive_batch(event_ids)
+            summary.archived_events += len(event_ids)
+            summary.batches += 1
+
+        if summary.archived_events:
+            cache.delete_pattern("events:list:*")
+        return summary
+
+    def get_archived_event(
+        self, event_id: int, fields: Optional[List[str]] = None
+    ) -> ArchivedEvent:
+        """Obtiene un evento archivado por ID (con `fields`, solo esas columnas)"""
+        query = self.db.query(ArchivedEvent).filter(ArchivedEvent.id == event_id)
+        if fields is not None:
+            query = query.options(
+                load_only(*model_columns(ArchivedEvent, fields, ("id", "capacity")))
+            )
+        event = query.first()
+        if not event:
+            raise NotFoundException(f"Evento con ID {event_id} no encontrado")
+        return event
+
+    def get_available_capacity(self, event: ArchivedEvent) -> int:
+        """Calcula la capacidad disponible que tenía un evento archivado"""
+        return event.capacity - self._count_attendances(event.id)
+
+    def get_event_statistics(self, event_id: int) -> EventStatistics:
+        """Obtiene las estadísticas finales de un evento archivado"""
+        event = self.get_archived_event(event_id)
+        return StatisticsService.build_event_statistics(
+            event, self._count_attendances(event_id)
+        )
+
+    def get_events_with_counts(
+        self, event_ids: List[int]
+    ) -> List[Tuple[ArchivedEvent, int]]:
+        """
+        Obtiene varios eventos archivados con su número de asistencias.
+
+        Una sola consulta IN con un conteo agrupado.
+        """
+        if not event_ids:
+            return []
+        counts = (
+            select(
+                ArchivedAttendance.event_id,
+                func.count(ArchivedAttendance.id).label("registered"),
+            )
+            .where(ArchivedAttendance.event_id.in_(event_ids))
+            .group_by(ArchivedAttendance.event_id)
+            .subquery()
+        )
+        return [
+            (event, registered)
+            for event, registered in self.db.query(
+                ArchivedEvent, func.coalesce(counts.c.registered, 0)
+            )
+            .outerjoin(counts, counts.c.event_id == ArchivedEvent.id)
+            .filter(ArchivedEvent.id.in_(event_ids))
+        ]
+
+    def get_event_attendances(self, event_id: int) -> List[AttendanceDetail]:
+        """Obtiene los participantes que asistieron a un evento archivado"""
+        self.get_archived_event(event_id)
+        return self._attendance_details(ArchivedAttendance.event_id == event_id)
+
+    def get_participant_attendances(
+        self, participant_id: int
+    ) -> List[AttendanceDetail]:
+        """Obtiene las asistencias archivadas de un participante"""
+        return self._attendance_details(
+            ArchivedAttendance.participant_id == participant_id
+        )
+
+    def _archive_batch(self, event_ids: List[int]) -> int:
+        """Mueve un lote de eventos con sus asistencias en una transacción"""
+        self.db.execute(
+            insert(ArchivedEvent).from_select(
+                EVENT_ARCHIVE_COLUMNS,
+                select(*[getattr(Event, c) for c in EVENT_ARCHIVE_COLUMNS]).where(
+                    Event.id.in_(event_ids)
+                ),
+            )
+        )
+        self.db.execute(
+            insert(ArchivedAttendance).from_select(
+                ATTENDANCE_ARCHIVE_COLUMNS,
+                select(
+                    *[getattr(Attendance, c) for c in ATTENDANCE_ARCHIVE_COLUMNS]
+                ).where(Attendance.event_id.in_(event_ids)),
+            )
+        )
+        moved_attendances = (
+            self.db.query(Attendance)
+            .filter(Attendance.event_id.in_(event_ids))
+            .delete(synchronize_session=False)
+        )
+        self.db.query(Event).filter(Event.id.in_(event_ids)).delete(
+            synchronize_session=False
+        )
+        self.db.commit()
+        cache.delete_many(
+            *[f"event:{event_id}" for event_id in event_ids],
+            *[f"event:stats:{event_id}" for event_id in event_ids],
+            *[f"event:attendances:{event_id}" for event_id in event_ids],
+        )
+        return moved_attendances
+
+    def _count_attendances(self, event_id: int) -> int:
+        """Cuenta las asistencias archivadas de un evento"""
+        return (
+            self.db.query(ArchivedAttendance)
+            .filter(ArchivedAttendance.event_id == event_id)
+            .count()
+        )
+
+    def _attendance_details(self, condition) -> List[AttendanceDetail]:
+        """Consulta asistencias archivadas con datos de evento y participante"""
+        attendances = (
+            self.db.query(
+                ArchivedAttendance.id,
+                ArchivedAttendance.event_id,
+                ArchivedEvent.name.label("event_name"),
+                ArchivedAttendance.participant_id,
+                Participant.name.label("participant_name"),
+                Participant.email.label("participant_email"),
+                ArchivedAttendance.registered_at,
+            )
+            .join(ArchivedEvent, ArchivedAttendance.event_id == ArchivedEvent.id)
+            # El historial sobrevive a los participantes eliminados (sin FK)
+            .outerjoin(Participant, ArchivedAttendance.participant_id == Participant.id)
+            .filter(condition)
+            .all()
+        )
+
+        return [
+            AttendanceDetail(
+                id=a.id,
+                event_id=a.event_id,
+                event_name=a.event_name,
+                participant_id=a.participant_id,
+                participant_name=a.participant_name,
+                participant_email=a.participant_email,
+                registered_at=a.registered_at,
+            )
+            for a in attendances
+        ]
@@ -1,19 +1,49 @@
+from datetime import datetime
 from typing import List
 
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from src.cache.redis_client import cache
+from src.database.dialect import is_unique_violation
 from src.exceptions.custom_exceptions import (
     CapacityExceededException,
     DuplicateRegistrationException,
     NotFoundException,
 )
 from src.models.attendance import Attendance
+from src.models.deletion import ACTIVE_DELETION_STATUSES, EventDeletion
 from src.models.event import Event
 from src.models.participant import Participant
-from src.schemas.attendance import AttendanceCreate, AttendanceDetail
+from src.observability.tracing import traced_service
+from src.schemas.attendance import (
+    AttendanceBulkCreate,
+    AttendanceBulkItem,
+    AttendanceBulkResponse,
+    AttendanceCreate,
+    AttendanceDetail,
+    AttendanceMultiEventCreate,
+)
+from src.services.archive_service import ArchiveService
+from src.services.statistics_service import StatisticsService
+
+
+def _accepts_registrations():
+    """
+    Condición para excluir los eventos con una eliminación en curso.
+
+    Sus asistencias se borran por lotes: un registro aceptado durante el
+    borrado quedaría huérfano o haría fallar la eliminación del evento.
+    """
+    return Event.id.not_in(
+        select(EventDeletion.event_id).where(
+            EventDeletion.status.in_(ACTIVE_DELETION_STATUSES)
+        )
+    )
 
 
+@traced_service
 class AttendanceService:
     """Servicio de lógica de negocio para asistencias"""
 
@@ -25,7 +55,11 @@ class AttendanceService:
         event_id = attendance_data.event_id
         participant_id = attendance_data.participant_id
 
-        event = self.db.query(Event).filter(Event.id == event_id).first()
+        event = (
+            self.db.query(Event)
+            .filter(Event.id == event_id, _accepts_registrations())
+            .first()
+        )
         if not event:
             raise NotFoundException(f"Evento con ID {event_id} no encontrado")
 
@@ -36,38 +70,276 @@ class AttendanceService:
             raise NotFoundException(
                 f"Participante con ID {participant_id} no encontrado"
             )
-        existing = (
-            self.db.query(Attendance)
-            .filter(
-                Attendance.event_id == event_id,
-                Attendance.participant_id == participant_id,
-            )
-            .first()
-        )
-        if existing:
-            raise DuplicateRegistrationException(
-                f"El participante {participant.name} ya está registrado "
-                f"en el evento {event.name}"
-            )
 
-        registered_count = (
-            self.db.query(Attendance).filter(Attendance.event_id == event_id).count()
-        )
-        if registered_count >= event.capacity:
-            raise CapacityExceededException(
-                f"El evento {event.name} ha alcanzado su capacidad máxima "
-                f"({event.capacity} participantes)"
-            )
+        # Un flush fallido expira los objetos de la sesión: conservar los
+        # datos necesarios para los mensajes de error
+        event_name, event_capacity = event.name, event.capacity
+        participant_name = participant.name
 
+        # Insertar primero: la restricción unique_event_participant detecta
+        # duplicados sin un SELECT previo y sin ventana de carrera
         attendance = Attendance(event_id=event_id, participant_id=participant_id)
         self.db.add(attendance)
+        try:
+            self.db.flush()
+        except IntegrityError as e:
+            self.db.rollback()
+            if is_unique_violation(e):
+                raise DuplicateRegistrationException(
+                    f"El participante {participant_name} ya está registrado "
+                    f"en el evento {event_name}"
+                )
+            raise
+
+        # El UPDATE condicional sobre event_statistics bloquea la fila del
+        # evento: la verificación de capacidad es atómica
+        if not StatisticsService(self.db).record_registration(
+            event_id, event_capacity, attendance.registered_at
+        ):
+            self.db.rollback()
+            raise CapacityExceededException(
+                f"El evento {event_name} ha alcanzado su capacidad máxima "
+                f"({event_capacity} participantes)"
+            )
+
         self.db.commit()
-        self.db.refresh(attendance)
         cache.delete(f"event:stats:{event_id}")
         cache.delete(f"event:attendances:{event_id}")
         cache.delete(f"participant:attendances:{participant_id}")
         return attendance
 
+    def register_attendances_bulk(
+        self, bulk_data: AttendanceBulkCreate
+    ) -> AttendanceBulkResponse:
+        """
+        Registra varios participantes a un evento en una sola transacción.
+
+        Usa un número fijo de consultas sin importar el tamaño del grupo:
+        bloqueo de la fila de estadísticas, existencia de participantes y
+        duplicados con IN (leídos bajo el bloqueo) y un único INSERT
+        multi-fila. Cuando no hay cupo para todos, se registran en el orden
+        recibido hasta completar la capacidad.
+        """
+        event_id = bulk_data.event_id
+        participant_ids = list(dict.fromkeys(bulk_data.participant_ids))
+
+        event = (
+            self.db.query(Event)
+            .filter(Event.id == event_id, _accepts_registrations())
+            .first()
+        )
+        if not event:
+            raise NotFoundException(f"Evento con ID {event_id} no encontrado")
+        event_name, event_capacity = event.name, event.capacity
+
+        # Bloquear antes de leer los duplicados: un registro concurrente al
+        # evento termina antes de la lectura y aparece como `duplicate`
+        statistics = StatisticsService(self.db)
+        statistic = statistics.lock_statistics([event_id])[event_id]
+        found = {
+            row.id
+            for row in self.db.query(Participant.id).filter(
+                Participant.id.in_(participant_ids)
+            )
+        }
+        registered = {
+            row.participant_id
+            for row in self.db.query(Attendance.participant_id).filter(
+                Attendance.event_id == event_id,
+                Attendance.participant_id.in_(participant_ids),
+            )
+        }
+        available = max(event_capacity - statistic.registered_count, 0)
+        candidates = [
+            participant_id
+            for participant_id in participant_ids
+            if participant_id in found and participant_id not in registered
+        ]
+        accepted = candidates[:available]
+
+        created = {}
+        if accepted:
+            registered_at = datetime.utcnow()
+            try:
+                self.db.execute(
+                    insert(Attendance).values(
+                        [
+                            {
+                                "event_id": event_id,
+                                "participant_id": participant_id,
+                                "registered_at": registered_at,
+                            }
+                            for participant_id in accepted
+                        ]
+                    )
+                )
+            except IntegrityError as e:
+                self.db.rollback()
+                if is_unique_violation(e):
+                    raise DuplicateRegistrationException(
+                        f"Otro registro concurrente al evento {event_name} "
+                        f"modificó los participantes, intente de nuevo"
+                    )
+                raise
+            statistics.record_registration(
+                event_id, event_capacity, registered_at, seats=len(accepted)
+            )
+            created = {
+                row.participant_id: row.id
+                for row in self.db.query(
+                    Attendance.id, Attendance.participant_id
+                ).filter(
+                    Attendance.event_id == event_id,
+                    Attendance.participant_id.in_(accepted),
+                )
+            }
+
+        # Confirma también sin registros para liberar el bloqueo
+        self.db.commit()
+        if accepted:
+            cache.delete_many(
+                f"event:stats:{event_id}",
+                f"event:attendances:{event_id}",
+                *[f"participant:attendances:{pid}" for pid in accepted],
+            )
+
+        items = []
+        for participant_id in participant_ids:
+            if participant_id not in found:
+                status = "not_found"
+            elif participant_id in registered:
+                status = "duplicate"
+            elif participant_id in created:
+                status = "created"
+            else:
+                status = "over_capacity"
+            items.append(
+                AttendanceBulkItem(
+                    event_id=event_id,
+                    participant_id=participant_id,
+                    status=status,
+                    attendance_id=created.get(participant_id),
+                )
+            )
+        return AttendanceBulkResponse(created=len(created), items=items)
+
+    def register_attendance_multi_event(
+        self, multi_data: AttendanceMultiEventCreate
+    ) -> AttendanceBulkResponse:
+        """
+        Registra un participante a varios eventos en una sola transacción.
+
+        La existencia de los eventos, los duplicados y la capacidad se
+        verifican para todo el conjunto con consultas IN y un solo UPDATE
+        condicional sobre las filas de estadísticas bloqueadas. En modo
+        all_or_nothing, cualquier fallo revierte la transacción completa y
+        los eventos que sí tenían cupo se reportan como `skipped`.
+        """
+        participant_id = multi_data.participant_id
+        event_ids = list(dict.fromkeys(multi_data.event_ids))
+        all_or_nothing = multi_data.mode == "all_or_nothing"
+
+        participant = (
+            self.db.query(Participant).filter(Participant.id == participant_id).first()
+        )
+        if not participant:
+            raise NotFoundException(
+                f"Participante con ID {participant_id} no encontrado"
+            )
+
+        capacities = {
+            row.id: row.capacity
+            for row in self.db.query(Event.id, Event.capacity).filter(
+                Event.id.in_(event_ids), _accepts_registrations()
+            )
+        }
+        # Bloquear antes de leer los duplicados: un registro concurrente en
+        # alguno de los eventos termina antes de la lectura
+        statistics = StatisticsService(self.db)
+        locked = statistics.lock_statistics(list(capacities))
+        registered = {
+            row.event_id
+            for row in self.db.query(Attendance.event_id).filter(
+                Attendance.participant_id == participant_id,
+                Attendance.event_id.in_(event_ids),
+            )
+        }
+        statuses = {}
+        for event_id in event_ids:
+            if event_id not in capacities:
+                statuses[event_id] = "not_found"
+            elif event_id in registered:
+                statuses[event_id] = "duplicate"
+            elif locked[event_id].registered_count >= capacities[event_id]:
+                statuses[event_id] = "over_capacity"
+            else:
+                statuses[event_id] = "created"
+        accepted = [e for e in event_ids if statuses[e] == "created"]
+
+        if all_or_nothing and len(accepted) < len(event_ids):
+            accepted = []
+        created = {}
+        if accepted:
+            registered_at = datetime.utcnow()
+            if statistics.record_registrations(accepted, registered_at) < len(accepted):
+                self.db.rollback()
+                raise CapacityExceededException(
+                    "Uno de los eventos alcanzó su capacidad máxima durante "
+                    "el registro, intente de nuevo"
+                )
+            try:
+                self.db.execute(
+                    insert(Attendance).values(
+                        [
+                            {
+                                "event_id": event_id,
+                                "participant_id": participant_id,
+                                "registered_at": registered_at,
+                            }
+                            for event_id in accepted
+                        ]
+                    )
+                )
+            except IntegrityError as e:
+                self.db.rollback()
+                if is_unique_violation(e):
+                    raise DuplicateRegistrationException(
+                        f"Otro registro concurrente del participante "
+                        f"{participant_id} modificó sus eventos, intente de nuevo"
+                    )
+                raise
+            created = {
+                row.event_id: row.id
+                for row in self.db.query(Attendance.id, Attendance.event_id).filter(
+                    Attendance.participant_id == participant_id,
+                    Attendance.event_id.in_(accepted),
+                )
+            }
+
+        # Confirma también sin registros para liberar el bloqueo
+        self.db.commit()
+        if accepted:
+            cache.delete_many(
+                f"participant:attendances:{participant_id}",
+                *[f"event:stats:{event_id}" for event_id in accepted],
+                *[f"event:attendances:{event_id}" for event_id in accepted],
+            )
+
+        items = [
+            AttendanceBulkItem(
+                event_id=event_id,
+                participant_id=participant_id,
+                status=(
+                    "skipped"
+                    if statuses[event_id] == "created" and event_id not in created
+                    else statuses[event_id]
+                ),
+                attendance_id=created.get(event_id),
+            )
+            for event_id in event_ids
+        ]
+        return AttendanceBulkResponse(created=len(created), items=items)
+
     def cancel_attendance(self, attendance_id: int) -> bool:
         """Cancela una asistencia"""
         attendance = (
@@ -78,6 +350,9 @@ class AttendanceService:
 
         event_id = attendance.event_id
         participant_id = attendance.participant_id
+        StatisticsService(self.db).record_cancellations(
+            [(event_id, attendance.registered_at)]
+        )
         self.db.delete(attendance)
         self.db.commit()
         cache.delete(f"event:stats:{event_id}")
@@ -89,7 +364,7 @@ class AttendanceService:
         """Obtiene todos los participantes registrados en un evento"""
         event = self.db.query(Event).filter(Event.id == event_id).first()
         if not event:
-            raise NotFoundException(f"Evento con ID {event_id} no encontrado")
+            return ArchiveService(self.db).get_event_attendances(event_id)
 
         attendances = (
             self.db.query(
@@ -121,9 +396,13 @@ class AttendanceService:
         ]
 
     def get_participant_attendances(
-        self, participant_id: int
+        self, participant_id: int, include_archived: bool = False
     ) -> List[AttendanceDetail]:
-        """Obtiene todos los eventos en los que está registrado un participante"""
+        """
+        Obtiene todos los eventos en los que está registrado un participante.
+
+        Con include_archived=True también incluye eventos ya archivados.
+        """
         participant = (
             self.db.query(Participant).filter(Participant.id == participant_id).first()
         )
@@ -148,7 +427,7 @@ class AttendanceService:
             .all()
         )
 
-        return [
+        details = [
             AttendanceDetail(
                 id=a.id,
                 event_id=a.event_id,
@@ -160,3 +439,8 @@ class AttendanceService:
             )
             for a in attendances
         ]
+        if include_archived:
+            details.extend(
+                ArchiveService(self.db).get_participant_attendances(participant_id)
+            )
+        return details
@@ -1,14 +1,36 @@
-from typing import List
+import logging
+from typing import List, Optional, Tuple, Union
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 
 from src.cache.redis_client import cache
+from src.config.setting import settings
 from src.exceptions.custom_exceptions import NotFoundException
+from src.models.archive import ArchivedEvent
 from src.models.attendance import Attendance
+from src.models.deletion import EventDeletion
 from src.models.event import Event
-from src.schemas.event import EventCreate, EventStatistics, EventUpdate
+from src.models.statistics import EventDailyRegistration, EventStatistic
+from src.observability.tracing import traced_service
+from src.schemas.event import (
+    EventCreate,
+    EventDeletionStatus,
+    EventResponse,
+    EventStatistics,
+    EventUpdate,
+)
+from src.schemas.fields import model_columns
+from src.services.archive_service import ArchiveService
+from src.services.statistics_service import StatisticsService
 
+logger = logging.getLogger(__name__)
 
+# Columnas que se cargan siempre con `fields=`: capacity se usa para
+# calcular la capacidad disponible
+REQUIRED = ("id", "capacity")
+
+
+@traced_service
 class EventService:
     """Servicio de lógica de negocio para eventos"""
 
@@ -19,8 +41,9 @@ class EventService:
         """Crea un nuevo evento"""
         event = Event(**event_data.model_dump())
         self.db.add(event)
+        self.db.flush()
+        StatisticsService(self.db).initialize_event(event.id)
         self.db.commit()
-        self.db.refresh(event)
         cache.delete_pattern("events:list:*")
         return event
 
@@ -31,9 +54,99 @@ class EventService:
             raise NotFoundException(f"Evento con ID {event_id} no encontrado")
         return event
 
-    def get_all_events(self, skip: int = 0, limit: int = 100) -> List[Event]:
-        """Obtiene todos los eventos con paginación"""
-        return self.db.query(Event).offset(skip).limit(limit).all()
+    def get_event_detail(
+        self, event_id: int, fields: Optional[List[str]] = None
+    ) -> Union[Event, ArchivedEvent]:
+        """
+        Obtiene un evento por ID con su capacidad disponible.
+
+        Si el evento ya no está en la tabla activa, recurre al archivo.
+        Con `fields` solo se cargan esas columnas (más id y capacity).
+        """
+        query = self.db.query(Event).filter(Event.id == event_id)
+        if fields is not None:
+            query = query.options(load_only(*model_columns(Event, fields, REQUIRED)))
+        event = query.first()
+        if event:
+            event.available_capacity = event.capacity - self._count_attendances(
+                event_id
+            )
+            return event
+
+        archive = ArchiveService(self.db)
+        archived_event = archive.get_archived_event(event_id, fields)
+        archived_event.available_capacity = archive.get_available_capacity(
+            archived_event
+        )
+        return archived_event
+
+    def get_all_events(
+        self, skip: int = 0, limit: int = 100, fields: Optional[List[str]] = None
+    ) -> List[Event]:
+        """
+        Obtiene todos los eventos con paginación y su capacidad disponible.
+
+        La capacidad sale de la misma consulta (JOIN con event_statistics),
+        sin consultas adicionales por evento. Con `fields` solo se cargan
+        esas columnas (más id y capacity).
+        """
+        query = self._query_with_statistics()
+        if fields is not None:
+            query = query.options(load_only(*model_columns(Event, fields, REQUIRED)))
+        rows = query.offset(skip).limit(limit).all()
+        events = []
+        for event, statistic in self._fill_missing_statistics(rows):
+            event.available_capacity = event.capacity - statistic.registered_count
+            events.append(event)
+        return events
+
+    def get_events_by_ids(self, event_ids: List[int]) -> List[EventResponse]:
+        """
+        Obtiene varios eventos (activos o archivados) por ID.
+
+        Lee primero el caché con un solo MGET; los faltantes se consultan
+        con un IN sobre eventos activos y otro sobre el archivo. Los IDs
+        inexistentes se omiten; el orden es el de los IDs recibidos.
+        """
+        event_ids = list(dict.fromkeys(event_ids))
+        cached = cache.get_many(
+            [f"event:{event_id}" for event_id in event_ids]
+            + [f"event:stats:{event_id}" for event_id in event_ids]
+        )
+        found = {}
+        for event_id, data, stats in zip(
+            event_ids, cached[: len(event_ids)], cached[len(event_ids) :]
+        ):
+            if data and stats:
+                found[event_id] = EventResponse(
+                    **data, available_capacity=stats["available_capacity"]
+                )
+
+        missing = [event_id for event_id in event_ids if event_id not in found]
+        if missing:
+            rows = self._query_with_statistics().filter(Event.id.in_(missing)).all()
+            to_cache = {}
+            for event, statistic in self._fill_missing_statistics(rows):
+                statistics = StatisticsService.build_event_statistics(
+                    event, statistic.registered_count, statistic.last_registration_at
+                )
+                event.available_capacity = statistics.available_capacity
+                response = EventResponse.model_validate(event)
+                found[event.id] = response
+                to_cache[f"event:{event.id}"] = response.model_dump(
+                    mode="json", exclude={"available_capacity"}
+                )
+                to_cache[f"event:stats:{event.id}"] = statistics.model_dump(mode="json")
+            cache.set_many(to_cache)
+
+            archived = ArchiveService(self.db).get_events_with_counts(
+                [event_id for event_id in missing if event_id not in found]
+            )
+            for event, registered in archived:
+                event.available_capacity = event.capacity - registered
+                found[event.id] = EventResponse.model_validate(event)
+
+        return [found[event_id] for event_id in event_ids if event_id in found]
 
     def update_event(self, event_id: int, event_data: EventUpdate) -> Event:
         """Actualiza un evento"""
@@ -42,41 +155,193 @@ class EventService:
         for key, value in update_data.items():
             setattr(event, key, value)
         self.db.commit()
-        self.db.refresh(event)
-        cache.delete(f"event:{event_id}")
+        # La capacidad forma parte de las estadísticas cacheadas
+        cache.delete_many(f"event:{event_id}", f"event:stats:{event_id}")
         cache.delete_pattern("events:list:*")
         return event
 
     def delete_event(self, event_id: int) -> bool:
-        """Elimina un evento"""
+        """Elimina un evento y sus asistencias sin cargarlas en la sesión"""
         event = self.get_event(event_id)
+        # DELETE masivo explícito: también cubre tablas creadas antes de que
+        # la clave foránea tuviera ON DELETE CASCADE
+        self.db.query(Attendance).filter(Attendance.event_id == event_id).delete(
+            synchronize_session=False
+        )
         self.db.delete(event)
         self.db.commit()
-        cache.delete(f"event:{event_id}")
-        cache.delete_pattern("events:list:*")
+        self._invalidate_event_cache(event_id)
         return True
 
+    def schedule_event_deletion(self, event_id: int) -> EventDeletionStatus:
+        """
+        Registra una eliminación en segundo plano como pendiente.
+
+        El estado se confirma en la base de datos antes de responder: desde
+        ese momento el evento deja de admitir registros.
+        """
+        self.get_event(event_id)
+        deletion = self.db.get(EventDeletion, event_id) or EventDeletion(
+            event_id=event_id
+        )
+        deletion.status = "pending"
+        deletion.deleted_attendances = 0
+        deletion.detail = None
+        self.db.add(deletion)
+        self.db.commit()
+        return EventDeletionStatus.model_validate(deletion)
+
+    def delete_event_in_batches(
+        self, event_id: int, batch_size: Optional[int] = None
+    ) -> EventDeletionStatus:
+        """
+        Elimina un evento borrando sus asistencias por lotes.
+
+        Cada lote se confirma en su propia transacción, junto con el progreso
+        de la eliminación, para no mantener bloqueos largos ni un único
+        DELETE gigante sobre eventos enormes.
+        """
+        batch_size = batch_size or settings.EVENT_DELETE_BATCH_SIZE
+        deletion = self.db.get(EventDeletion, event_id) or EventDeletion(
+            event_id=event_id, deleted_attendances=0
+        )
+        deletion.status = "running"
+        self.db.add(deletion)
+        self.db.commit()
+        try:
+            while True:
+                ids = [
+                    row.id
+                    for row in self.db.query(Attendance.id)
+                    .filter(Attendance.event_id == event_id)
+                    .limit(batch_size)
+                ]
+                if not ids:
+                    break
+                self.db.query(Attendance).filter(Attendance.id.in_(ids)).delete(
+                    synchronize_session=False
+                )
+                deletion.deleted_attendances += len(ids)
+                self.db.commit()
+
+            self.db.query(Event).filter(Event.id == event_id).delete(
+                synchronize_session=False
+            )
+            deletion.status = "completed"
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.exception(f"Error al eliminar el evento {event_id} por lotes")
+            deletion.status = "failed"
+            deletion.detail = str(e)
+            self.db.commit()
+            return EventDeletionStatus.model_validate(deletion)
+
+        self._invalidate_event_cache(event_id)
+        return EventDeletionStatus.model_validate(deletion)
+
+    def get_deletion_status(self, event_id: int) -> EventDeletionStatus:
+        """Obtiene el estado de la eliminación en segundo plano de un evento"""
+        deletion = self.db.get(EventDeletion, event_id)
+        if deletion is None:
+            raise NotFoundException(
+                f"No hay una eliminación registrada para el evento {event_id}"
+            )
+        return EventDeletionStatus.model_validate(deletion)
+
     def get_available_capacity(self, event_id: int) -> int:
         """Calcula la capacidad disponible de un evento"""
         event = self.get_event(event_id)
-        registered = (
-            self.db.query(Attendance).filter(Attendance.event_id == event_id).count()
-        )
-        return event.capacity - registered
+        return event.capacity - self._count_attendances(event_id)
 
     def get_event_statistics(self, event_id: int) -> EventStatistics:
-        """Obtiene estadísticas de un evento"""
-        event = self.get_event(event_id)
-        registered = (
-            self.db.query(Attendance).filter(Attendance.event_id == event_id).count()
+        """
+        Obtiene estadísticas de un evento (activo o archivado).
+
+        Para eventos activos lee una sola fila de event_statistics junto
+        al evento, sin contar asistencias.
+        """
+        row = self._query_with_statistics().filter(Event.id == event_id).first()
+        if not row:
+            return ArchiveService(self.db).get_event_statistics(event_id)
+        [(event, statistic)] = self._fill_missing_statistics([row])
+        return StatisticsService.build_event_statistics(
+            event, statistic.registered_count, statistic.last_registration_at
+        )
+
+    def get_statistics_by_ids(self, event_ids: List[int]) -> List[EventStatistics]:
+        """
+        Obtiene las estadísticas de varios eventos (activos o archivados).
+
+        Lee primero el caché con un solo MGET; los faltantes se consultan
+        con un IN sobre eventos activos y otro sobre el archivo.
+        """
+        event_ids = list(dict.fromkeys(event_ids))
+        cached = cache.get_many([f"event:stats:{event_id}" for event_id in event_ids])
+        found = {
+            event_id: EventStatistics(**data)
+            for event_id, data in zip(event_ids, cached)
+            if data
+        }
+
+        missing = [event_id for event_id in event_ids if event_id not in found]
+        if missing:
+            rows = self._query_with_statistics().filter(Event.id.in_(missing)).all()
+            for event, statistic in self._fill_missing_statistics(rows):
+                found[event.id] = StatisticsService.build_event_statistics(
+                    event, statistic.registered_count, statistic.last_registration_at
+                )
+            cache.set_many(
+                {
+                    f"event:stats:{event_id}": found[event_id].model_dump(mode="json")
+                    for event_id in missing
+                    if event_id in found
+                }
+            )
+
+            archived = ArchiveService(self.db).get_events_with_counts(
+                [event_id for event_id in missing if event_id not in found]
+            )
+            for event, registered in archived:
+                found[event.id] = StatisticsService.build_event_statistics(
+                    event, registered
+                )
+
+        return [found[event_id] for event_id in event_ids if event_id in found]
+
+    def get_daily_registrations(self, event_id: int) -> List[EventDailyRegistration]:
+        """Obtiene los registros netos por día de un evento activo"""
+        self.get_event(event_id)
+        return StatisticsService(self.db).get_daily_registrations(event_id)
+
+    def _query_with_statistics(self):
+        """Consulta de eventos junto a su fila de estadísticas (LEFT JOIN)"""
+        return self.db.query(Event, EventStatistic).outerjoin(
+            EventStatistic, EventStatistic.event_id == Event.id
         )
-        available = event.capacity - registered
-        occupation = (registered / event.capacity) * 100 if event.capacity > 0 else 0
-        return EventStatistics(
-            event_id=event.id,
-            event_name=event.name,
-            total_capacity=event.capacity,
-            registered_participants=registered,
-            available_capacity=available,
-            occupation_percentage=round(occupation, 2),
+
+    def _fill_missing_statistics(
+        self, rows: List[Tuple[Event, Optional[EventStatistic]]]
+    ) -> List[Tuple[Event, EventStatistic]]:
+        """
+        Calcula en un solo lote las estadísticas de los eventos sin fila en
+        la proyección, sin guardarlas: las lecturas no hacen commit.
+        """
+        missing = [event.id for event, statistic in rows if statistic is None]
+        if not missing:
+            return rows
+        computed = StatisticsService(self.db).compute(missing)
+        return [(event, statistic or computed[event.id]) for event, statistic in rows]
+
+    def _count_attendances(self, event_id: int) -> int:
+        """Número de asistencias de un evento según la proyección de estadísticas"""
+        return StatisticsService(self.db).get_registered_count(event_id)
+
+    def _invalidate_event_cache(self, event_id: int) -> None:
+        """Invalida las claves de caché asociadas a un evento"""
+        cache.delete_many(
+            f"event:{event_id}",
+            f"event:stats:{event_id}",
+            f"event:attendances:{event_id}",
         )
+        cache.delete_pattern("events:list:*")
@@ -0,0 +1,148 @@
+import csv
+import io
+import json
+import zlib
+from datetime import date, datetime
+from typing import Callable, Iterator, List, Literal, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.config.setting import settings
+from src.database.connection import SessionLocal
+from src.models.attendance import Attendance
+from src.models.participant import Participant
+
+ExportFormat = Literal["csv", "ndjson"]
+
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+ATTENDEE_COLUMNS = [
+    "attendance_id",
+    "participant_id",
+    "name",
+    "email",
+    "phone",
+    "registered_at",
+]
+PARTICIPANT_COLUMNS = ["id", "name", "email", "phone", "created_at", "updated_at"]
+
+
+class ExportService:
+    """
+    Servicio para exportar listados grandes en streaming.
+
+    Las filas se leen con yield_per (cursor del lado del servidor donde el
+    driver lo soporta) y se codifican por bloques, de modo que la memoria
+    no crece con el tamaño del listado y el primer byte sale antes de que
+    termine la consulta.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def stream_event_attendees(
+        self, event_id: int, export_format: ExportFormat, compress: bool = False
+    ) -> Iterator[bytes]:
+        """Exporta los participantes registrados en un evento"""
+        statement = (
+            select(
+                Attendance.id.label("attendance_id"),
+                Attendance.participant_id,
+                Participant.name,
+                Participant.email,
+                Participant.phone,
+                Attendance.registered_at,
+            )
+            .join(Participant, Attendance.participant_id == Participant.id)
+            .where(Attendance.event_id == event_id)
+            .order_by(Attendance.id)
+        )
+        return self._stream(statement, ATTENDEE_COLUMNS, export_format, compress)
+
+    def stream_participants(
+        self, export_format: ExportFormat, compress: bool = False
+    ) -> Iterator[bytes]:
+        """Exporta todos los participantes"""
+        statement = select(
+            *[getattr(Participant, column) for column in PARTICIPANT_COLUMNS]
+        ).order_by(Participant.id)
+        return self._stream(statement, PARTICIPANT_COLUMNS, export_format, compress)
+
+    def _stream(
+        self,
+        statement,
+        columns: List[str],
+        export_format: ExportFormat,
+        compress: bool,
+    ) -> Iterator[bytes]:
+        """Ejecuta la consulta por bloques y codifica cada bloque"""
+        encode = _encode_csv if export_format == "csv" else _encode_ndjson
+        # wbits=31: formato gzip. Z_SYNC_FLUSH por bloque para que el
+        # cliente reciba datos a medida que se generan
+        compressor = zlib.compressobj(wbits=31) if compress else None
+
+        def emit(data: bytes) -> bytes:
+            if compressor is None:
+                return data
+            return compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+        if export_format == "csv":
+            yield emit(_encode_csv(columns, [columns]))
+
+        result = self.db.execute(
+            statement.execution_options(yield_per=settings.EXPORT_CHUNK_SIZE)
+        )
+        for partition in result.partitions():
+            yield emit(encode(columns, partition))
+
+        if compressor is not None:
+            yield compressor.flush()
+
+
+def stream_with_own_session(
+    bind, produce: Callable[[ExportService], Iterator[bytes]]
+) -> Iterator[bytes]:
+    """
+    Ejecuta una exportación con una sesión propia.
+
+    La sesión de la petición se cierra antes de enviar el cuerpo de un
+    StreamingResponse, por lo que el generador abre y cierra la suya.
+    """
+    db = SessionLocal(bind=bind)
+    try:
+        yield from produce(ExportService(db))
+    finally:
+        db.close()
+
+
+def export_filename(base: str, export_format: ExportFormat, compress: bool) -> str:
+    """Nombre de archivo sugerido para la descarga"""
+    return f"{base}.{export_format}" + (".gz" if compress else "")
+
+
+def _encode_csv(columns: List[str], rows: Sequence) -> bytes:
+    """Codifica un bloque de filas como CSV"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerows([_format_value(value) for value in row] for row in rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _encode_ndjson(columns: List[str], rows: Sequence) -> bytes:
+    """Codifica un bloque de filas como un objeto JSON por línea"""
+    return "".join(
+        json.dumps(dict(zip(columns, row)), default=_format_value, ensure_ascii=False)
+        + "\n"
+        for row in rows
+    ).encode("utf-8")
+
+
+def _format_value(value):
+    """Convierte fechas a ISO 8601 y None a cadena vacía (CSV)"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return "" if value is None else value
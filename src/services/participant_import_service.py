@@ -0,0 +1,295 @@
+import codecs
+import csv
+import json
+from datetime import datetime
+from typing import AsyncIterator, List, Literal, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from src.cache.redis_client import cache
+from src.config.setting import settings
+from src.database.dialect import insert_ignore, upsert
+from src.exceptions.custom_exceptions import EventiaException, ValidationException
+from src.models.participant import Participant
+from src.schemas.participant import (
+    ParticipantCreate,
+    ParticipantImportError,
+    ParticipantImportSummary,
+)
+
+ImportFormat = Literal["csv", "ndjson"]
+
+# (número de línea, fila, error): exactamente uno de fila o error es None
+ParsedRow = Tuple[int, Optional[dict], Optional[str]]
+
+CSV_REQUIRED_COLUMNS = {"name", "email"}
+
+
+class ParticipantImportService:
+    """
+    Servicio para importar participantes desde un flujo CSV o NDJSON.
+
+    El cuerpo se procesa de forma incremental: solo se mantiene en memoria
+    el lote en curso, por lo que el consumo no depende del tamaño del archivo.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    async def import_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        import_format: ImportFormat,
+        on_duplicate: Literal["skip", "update"] = "skip",
+        batch_size: Optional[int] = None,
+    ) -> ParticipantImportSummary:
+        """
+        Valida cada fila con ParticipantCreate y escribe por lotes.
+
+        Args:
+            chunks: Cuerpo de la petición en fragmentos de bytes
+            import_format: "csv" (con encabezado) o "ndjson"
+            on_duplicate: "skip" omite emails existentes, "update"
+                actualiza nombre y teléfono
+            batch_size: Filas por transacción (PARTICIPANT_IMPORT_BATCH_SIZE)
+        """
+        batch_size = batch_size or settings.PARTICIPANT_IMPORT_BATCH_SIZE
+        rows = (
+            iter_csv_rows(chunks)
+            if import_format == "csv"
+            else iter_ndjson_rows(chunks)
+        )
+        summary = ParticipantImportSummary()
+        batch: List[ParticipantCreate] = []
+
+        async for line, row, error in rows:
+            summary.processed += 1
+            if error is None:
+                try:
+                    batch.append(ParticipantCreate.model_validate(row))
+                except ValidationError as e:
+                    error = _format_validation_error(e)
+            if error is not None:
+                _add_error(summary, line, error)
+                continue
+            if len(batch) >= batch_size:
+                # La sesión es síncrona: escribir fuera del event loop
+                await run_in_threadpool(self._write_batch, batch, on_duplicate, summary)
+                batch = []
+
+        if batch:
+            await run_in_threadpool(self._write_batch, batch, on_duplicate, summary)
+        if summary.created or summary.updated:
+            cache.delete_pattern("participants:list:*")
+        return summary
+
+    def _write_batch(
+        self,
+        batch: List[ParticipantCreate],
+        on_duplicate: str,
+        summary: ParticipantImportSummary,
+    ) -> None:
+        """Escribe un lote con una consulta de existentes y un INSERT multi-fila"""
+        unique = {}
+        for participant in batch:
+            if participant.email in unique:
+                summary.duplicates += 1
+            else:
+                unique[participant.email] = participant
+
+        existing = {
+            row.email: row.id
+            for row in self.db.query(Participant.id, Participant.email).filter(
+                Participant.email.in_(list(unique))
+            )
+        }
+        now = datetime.utcnow()
+        rows = [
+            {
+                "name": participant.name,
+                "email": participant.email,
+                "phone": participant.phone,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for participant in unique.values()
+        ]
+
+        if on_duplicate == "update":
+            upsert(
+                self.db,
+                Participant,
+                rows,
+                ["email"],
+                lambda new: {
+                    "name": new.name,
+                    "phone": new.phone,
+                    "updated_at": new.updated_at,
+                },
+            )
+            summary.created += len(rows) - len(existing)
+            summary.updated += len(existing)
+        else:
+            # ON CONFLICT cubre emails insertados por otra petición después
+            # de la consulta de existentes; esos cuentan como duplicados
+            new_rows = [row for row in rows if row["email"] not in existing]
+            inserted = insert_ignore(self.db, Participant, new_rows, ["email"])
+            if inserted is None:  # MySQL no distingue insertadas y omitidas
+                inserted = len(new_rows)
+            summary.created += inserted
+            summary.duplicates += len(rows) - inserted
+        self.db.commit()
+
+        if on_duplicate == "update" and existing:
+            cache.delete_many(
+                *[
+                    f"participant:{participant_id}"
+                    for participant_id in existing.values()
+                ]
+            )
+
+
+def detect_format(content_type: Optional[str]) -> ImportFormat:
+    """
+    Deduce el formato de importación a partir del Content-Type.
+
+    Raises:
+        EventiaException: 415 si el tipo de contenido no es soportado
+    """
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type in ("text/csv", "application/csv"):
+        return "csv"
+    if media_type in (
+        "application/x-ndjson",
+        "application/ndjson",
+        "application/jsonl",
+        "application/json-seq",
+    ):
+        return "ndjson"
+    raise EventiaException(
+        f"Tipo de contenido no soportado: {media_type or 'desconocido'}. "
+        "Use text/csv o application/x-ndjson",
+        status_code=415,
+    )
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Decodifica el flujo en UTF-8 y lo divide en líneas sin cargarlo completo"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    try:
+        async for chunk in chunks:
+            pending += decoder.decode(chunk)
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                yield line.rstrip("\r")
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        raise ValidationException("El archivo debe estar codificado en UTF-8")
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def iter_csv_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[ParsedRow]:
+    """
+    Lee filas CSV con encabezado de forma incremental.
+
+    Un registro puede ocupar varias líneas si tiene campos entre comillas
+    con saltos de línea; se acumula hasta que las comillas quedan balanceadas
+    o hasta PARTICIPANT_IMPORT_MAX_RECORD_SIZE caracteres.
+    """
+    max_record_size = settings.PARTICIPANT_IMPORT_MAX_RECORD_SIZE
+    header = None
+    record: List[str] = []
+    record_size = 0
+    record_line = 0
+    line_number = 0
+    # Paridad de comillas del registro en curso, actualizada por línea
+    quoted = False
+
+    async for line in iter_lines(chunks):
+        line_number += 1
+        if not record:
+            record_line = line_number
+            record_size = 0
+        record.append(line)
+        record_size += len(line) + 1
+        if line.count('"') % 2:
+            quoted = not quoted
+        if quoted:
+            if record_size > max_record_size:
+                yield record_line, None, (
+                    f"CSV inválido: campo entre comillas sin cerrar en más de "
+                    f"{max_record_size} caracteres"
+                )
+                record = []
+                quoted = False
+            continue
+        text = "\n".join(record)
+        record = []
+        if not text.strip():
+            continue
+
+        try:
+            values = next(csv.reader([text]))
+        except csv.Error as e:
+            yield record_line, None, f"CSV inválido: {e}"
+            continue
+
+        if header is None:
+            header = [column.strip().lower() for column in values]
+            missing = CSV_REQUIRED_COLUMNS - set(header)
+            if missing:
+                raise ValidationException(
+                    f"Faltan columnas en el encabezado CSV: {', '.join(sorted(missing))}"
+                )
+            continue
+
+        if len(values) != len(header):
+            yield record_line, None, (
+                f"Se esperaban {len(header)} columnas y se encontraron {len(values)}"
+            )
+            continue
+        yield record_line, {
+            column: value.strip() or None for column, value in zip(header, values)
+        }, None
+
+    if record:
+        yield record_line, None, "Campo entre comillas sin cerrar"
+
+
+async def iter_ndjson_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[ParsedRow]:
+    """Lee un objeto JSON por línea de forma incremental"""
+    line_number = 0
+    async for line in iter_lines(chunks):
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield line_number, None, f"JSON inválido: {e}"
+            continue
+        if not isinstance(row, dict):
+            yield line_number, None, "Se esperaba un objeto JSON"
+            continue
+        yield line_number, row, None
+
+
+def _add_error(summary: ParticipantImportSummary, line: int, error: str) -> None:
+    """Registra un error de fila respetando PARTICIPANT_IMPORT_MAX_ERRORS"""
+    summary.failed += 1
+    if len(summary.errors) < settings.PARTICIPANT_IMPORT_MAX_ERRORS:
+        summary.errors.append(ParticipantImportError(line=line, error=error))
+    else:
+        summary.errors_truncated = True
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    """Resume los errores de Pydantic en una línea"""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc']) or 'fila'}: {detail['msg']}"
+        for detail in error.errors()
+    )
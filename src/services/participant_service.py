@@ -1,13 +1,27 @@
-from typing import List
+from typing import List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, load_only
 
 from src.cache.redis_client import cache
+from src.database.dialect import is_unique_violation
 from src.exceptions.custom_exceptions import AlreadyExistsException, NotFoundException
+from src.models.attendance import Attendance
 from src.models.participant import Participant
-from src.schemas.participant import ParticipantCreate, ParticipantUpdate
+from src.observability.tracing import traced_service
+from src.schemas.fields import model_columns
+from src.schemas.participant import (
+    ParticipantCreate,
+    ParticipantLookup,
+    ParticipantLookupResponse,
+    ParticipantResponse,
+    ParticipantUpdate,
+)
+from src.services.statistics_service import StatisticsService
 
 
+@traced_service
 class ParticipantService:
     """Servicio de lógica de negocio para participantes"""
 
@@ -16,27 +30,22 @@ class ParticipantService:
 
     def create_participant(self, participant_data: ParticipantCreate) -> Participant:
         """Crea un nuevo participante"""
-        existing = (
-            self.db.query(Participant)
-            .filter(Participant.email == participant_data.email)
-            .first()
-        )
-        if existing:
-            raise AlreadyExistsException(
-                f"El email {participant_data.email} ya está registrado"
-            )
         participant = Participant(**participant_data.model_dump())
         self.db.add(participant)
-        self.db.commit()
-        self.db.refresh(participant)
+        self._commit_unique_email(participant_data.email)
         cache.delete_pattern("participants:list:*")
         return participant
 
-    def get_participant(self, participant_id: int) -> Participant:
-        """Obtiene un participante por su ID"""
-        participant = (
-            self.db.query(Participant).filter(Participant.id == participant_id).first()
-        )
+    def get_participant(
+        self, participant_id: int, fields: Optional[List[str]] = None
+    ) -> Participant:
+        """Obtiene un participante por su ID (con `fields`, solo esas columnas)"""
+        query = self.db.query(Participant).filter(Participant.id == participant_id)
+        if fields is not None:
+            query = query.options(
+                load_only(*model_columns(Participant, fields, ("id",)))
+            )
+        participant = query.first()
         if not participant:
             raise NotFoundException(
                 f"Participante con ID {participant_id} no encontrado"
@@ -48,10 +57,66 @@ class ParticipantService:
         return self.db.query(Participant).filter(Participant.email == email).first()
 
     def get_all_participants(
-        self, skip: int = 0, limit: int = 100
+        self, skip: int = 0, limit: int = 100, fields: Optional[List[str]] = None
     ) -> list[Participant]:
-        """Obtiene todos los participantes con paginación"""
-        return self.db.query(Participant).offset(skip).limit(limit).all()
+        """
+        Obtiene todos los participantes con paginación.
+
+        Con `fields` solo se cargan esas columnas (más id).
+        """
+        query = self.db.query(Participant)
+        if fields is not None:
+            query = query.options(
+                load_only(*model_columns(Participant, fields, ("id",)))
+            )
+        return query.offset(skip).limit(limit).all()
+
+    def lookup_participants(
+        self, lookup: ParticipantLookup
+    ) -> ParticipantLookupResponse:
+        """
+        Busca varios participantes por IDs y/o emails.
+
+        Los IDs se leen primero del caché con un solo MGET; los faltantes
+        y los emails se resuelven con una única consulta IN.
+        """
+        ids = list(dict.fromkeys(lookup.ids))
+        emails = list(dict.fromkeys(lookup.emails))
+        found = {
+            participant_id: ParticipantResponse(**data)
+            for participant_id, data in zip(
+                ids, cache.get_many([f"participant:{pid}" for pid in ids])
+            )
+            if data
+        }
+
+        missing_ids = [pid for pid in ids if pid not in found]
+        if missing_ids or emails:
+            participants = (
+                self.db.query(Participant)
+                .filter(
+                    or_(
+                        Participant.id.in_(missing_ids),
+                        Participant.email.in_(emails),
+                    )
+                )
+                .all()
+            )
+            to_cache = {}
+            for participant in participants:
+                response = ParticipantResponse.model_validate(participant)
+                found[participant.id] = response
+                to_cache[f"participant:{participant.id}"] = response.model_dump(
+                    mode="json"
+                )
+            cache.set_many(to_cache)
+
+        found_emails = {participant.email for participant in found.values()}
+        return ParticipantLookupResponse(
+            participants=list(found.values()),
+            missing_ids=[pid for pid in ids if pid not in found],
+            missing_emails=[email for email in emails if email not in found_emails],
+        )
 
     def update_participant(
         self, participant_id: int, participant_data: ParticipantUpdate
@@ -59,29 +124,47 @@ class ParticipantService:
         """Actualiza un participante existente"""
         participant = self.get_participant(participant_id)
         update_data = participant_data.model_dump(exclude_unset=True)
-        if "email" in update_data and update_data["email"] != participant.email:
-            existing = (
-                self.db.query(Participant)
-                .filter(Participant.email == update_data["email"])
-                .first()
-            )
-            if existing:
-                raise AlreadyExistsException(
-                    f"El email {update_data['email']} ya está registrado"
-                )
         for key, value in update_data.items():
             setattr(participant, key, value)
-        self.db.commit()
-        self.db.refresh(participant)
+        self._commit_unique_email(update_data.get("email", participant.email))
         cache.delete(f"participant:{participant_id}")
         cache.delete_pattern("participants:list:*")
         return participant
 
     def delete_participant(self, participant_id: int) -> bool:
-        """Elimina un participante"""
+        """Elimina un participante y sus asistencias sin cargarlas en la sesión"""
         participant = self.get_participant(participant_id)
+        cancellations = [
+            (row.event_id, row.registered_at)
+            for row in self.db.query(
+                Attendance.event_id, Attendance.registered_at
+            ).filter(Attendance.participant_id == participant_id)
+        ]
+        event_ids = {event_id for event_id, _ in cancellations}
+        StatisticsService(self.db).record_cancellations(cancellations)
+        self.db.query(Attendance).filter(
+            Attendance.participant_id == participant_id
+        ).delete(synchronize_session=False)
         self.db.delete(participant)
         self.db.commit()
-        cache.delete(f"participant:{participant_id}")
+        cache.delete_many(
+            f"participant:{participant_id}",
+            f"participant:attendances:{participant_id}",
+            *[f"event:stats:{event_id}" for event_id in event_ids],
+            *[f"event:attendances:{event_id}" for event_id in event_ids],
+        )
         cache.delete_pattern("participants:list:*")
         return True
+
+    def _commit_unique_email(self, email: str) -> None:
+        """
+        Confirma la transacción traduciendo la violación del índice único
+        de email en AlreadyExistsException.
+        """
+        try:
+            self.db.commit()
+        except IntegrityError as e:
+            self.db.rollback()
+            if is_unique_violation(e):
+                raise AlreadyExistsException(f"El email {email} ya está registrado")
+            raise
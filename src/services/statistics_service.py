@@ -0,0 +1,397 @@
+import logging
+from collections import Counter
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from src.database.dialect import insert_ignore, upsert
+from src.models.attendance import Attendance
+from src.models.event import Event
+from src.models.statistics import EventDailyRegistration, EventStatistic
+from src.observability.tracing import traced_service
+from src.schemas.event import EventStatistics
+
+logger = logging.getLogger(__name__)
+
+
+@traced_service
+class StatisticsService:
+    """
+    Servicio que mantiene la proyección de estadísticas de eventos.
+
+    Los métodos record_* no hacen commit: se ejecutan dentro de la
+    transacción del registro o cancelación que los origina.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @staticmethod
+    def build_event_statistics(
+        event, registered: int, last_registration_at: Optional[datetime] = None
+    ) -> EventStatistics:
+        """
+        Construye el schema de estadísticas de un evento activo o archivado.
+
+        Args:
+            event: Event o ArchivedEvent
+            registered: Número de participantes registrados
+            last_registration_at: Fecha del último registro, si se conoce
+        """
+        occupation = (registered / event.capacity) * 100 if event.capacity > 0 else 0
+        return EventStatistics(
+            event_id=event.id,
+            event_name=event.name,
+            total_capacity=event.capacity,
+            registered_participants=registered,
+            available_capacity=event.capacity - registered,
+            occupation_percentage=round(occupation, 2),
+            last_registration_at=last_registration_at,
+        )
+
+    def initialize_event(self, event_id: int) -> None:
+        """Crea la fila de estadísticas vacía de un evento nuevo"""
+        self.db.add(EventStatistic(event_id=event_id, registered_count=0))
+
+    def record_registration(
+        self, event_id: int, capacity: int, registered_at: datetime, seats: int = 1
+    ) -> bool:
+        """
+        Suma registros al contador solo si no se supera la capacidad.
+
+        El UPDATE condicional bloquea la fila del evento hasta el commit, por
+        lo que registros concurrentes no pueden exceder la capacidad.
+
+        Returns:
+            False si el evento no tiene cupo para `seats` registros más
+        """
+        result = self.db.execute(
+            update(EventStatistic)
+            .where(
+                EventStatistic.event_id == event_id,
+                EventStatistic.registered_count + seats <= capacity,
+            )
+            .values(
+                registered_count=EventStatistic.registered_count + seats,
+                last_registration_at=registered_at,
+            )
+        )
+        if result.rowcount:
+            self._add_daily([(event_id, registered_at.date(), seats)])
+            return True
+
+        if self.db.get(EventStatistic, event_id) is not None:
+            return False
+
+        # Evento anterior a la proyección: crearla desde las asistencias,
+        # que ya incluyen las recién insertadas en esta transacción
+        self.backfill([event_id])
+        return self.get_registered_count(event_id) <= capacity
+
+    def record_registrations(
+        self, event_ids: List[int], registered_at: datetime
+    ) -> int:
+        """
+        Suma un registro a cada uno de varios eventos con un solo UPDATE.
+
+        La condición de capacidad se evalúa para todo el conjunto contra la
+        tabla de eventos; solo se incrementan los eventos con cupo.
+
+        Returns:
+            Número de eventos incrementados; si es menor que len(event_ids)
+            el llamador debe revertir la transacción o aceptar el resultado
+            parcial
+        """
+        if not event_ids:
+            return 0
+        capacity = (
+            select(Event.capacity)
+            .where(Event.id == EventStatistic.event_id)
+            .scalar_subquery()
+        )
+        result = self.db.execute(
+            update(EventStatistic)
+            .where(
+                EventStatistic.event_id.in_(event_ids),
+                EventStatistic.registered_count < capacity,
+            )
+            .values(
+                registered_count=EventStatistic.registered_count + 1,
+                last_registration_at=registered_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount:
+            self._add_daily(
+                [(event_id, registered_at.date(), 1) for event_id in event_ids]
+            )
+        return result.rowcount
+
+    def record_cancellations(
+        self, cancellations: Iterable[Tuple[int, datetime]]
+    ) -> None:
+        """
+        Descuenta asistencias eliminadas del contador y de los registros diarios.
+
+        Se llama antes de borrar las asistencias. Si el contador de un evento
+        falta o es menor que las cancelaciones, la proyección está
+        desincronizada: se recalcula ese evento (aún con las asistencias) y se
+        aplica el descuento sobre los valores corregidos.
+
+        Args:
+            cancellations: Pares (event_id, registered_at) de las asistencias
+        """
+        per_event = Counter()
+        per_day = Counter()
+        for event_id, registered_at in cancellations:
+            per_event[event_id] += 1
+            if registered_at is not None:
+                per_day[(event_id, registered_at.date())] += 1
+
+        drifted = [
+            event_id
+            for event_id, count in per_event.items()
+            if not self._decrement_registered(event_id, count)
+        ]
+        if drifted:
+            logger.warning(
+                f"Estadísticas desincronizadas para los eventos {drifted}, "
+                f"se recalculan"
+            )
+            self.rebuild(drifted)
+            for event_id in drifted:
+                self._decrement_registered(event_id, per_event[event_id])
+        for (event_id, day), count in per_day.items():
+            self.db.execute(
+                update(EventDailyRegistration)
+                .where(
+                    EventDailyRegistration.event_id == event_id,
+                    EventDailyRegistration.day == day,
+                )
+                .values(registrations=EventDailyRegistration.registrations - count)
+            )
+
+    def get_statistic(self, event_id: int) -> Optional[EventStatistic]:
+        """
+        Obtiene la fila de estadísticas de un evento.
+
+        Si el evento es anterior a la proyección, la calcula desde las
+        asistencias sin guardarla: las lecturas no escriben. La fila se crea
+        al registrar (lock_statistics) o con src.commands.rebuild_statistics.
+        """
+        statistic = self.db.get(EventStatistic, event_id)
+        if statistic is None:
+            statistic = self.compute([event_id]).get(event_id)
+        return statistic
+
+    def lock_statistics(self, event_ids: List[int]) -> Dict[int, EventStatistic]:
+        """
+        Bloquea (SELECT ... FOR UPDATE) las filas de estadísticas de varios
+        eventos hasta el final de la transacción.
+
+        Las filas se bloquean en orden de event_id para evitar interbloqueos
+        entre transacciones que registran en conjuntos de eventos solapados.
+        Las filas faltantes se crean antes de bloquear (ver backfill).
+        """
+        self.backfill(event_ids)
+        return {
+            statistic.event_id: statistic
+            for statistic in self.db.query(EventStatistic)
+            .filter(EventStatistic.event_id.in_(event_ids))
+            .order_by(EventStatistic.event_id)
+            .with_for_update()
+            .populate_existing()
+        }
+
+    def get_registered_count(self, event_id: int) -> int:
+        """Número de participantes registrados según la proyección"""
+        statistic = self.get_statistic(event_id)
+        return statistic.registered_count if statistic else 0
+
+    def get_daily_registrations(self, event_id: int) -> List[EventDailyRegistration]:
+        """Registros netos por día de un evento, en orden cronológico"""
+        return (
+            self.db.query(EventDailyRegistration)
+            .filter(
+                EventDailyRegistration.event_id == event_id,
+                EventDailyRegistration.registrations != 0,
+            )
+            .order_by(EventDailyRegistration.day)
+            .all()
+        )
+
+    def rebuild(self, event_ids: List[int]) -> None:
+        """
+        Recalcula desde cero las estadísticas de los eventos indicados.
+
+        Usa una consulta agrupada para los contadores y otra para los
+        registros diarios. No hace commit.
+        """
+        if not event_ids:
+            return
+        self.db.query(EventStatistic).filter(
+            EventStatistic.event_id.in_(event_ids)
+        ).delete(synchronize_session=False)
+        self.db.query(EventDailyRegistration).filter(
+            EventDailyRegistration.event_id.in_(event_ids)
+        ).delete(synchronize_session=False)
+        # Descartar instancias obsoletas del identity map
+        for statistic in list(self.db.identity_map.values()):
+            if (
+                isinstance(statistic, EventStatistic)
+                and statistic.event_id in event_ids
+            ):
+                self.db.expunge(statistic)
+
+        self.db.bulk_insert_mappings(EventStatistic, self._statistic_rows(event_ids))
+        daily_rows = self._daily_rows(event_ids)
+        if daily_rows:
+            self.db.bulk_insert_mappings(EventDailyRegistration, daily_rows)
+        self.db.flush()
+
+    def backfill(self, event_ids: List[int]) -> None:
+        """
+        Crea desde las asistencias las filas de estadísticas que falten.
+
+        A diferencia de rebuild no borra nada y usa INSERT ... ON CONFLICT
+        DO NOTHING, así que dos transacciones que completan el mismo evento
+        a la vez no fallan por la clave primaria. No hace commit.
+        """
+        existing = {
+            row.event_id
+            for row in self.db.query(EventStatistic.event_id).filter(
+                EventStatistic.event_id.in_(event_ids)
+            )
+        }
+        missing = [event_id for event_id in event_ids if event_id not in existing]
+        if not missing:
+            return
+        insert_ignore(
+            self.db, EventStatistic, self._statistic_rows(missing), ["event_id"]
+        )
+        insert_ignore(
+            self.db,
+            EventDailyRegistration,
+            self._daily_rows(missing),
+            ["event_id", "day"],
+        )
+
+    def compute(self, event_ids: List[int]) -> Dict[int, EventStatistic]:
+        """
+        Calcula las estadísticas de los eventos desde las asistencias sin
+        guardarlas (las instancias no se agregan a la sesión).
+        """
+        if not event_ids:
+            return {}
+        return {
+            row["event_id"]: EventStatistic(**row)
+            for row in self._statistic_rows(event_ids)
+        }
+
+    def rebuild_all(self, batch_size: int = 1000) -> int:
+        """
+        Reconstruye las estadísticas de todos los eventos por lotes.
+
+        Returns:
+            Número de eventos procesados
+        """
+        processed = 0
+        last_id = 0
+        while True:
+            event_ids = [
+                row.id
+                for row in self.db.query(Event.id)
+                .filter(Event.id > last_id)
+                .order_by(Event.id)
+                .limit(batch_size)
+            ]
+            if not event_ids:
+                break
+            self.rebuild(event_ids)
+            self.db.commit()
+            processed += len(event_ids)
+            last_id = event_ids[-1]
+        return processed
+
+    def _decrement_registered(self, event_id: int, count: int) -> bool:
+        """Descuenta cancelaciones del contador; False si no hay fila o no alcanza"""
+        result = self.db.execute(
+            update(EventStatistic)
+            .where(
+                EventStatistic.event_id == event_id,
+                EventStatistic.registered_count >= count,
+            )
+            .values(registered_count=EventStatistic.registered_count - count)
+        )
+        return result.rowcount > 0
+
+    def _statistic_rows(self, event_ids: List[int]) -> List[Dict]:
+        """Filas de event_statistics calculadas con una consulta agrupada"""
+        totals = {
+            row.event_id: row
+            for row in self.db.query(
+                Attendance.event_id,
+                func.count(Attendance.id).label("registered"),
+                func.max(Attendance.registered_at).label("last_registration_at"),
+            )
+            .filter(Attendance.event_id.in_(event_ids))
+            .group_by(Attendance.event_id)
+        }
+        existing_ids = [
+            row.id for row in self.db.query(Event.id).filter(Event.id.in_(event_ids))
+        ]
+        return [
+            {
+                "event_id": event_id,
+                "registered_count": totals[event_id].registered
+                if event_id in totals
+                else 0,
+                "last_registration_at": totals[event_id].last_registration_at
+                if event_id in totals
+                else None,
+            }
+            for event_id in existing_ids
+        ]
+
+    def _daily_rows(self, event_ids: List[int]) -> List[Dict]:
+        """Filas de event_daily_registrations calculadas desde las asistencias"""
+        day = func.date(Attendance.registered_at)
+        return [
+            {
+                "event_id": row.event_id,
+                "day": _as_date(row.day),
+                "registrations": row.registrations,
+            }
+            for row in self.db.query(
+                Attendance.event_id,
+                day.label("day"),
+                func.count(Attendance.id).label("registrations"),
+            )
+            .filter(
+                Attendance.event_id.in_(event_ids), Attendance.registered_at.isnot(None)
+            )
+            .group_by(Attendance.event_id, day)
+        ]
+
+    def _add_daily(self, increments: List[Tuple[int, date, int]]) -> None:
+        """Suma registros a los contadores diarios con un único upsert"""
+        upsert(
+            self.db,
+            EventDailyRegistration,
+            [
+                {"event_id": event_id, "day": day, "registrations": count}
+                for event_id, day, count in increments
+            ],
+            ["event_id", "day"],
+            lambda new: {
+                "registrations": EventDailyRegistration.registrations
+                + new.registrations
+            },
+        )
+
+
+def _as_date(value) -> date:
+    """func.date() retorna str en SQLite y date en MySQL"""
+    return date.fromisoformat(value) if isinstance(value, str) else value
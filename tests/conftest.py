@@ -12,6 +12,7 @@ SRC_DIR = os.path.join(ROOT_DIR, "src")
 if SRC_DIR not in sys.path:
     sys.path.insert(0, SRC_DIR)
 
+from contextlib import contextmanager  # noqa: E402
 from datetime import datetime, timedelta  # noqa: E402
 
 import pytest  # noqa: E402
@@ -25,6 +26,10 @@ from src.main import app  # noqa: E402
 from src.models.attendance import Attendance  # noqa: E402
 from src.models.event import Event  # noqa: E402
 from src.models.participant import Participant  # noqa: E402
+from src.observability.queries import (  # noqa: E402
+    add_request_observer,
+    remove_request_observer,
+)
 
 # Usar DATABASE_URL del environment, si no está disponible usar SQLite
 DATABASE_URL = os.getenv(
@@ -40,7 +45,9 @@ else:
     # Para MySQL en CI/CD
     engine = create_engine(DATABASE_URL, pool_pre_ping=True)
 
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TestingSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 
 @pytest.fixture(scope="function")
@@ -71,6 +78,22 @@ def client(db):
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def per_request_sessions(client, db):
+    """Una sesión por petición: las peticiones concurrentes se atienden en paralelo"""
+    session_factory = sessionmaker(bind=db.get_bind(), expire_on_commit=False)
+
+    def override_get_db():
+        session = session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield
+
+
 @pytest.fixture
 def sample_event_data():
     """Datos de ejemplo para evento"""
@@ -171,3 +194,31 @@ def create_multiple_participants(db):
     for participant in participants:
         db.refresh(participant)
     return participants
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Verifica el máximo de consultas SQL por petición.
+
+    Uso:
+        with query_budget(3):
+            client.get("/events")
+    """
+
+    @contextmanager
+    def budget(max_queries):
+        requests = []
+        add_request_observer(requests.append)
+        try:
+            yield requests
+        finally:
+            remove_request_observer(requests.append)
+        assert requests, "No se registró ninguna petición"
+        for queries in requests:
+            assert queries.count <= max_queries, (
+                f"{queries.method} {queries.route}: {queries.count} consultas "
+                f"(máximo {max_queries}): {dict(queries.statements)}"
+            )
+
+    return budget
@@ -62,6 +62,20 @@ class TestCacheIntegration:
         # Assert
         assert result is None
 
+    @pytest.mark.skipif(not is_redis_available(), reason="Redis no está disponible")
+    def test_cache_get_many_and_set_many(self, cache_client):
+        """Prueba leer y escribir varias claves en un solo viaje"""
+        # Arrange
+        values = {"test:a": {"value": 1}, "test:b": {"value": 2}}
+
+        # Act
+        result_set = cache_client.set_many(values)
+        result_get = cache_client.get_many(["test:a", "test:missing", "test:b"])
+
+        # Assert
+        assert result_set is True
+        assert result_get == [{"value": 1}, None, {"value": 2}]
+
     @pytest.mark.skipif(not is_redis_available(), reason="Redis no está disponible")
     def test_cache_delete(self, cache_client):
         """Prueba eliminar del caché"""
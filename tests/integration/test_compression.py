@@ -0,0 +1,139 @@
+"""
+Pruebas de integración del middleware de compresión
+
+Usan una aplicación mínima para controlar tamaño y tipo de las respuestas.
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.middleware.compression import CompressionMiddleware, negotiate_encoding
+
+LARGE_BODY = b'{"items": [' + b", ".join([b'{"id": 1}'] * 500) + b"]}"
+
+
+@pytest.fixture
+def inner_app():
+    """Aplicación con una respuesta grande, una pequeña y una en streaming"""
+    app = FastAPI()
+
+    @app.get("/large")
+    def large():
+        return Response(LARGE_BODY, media_type="application/json")
+
+    @app.get("/small")
+    def small():
+        return Response(b'{"id": 1}', media_type="application/json")
+
+    @app.get("/binary")
+    def binary():
+        return Response(LARGE_BODY, media_type="application/octet-stream")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(
+            (b"linea\n" * 200 for _ in range(3)), media_type="text/csv"
+        )
+
+    @app.get("/text")
+    def text():
+        return PlainTextResponse("x" * 2000)
+
+    return app
+
+
+@pytest.fixture
+def compression_app(inner_app):
+    """Aplicación envuelta en el middleware de compresión"""
+    return CompressionMiddleware(
+        inner_app,
+        minimum_size=1024,
+        content_types=["application/json", "text/csv"],
+        cache_max_bytes=1024 * 1024,
+    )
+
+
+@pytest.mark.integration
+class TestCompressionMiddleware:
+    """Pruebas del middleware de compresión"""
+
+    def test_compresses_large_json(self, compression_app):
+        """Prueba comprimir una respuesta grande con tipo permitido"""
+        # Act
+        response = TestClient(compression_app).get(
+            "/large", headers={"Accept-Encoding": "gzip"}
+        )
+
+        # Assert
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert int(response.headers["content-length"]) < len(LARGE_BODY)
+        assert response.content == LARGE_BODY
+
+    def test_skips_small_and_disallowed_types(self, compression_app):
+        """Prueba no comprimir cuerpos pequeños ni tipos fuera de la lista"""
+        # Arrange
+        client = TestClient(compression_app)
+        headers = {"Accept-Encoding": "gzip"}
+
+        # Act
+        small = client.get("/small", headers=headers)
+        binary = client.get("/binary", headers=headers)
+        text = client.get("/text", headers=headers)
+
+        # Assert
+        assert "content-encoding" not in small.headers
+        assert "content-encoding" not in binary.headers
+        assert "content-encoding" not in text.headers
+
+    def test_skips_without_accept_encoding(self, compression_app):
+        """Prueba no comprimir si el cliente no acepta compresión"""
+        # Act
+        response = TestClient(compression_app).get(
+            "/large", headers={"Accept-Encoding": "identity"}
+        )
+
+        # Assert
+        assert "content-encoding" not in response.headers
+        assert response.content == LARGE_BODY
+
+    def test_compresses_streaming_response(self, compression_app):
+        """Prueba comprimir por bloques una respuesta en streaming"""
+        # Act
+        response = TestClient(compression_app).get(
+            "/stream", headers={"Accept-Encoding": "gzip"}
+        )
+
+        # Assert
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert response.content == b"linea\n" * 600
+
+    def test_repeated_body_is_compressed_once(self, compression_app):
+        """Prueba que un cuerpo repetido se sirve desde el caché comprimido"""
+        # Arrange
+        calls = []
+        compress = compression_app.compress
+        compression_app.compress = lambda encoding, body: (
+            calls.append(encoding) or compress(encoding, body)
+        )
+        client = TestClient(compression_app)
+
+        # Act
+        responses = [
+            client.get("/large", headers={"Accept-Encoding": "gzip"}) for _ in range(3)
+        ]
+
+        # Assert
+        assert calls == ["gzip"]
+        assert all(response.content == LARGE_BODY for response in responses)
+
+    def test_negotiate_encoding(self):
+        """Prueba la negociación de Accept-Encoding con valores q"""
+        # Assert
+        assert negotiate_encoding("gzip, br", ["br", "gzip"]) == "br"
+        assert negotiate_encoding("br;q=0.5, gzip", ["br", "gzip"]) == "gzip"
+        assert negotiate_encoding("gzip;q=0", ["gzip"]) is None
+        assert negotiate_encoding("*", ["gzip"]) == "gzip"
+        assert negotiate_encoding("", ["gzip"]) is None
@@ -8,6 +8,7 @@ from datetime import datetime, timedelta
 import pytest
 from sqlalchemy.exc import IntegrityError
 
+from src.database.dialect import is_unique_violation
 from src.models import Attendance, Event, Participant
 
 
@@ -55,6 +56,32 @@ class TestDatabaseIntegration:
         with pytest.raises(IntegrityError):
             db.commit()
 
+    def test_unique_violation_is_detected(self, db, create_participant):
+        """Prueba que el email duplicado se reconozca como violación de unicidad"""
+        # Arrange
+        db.add(Participant(name="Duplicado", email=create_participant.email))
+
+        # Act
+        with pytest.raises(IntegrityError) as exc_info:
+            db.commit()
+        db.rollback()
+
+        # Assert
+        assert is_unique_violation(exc_info.value) is True
+
+    def test_not_null_violation_is_not_unique(self, db):
+        """Prueba que otros errores de integridad no se traduzcan a conflicto"""
+        # Arrange
+        db.add(Participant(name="Sin Email", email=None))
+
+        # Act
+        with pytest.raises(IntegrityError) as exc_info:
+            db.commit()
+        db.rollback()
+
+        # Assert
+        assert is_unique_violation(exc_info.value) is False
+
     def test_attendance_unique_constraint(self, db, create_event, create_participant):
         """Prueba que no se pueda registrar dos veces al mismo evento"""
         # Arrange
@@ -90,6 +90,46 @@ class TestAttendanceAPI:
         data = response.json()
         assert "detail" in data or "error" in data
 
+    def test_register_attendances_bulk(
+        self, client, create_event, create_multiple_participants
+    ):
+        """Prueba registrar un grupo de participantes en una petición"""
+        # Arrange
+        bulk_data = {
+            "event_id": create_event.id,
+            "participant_ids": [p.id for p in create_multiple_participants] + [999],
+        }
+
+        # Act
+        response = client.post("/attendances/bulk", json=bulk_data)
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["created"] == len(create_multiple_participants)
+        assert data["items"][-1]["status"] == "not_found"
+        stats = client.get(f"/events/{create_event.id}/statistics").json()
+        assert stats["registered_participants"] == len(create_multiple_participants)
+
+    def test_register_attendance_multi_event_conflict(
+        self, client, create_attendance, create_multiple_events
+    ):
+        """Prueba que all_or_nothing responda 409 sin registrar nada"""
+        # Arrange
+        multi_data = {
+            "participant_id": create_attendance.participant_id,
+            "event_ids": [create_multiple_events[0].id, create_attendance.event_id],
+        }
+
+        # Act
+        response = client.post("/attendances/multi-event", json=multi_data)
+
+        # Assert
+        assert response.status_code == 409
+        data = response.json()
+        assert data["created"] == 0
+        assert [i["status"] for i in data["items"]] == ["skipped", "duplicate"]
+
     def test_cancel_attendance(self, client, create_attendance):
         """Prueba cancelar asistencia"""
         # Act
@@ -105,12 +145,33 @@ class TestAttendanceAPI:
 
         # Assert
         assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
         data = response.json()
         assert len(data) == 1
         assert data[0]["event_id"] == create_attendance.event_id
         assert "participant_name" in data[0]
         assert "participant_email" in data[0]
 
+    def test_export_event_attendances(self, client, create_attendance):
+        """Prueba descargar los participantes de un evento en CSV"""
+        # Act
+        response = client.get(f"/attendances/event/{create_attendance.event_id}/export")
+
+        # Assert
+        assert response.status_code == 200
+        assert "attachment" in response.headers["content-disposition"]
+        lines = response.text.splitlines()
+        assert lines[0].startswith("attendance_id,participant_id,name,email")
+        assert lines[1].startswith(f"{create_attendance.id},")
+
+    def test_export_event_attendances_not_found(self, client):
+        """Prueba exportar asistentes de un evento inexistente"""
+        # Act
+        response = client.get("/attendances/event/999/export")
+
+        # Assert
+        assert response.status_code == 404
+
     def test_get_participant_attendances(self, client, create_attendance):
         """Prueba obtener eventos de un participante"""
         # Act
@@ -7,6 +7,8 @@ from datetime import datetime, timedelta
 
 import pytest
 
+from src.services.archive_service import ArchiveService
+
 
 @pytest.mark.system
 class TestEventsAPI:
@@ -45,6 +47,7 @@ class TestEventsAPI:
         data = response.json()
         assert len(data) == 5
         assert all("id" in event for event in data)
+        assert all(event["archived"] is False for event in data)
 
     def test_get_event_by_id(self, client, create_event):
         """Prueba obtener evento específico"""
@@ -56,6 +59,7 @@ class TestEventsAPI:
         data = response.json()
         assert data["id"] == create_event.id
         assert data["name"] == create_event.name
+        assert data["archived"] is False
 
     def test_get_event_not_found(self, client):
         """Prueba obtener evento inexistente"""
@@ -67,6 +71,22 @@ class TestEventsAPI:
         data = response.json()
         assert "detail" in data or "error" in data
 
+    def test_get_archived_event_by_id(self, client, db, create_event):
+        """Prueba obtener por ID un evento que ya fue archivado"""
+        # Arrange
+        create_event.date = datetime.utcnow() - timedelta(days=60)
+        db.commit()
+        ArchiveService(db).archive_past_events(horizon_days=30)
+
+        # Act
+        response = client.get(f"/events/{create_event.id}")
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] == create_event.id
+        assert data["archived"] is True
+
     def test_update_event(self, client, create_event):
         """Prueba actualizar evento"""
         # Arrange
@@ -93,6 +113,25 @@ class TestEventsAPI:
         get_response = client.get(f"/events/{create_event.id}")
         assert get_response.status_code == 404
 
+    def test_delete_event_in_background(self, client, create_attendance):
+        """Prueba eliminar evento en segundo plano"""
+        # Act
+        response = client.delete(
+            f"/events/{create_attendance.event_id}?background=true"
+        )
+
+        # Assert
+        assert response.status_code == 202
+        data = response.json()
+        assert data["event_id"] == create_attendance.event_id
+        assert data["status"] == "pending"
+
+        # La tarea ya terminó: el estado queda guardado en la base de datos
+        status_response = client.get(f"/events/{create_attendance.event_id}/deletion")
+        assert status_response.status_code == 200
+        assert status_response.json()["status"] == "completed"
+        assert status_response.json()["deleted_attendances"] == 1
+
     def test_get_event_statistics(self, client, create_event):
         """Prueba obtener estadísticas de evento"""
         # Act
@@ -115,3 +154,83 @@ class TestEventsAPI:
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 2
+
+    def test_get_events_by_ids(self, client, db, create_multiple_events):
+        """Prueba obtener varios eventos por ID, incluido uno archivado"""
+        # Arrange
+        archived = create_multiple_events[0]
+        archived.date = datetime.utcnow() - timedelta(days=60)
+        db.commit()
+        ArchiveService(db).archive_past_events(horizon_days=30)
+        ids = [create_multiple_events[2].id, 999, archived.id]
+
+        # Act
+        response = client.get(f"/events/?ids={','.join(map(str, ids))}")
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert [e["id"] for e in data] == [ids[0], archived.id]
+        assert data[0]["available_capacity"] == create_multiple_events[2].capacity
+        assert data[1]["archived"] is True
+
+    def test_get_events_by_ids_invalid(self, client):
+        """Prueba enviar IDs no numéricos"""
+        # Act
+        response = client.get("/events/?ids=1,abc")
+
+        # Assert
+        assert response.status_code == 422
+
+    def test_get_events_statistics_by_ids(
+        self, client, create_attendance, create_multiple_events
+    ):
+        """Prueba obtener estadísticas de varios eventos en una petición"""
+        # Arrange
+        ids = [create_attendance.event_id, create_multiple_events[0].id]
+
+        # Act
+        response = client.get(f"/events/statistics?ids={ids[0]},{ids[1]}")
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert [s["event_id"] for s in data] == ids
+        assert [s["registered_participants"] for s in data] == [1, 0]
+
+    def test_list_events_omits_description_by_default(
+        self, client, create_multiple_events
+    ):
+        """Prueba que el listado no incluya la descripción por defecto"""
+        # Act
+        response = client.get("/events/")
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert "description" not in data[0]
+        assert data[0]["available_capacity"] == create_multiple_events[0].capacity
+
+    def test_sparse_fieldset(self, client, create_event):
+        """Prueba pedir solo algunos campos de un evento"""
+        # Act
+        list_response = client.get("/events/?fields=id,name,description")
+        detail_response = client.get(f"/events/{create_event.id}?fields=id,date")
+
+        # Assert
+        assert list_response.json() == [
+            {
+                "id": create_event.id,
+                "name": create_event.name,
+                "description": create_event.description,
+            }
+        ]
+        assert set(detail_response.json()) == {"id", "date"}
+
+    def test_sparse_fieldset_unknown_field(self, client):
+        """Prueba pedir un campo inexistente"""
+        # Act
+        response = client.get("/events/?fields=id,secret")
+
+        # Assert
+        assert response.status_code == 422
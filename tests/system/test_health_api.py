@@ -0,0 +1,91 @@
+"""
+Pruebas end-to-end para los endpoints de health check
+"""
+import asyncio
+
+import pytest
+
+from src.observability import health
+from src.observability.health import HealthMonitor
+from src.observability.startup import startup
+
+
+@pytest.fixture
+def monitor(client, db, monkeypatch):
+    """
+    Monitor propio para la prueba, independiente de la tarea periódica
+    que lanza el arranque de la aplicación, verificando el motor de pruebas
+    en lugar del configurado en DATABASE_URL
+    """
+    engine = db.get_bind()
+    monkeypatch.setattr(health, "get_engine", lambda: engine)
+    startup.wait("init_db", timeout=10)
+    monitor = HealthMonitor(interval=60, timeout=2)
+    monkeypatch.setattr("src.controllers.health_controller.health_monitor", monitor)
+    return monitor
+
+
+@pytest.mark.system
+class TestHealthAPI:
+    """Pruebas E2E para las sondas de liveness y readiness"""
+
+    def test_liveness(self, client):
+        """Prueba la sonda de liveness"""
+        # Act
+        response = client.get("/health/live")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {"status": "alive"}
+
+    def test_readiness_serves_monitor_snapshot(self, client, monitor):
+        """Prueba que readiness sirve la instantánea del monitor"""
+        # Arrange
+        asyncio.run(monitor.refresh())
+
+        # Act
+        response = client.get("/health/ready")
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["ready"] is True
+        assert data["checks"]["database"]["status"] == "healthy"
+        assert "breaker" in data["checks"]["redis"]
+        assert "checked_out" in data["pool"]
+
+    def test_readiness_not_ready_when_database_down(self, client, monitor, monkeypatch):
+        """Prueba responder 503 si la base de datos no responde"""
+
+        # Arrange
+        def failing_check():
+            raise ConnectionError("sin conexión")
+
+        monkeypatch.setattr("src.observability.health.check_database", failing_check)
+        asyncio.run(monitor.refresh())
+
+        # Act
+        response = client.get("/health/ready")
+
+        # Assert
+        assert response.status_code == 503
+        data = response.json()
+        assert data["ready"] is False
+        assert data["checks"]["database"]["error"] == "sin conexión"
+
+    def test_detailed_does_not_query_dependencies(self, client, monitor, monkeypatch):
+        """Prueba que /health/detailed no hace I/O por petición"""
+        # Arrange
+        asyncio.run(monitor.refresh())
+        calls = []
+        monkeypatch.setattr(
+            "src.observability.health.check_database", lambda: calls.append(1)
+        )
+
+        # Act
+        response = client.get("/health/detailed")
+
+        # Assert
+        assert response.status_code == 200
+        assert calls == []
+        assert "startup" in response.json()
@@ -0,0 +1,80 @@
+"""
+Pruebas de sistema para los escenarios de carga (en proceso, vía ASGI)
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from loadtest.scenarios import Options, check_capacity, run_scenario
+from src.main import app
+
+
+def _run(scenario, options):
+    return asyncio.run(
+        run_scenario(
+            scenario,
+            options,
+            base_url="http://testserver",
+            transport=httpx.ASGITransport(app=app),
+        )
+    )
+
+
+@pytest.mark.system
+class TestLoadTestScenarios:
+    """Pruebas de los escenarios contra la aplicación"""
+
+    def test_flash_sale_never_exceeds_capacity(self, per_request_sessions):
+        """Prueba que la venta relámpago acepta exactamente la capacidad"""
+        # Arrange
+        options = Options(users=40, capacity=10, concurrency=10)
+
+        # Act
+        report = _run("flash-sale", options)
+
+        # Assert
+        register = report["operations"]["register"]
+        assert register["requests"] == 40
+        assert register["outcomes"] == {"201": 10, "400": 30}
+        assert report["errors"] == 0
+        assert report["capacity_violations"] == 0
+        assert report["capacity_mismatches"] == 0
+        assert report["capacity_checks"][0]["attendances"] == 10
+
+    def test_browse_reports_percentiles(self, per_request_sessions):
+        """Prueba que la navegación reporta throughput y percentiles"""
+        # Arrange
+        options = Options(duration=0.3, concurrency=2, events=3)
+
+        # Act
+        report = _run("browse", options)
+
+        # Assert
+        assert report["requests"] > 0
+        assert report["errors"] == 0
+        assert report["throughput_rps"] > 0
+        assert report["p50_ms"] <= report["p95_ms"] <= report["p99_ms"]
+        assert report["capacity_checks"] == []
+
+    def test_lost_response_is_a_mismatch_not_a_violation(
+        self, per_request_sessions, create_attendance
+    ):
+        """Prueba que un 201 perdido por timeout no cuenta como violación"""
+
+        # Arrange - El servidor guardó el registro pero el cliente no vio el 201
+        async def check():
+            async with httpx.AsyncClient(
+                base_url="http://testserver", transport=httpx.ASGITransport(app=app)
+            ) as client:
+                return await check_capacity(
+                    client, create_attendance.event_id, accepted=0, unanswered=1
+                )
+
+        # Act
+        result = asyncio.run(check())
+
+        # Assert
+        assert result["violations"] == []
+        assert len(result["mismatches"]) == 1
+        assert "1 registros sin respuesta" in result["mismatches"][0]
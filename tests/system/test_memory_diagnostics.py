@@ -0,0 +1,129 @@
+"""
+Pruebas end-to-end para el diagnóstico de memoria
+"""
+import gc
+import sys
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.controllers import diagnostics_controller
+from src.exceptions.custom_exceptions import EventiaException
+from src.middleware.error_handler import eventia_exception_handler
+from src.observability.memory import memory_diagnostics
+
+TOKEN = "secreto"
+HEADERS = {"X-Diagnostics-Token": TOKEN}
+
+# Asignaciones retenidas entre instantáneas, para el diff
+_retained = []
+
+
+@pytest.fixture
+def diagnostics(monkeypatch):
+    """Controller de diagnóstico con token; detiene tracemalloc al terminar"""
+    monkeypatch.setattr(diagnostics_controller.settings, "DIAGNOSTICS_TOKEN", TOKEN)
+    app = FastAPI()
+    app.include_router(diagnostics_controller.router)
+    app.add_exception_handler(EventiaException, eventia_exception_handler)
+    yield TestClient(app)
+    memory_diagnostics.stop()
+    _retained.clear()
+
+
+@pytest.mark.system
+class TestMemoryDiagnosticsAPI:
+    """Pruebas E2E para /diagnostics/memory"""
+
+    def test_requires_token(self, diagnostics):
+        """Prueba que sin token no se expone el diagnóstico"""
+        # Act
+        response = diagnostics.get("/diagnostics/memory")
+
+        # Assert
+        assert response.status_code == 403
+
+    def test_disabled_by_default(self, diagnostics):
+        """Prueba que tracemalloc y los callbacks del GC no están activos"""
+        # Act
+        status = diagnostics.get("/diagnostics/memory", headers=HEADERS).json()
+
+        # Assert
+        assert status["tracemalloc"]["tracing"] is False
+        assert memory_diagnostics.gc_pauses not in gc.callbacks
+        assert status["rss_bytes"] > 0
+
+    def test_status_without_resource_module(self, diagnostics, monkeypatch):
+        """Prueba el estado en plataformas sin el módulo resource (Windows)"""
+        # Arrange
+        monkeypatch.setitem(sys.modules, "resource", None)
+
+        # Act
+        response = diagnostics.get("/diagnostics/memory", headers=HEADERS)
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["peak_rss_bytes"] is None
+
+    def test_snapshot_requires_tracking(self, diagnostics):
+        """Prueba que no se toman instantáneas con tracemalloc inactivo"""
+        # Act
+        response = diagnostics.post("/diagnostics/memory/snapshots", headers=HEADERS)
+
+        # Assert
+        assert response.status_code == 409
+
+    def test_snapshot_diff_shows_growth(self, diagnostics):
+        """Prueba que el diff muestra dónde creció la memoria"""
+        # Arrange
+        diagnostics.post("/diagnostics/memory/start?frames=5", headers=HEADERS)
+        base = diagnostics.post("/diagnostics/memory/snapshots", headers=HEADERS)
+        _retained.extend(bytearray(1024) for _ in range(2000))
+        current = diagnostics.post("/diagnostics/memory/snapshots", headers=HEADERS)
+
+        # Act
+        diff = diagnostics.get(
+            f"/diagnostics/memory/snapshots/{current.json()['id']}"
+            f"/diff/{base.json()['id']}",
+            headers=HEADERS,
+        ).json()
+        top = diagnostics.get(
+            f"/diagnostics/memory/snapshots/{current.json()['id']}?limit=5",
+            headers=HEADERS,
+        ).json()
+
+        # Assert
+        assert "test_memory_diagnostics.py" in diff[0]["location"]
+        assert diff[0]["size_diff_bytes"] >= 2000 * 1024
+        assert len(top) == 5
+
+    def test_unknown_snapshot(self, diagnostics):
+        """Prueba que una instantánea inexistente retorna 404"""
+        # Act
+        response = diagnostics.get("/diagnostics/memory/snapshots/999", headers=HEADERS)
+
+        # Assert
+        assert response.status_code == 404
+
+    def test_gc_pauses(self, diagnostics):
+        """Prueba que con el seguimiento activo se miden las pausas del GC"""
+        # Arrange
+        diagnostics.post("/diagnostics/memory/start", headers=HEADERS)
+        gc.collect()
+
+        # Act
+        stats = diagnostics.get("/diagnostics/memory/gc", headers=HEADERS).json()
+
+        # Assert
+        assert len(stats["generations"]) == 3
+        assert stats["pauses"][2]["collections"] >= 1
+
+    def test_orm_object_counts(self, diagnostics, create_multiple_events):
+        """Prueba el conteo de instancias ORM vivas por modelo"""
+        # Act
+        counts = diagnostics.get("/diagnostics/memory/objects", headers=HEADERS).json()
+
+        # Assert
+        assert counts["models"]["Event"] >= len(create_multiple_events)
+        assert counts["sessions"] >= 1
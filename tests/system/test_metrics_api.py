@@ -0,0 +1,52 @@
+"""
+Pruebas end-to-end para el endpoint de métricas
+"""
+import pytest
+
+
+@pytest.mark.system
+class TestMetricsAPI:
+    """Pruebas E2E para /metrics"""
+
+    def test_metrics_use_route_template(self, client, create_event):
+        """Prueba que las peticiones se etiquetan con la plantilla de ruta"""
+        # Arrange
+        client.get(f"/events/{create_event.id}")
+
+        # Act
+        response = client.get("/metrics")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        body = response.text
+        assert 'route="/events/{event_id}"' in body
+        assert f'route="/events/{create_event.id}"' not in body
+        assert "http_request_duration_seconds_bucket" in body
+        assert "http_requests_in_progress" in body
+
+    def test_metrics_label_unmatched_routes(self, client):
+        """Prueba que las rutas inexistentes no crean etiquetas nuevas"""
+        # Arrange
+        client.get("/no-existe/123")
+
+        # Act
+        body = client.get("/metrics").text
+
+        # Assert
+        assert 'route="<unmatched>",status="404"' in body
+        assert "/no-existe/123" not in body
+
+    def test_metrics_include_database_and_cache(self, client, create_event):
+        """Prueba que se registran consultas SQL y operaciones de caché"""
+        # Arrange
+        client.get(f"/events/{create_event.id}/statistics")
+
+        # Act
+        body = client.get("/metrics").text
+
+        # Assert
+        assert 'db_queries_total{operation="SELECT",status="ok"}' in body
+        assert "db_query_duration_seconds_bucket" in body
+        assert "cache_operations_total" in body
+        assert "cache_lookups_total" in body
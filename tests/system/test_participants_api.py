@@ -1,7 +1,15 @@
 """
 Pruebas end-to-end para endpoints de participantes
 """
+import gzip
+import json
+
 import pytest
+from sqlalchemy.orm import sessionmaker
+
+from src.config.setting import settings
+from src.models import Participant
+from src.services import participant_import_service
 
 
 @pytest.mark.system
@@ -109,3 +117,200 @@ class TestParticipantsAPI:
         # Verificar que ya no existe
         get_response = client.get(f"/participants/{create_participant.id}")
         assert get_response.status_code == 404
+
+    def test_import_participants_csv(self, client, create_participant):
+        """Prueba importar CSV en streaming con duplicados y errores por fila"""
+        # Arrange - Cuerpo en fragmentos que cortan líneas a la mitad
+        body = (
+            "name,email,phone\n"
+            "Ana Gómez,ana@example.com,+573001112233\n"
+            f"Repetido,{create_participant.email},\n"
+            "x,correo-invalido,\n"
+            '"Pérez, Luis ""Lucho""",luis@example.com,\n'
+        ).encode("utf-8")
+        chunks = [body[i : i + 7] for i in range(0, len(body), 7)]
+
+        # Act
+        response = client.post(
+            "/participants/import",
+            content=iter(chunks),
+            headers={"Content-Type": "text/csv"},
+        )
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["processed"] == 4
+        assert data["created"] == 2
+        assert data["duplicates"] == 1
+        assert data["failed"] == 1
+        assert data["errors"][0]["line"] == 4
+        names = {p["name"] for p in client.get("/participants/").json()}
+        assert 'Pérez, Luis "Lucho"' in names
+
+    def test_import_csv_unclosed_quote_is_capped(self, client, monkeypatch):
+        """Prueba que un campo sin cerrar no acumule el resto del archivo"""
+        # Arrange - El registro sin cerrar supera el límite en la línea 4
+        monkeypatch.setattr(settings, "PARTICIPANT_IMPORT_MAX_RECORD_SIZE", 60)
+        body = (
+            "name,email\n"
+            '"Sin cierre,sin@example.com\n'
+            "Ana,ana@example.com\n"
+            "Luis,luis@example.com\n"
+            "Eva,eva@example.com\n"
+        )
+
+        # Act
+        response = client.post(
+            "/participants/import",
+            content=body,
+            headers={"Content-Type": "text/csv"},
+        )
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["created"], data["failed"]) == (1, 1)
+        assert data["errors"][0]["line"] == 2
+        assert data["errors"][0]["error"].startswith("CSV inválido")
+
+    def test_import_participants_ndjson_update(self, client, db, create_participant):
+        """Prueba importar NDJSON actualizando emails existentes"""
+        # Arrange
+        body = (
+            f'{{"name": "Nombre Importado", "email": "{create_participant.email}"}}\n'
+            '{"name": "Nuevo Participante", "email": "nuevo@example.com"}\n'
+            "no es json\n"
+        )
+
+        # Act
+        response = client.post(
+            "/participants/import?format=ndjson&on_duplicate=update", content=body
+        )
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["created"], data["updated"], data["failed"]) == (1, 1, 1)
+        name = (
+            db.query(Participant.name)
+            .filter(Participant.id == create_participant.id)
+            .scalar()
+        )
+        assert name == "Nombre Importado"
+
+    def test_import_counts_concurrent_inserts_as_duplicates(
+        self, client, db, monkeypatch
+    ):
+        """Prueba que un email insertado por otra petición no cuente como creado"""
+        # Arrange - Otra petición inserta ana@ tras la consulta de existentes
+        insert_ignore = participant_import_service.insert_ignore
+
+        def concurrent_insert_ignore(session, model, rows, conflict_columns):
+            other = sessionmaker(bind=db.get_bind())()
+            other.add(Participant(name="Ana", email="ana@example.com"))
+            other.commit()
+            other.close()
+            return insert_ignore(session, model, rows, conflict_columns)
+
+        monkeypatch.setattr(
+            participant_import_service, "insert_ignore", concurrent_insert_ignore
+        )
+        body = (
+            '{"name": "Ana Gómez", "email": "ana@example.com"}\n'
+            '{"name": "Luis Pérez", "email": "luis@example.com"}\n'
+        )
+
+        # Act
+        response = client.post("/participants/import?format=ndjson", content=body)
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["created"], data["duplicates"]) == (1, 1)
+        assert db.query(Participant).count() == 2
+
+    def test_import_participants_unsupported_type(self, client):
+        """Prueba importar con un tipo de contenido no soportado"""
+        # Act
+        response = client.post(
+            "/participants/import",
+            content=b"<xml/>",
+            headers={"Content-Type": "application/xml"},
+        )
+
+        # Assert
+        assert response.status_code == 415
+
+    def test_export_participants_csv(self, client, create_multiple_participants):
+        """Prueba descargar participantes en CSV"""
+        # Act
+        response = client.get("/participants/export")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        lines = response.text.splitlines()
+        assert lines[0] == "id,name,email,phone,created_at,updated_at"
+        assert len(lines) == len(create_multiple_participants) + 1
+
+    def test_export_participants_ndjson_gzip(
+        self, client, create_multiple_participants
+    ):
+        """Prueba descargar participantes en NDJSON comprimido"""
+        # Act
+        response = client.get("/participants/export?format=ndjson&gzip=true")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/gzip"
+        rows = [
+            json.loads(line)
+            for line in gzip.decompress(response.content).decode().splitlines()
+        ]
+        assert [r["email"] for r in rows] == [
+            p.email for p in create_multiple_participants
+        ]
+
+    def test_lookup_participants(self, client, create_multiple_participants):
+        """Prueba buscar varios participantes por IDs y emails"""
+        # Arrange
+        lookup = {
+            "ids": [create_multiple_participants[0].id, 999],
+            "emails": [create_multiple_participants[1].email, "nadie@example.com"],
+        }
+
+        # Act
+        response = client.post("/participants/lookup", json=lookup)
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert {p["id"] for p in data["participants"]} == {
+            create_multiple_participants[0].id,
+            create_multiple_participants[1].id,
+        }
+        assert data["missing_ids"] == [999]
+        assert data["missing_emails"] == ["nadie@example.com"]
+
+    def test_lookup_participants_requires_criteria(self, client):
+        """Prueba buscar sin IDs ni emails"""
+        # Act
+        response = client.post("/participants/lookup", json={})
+
+        # Assert
+        assert response.status_code == 422
+
+    def test_participants_sparse_fieldset(self, client, create_participant):
+        """Prueba pedir solo algunos campos de participantes"""
+        # Act
+        list_response = client.get("/participants/?fields=id,email")
+        detail_response = client.get(
+            f"/participants/{create_participant.id}?fields=name"
+        )
+
+        # Assert
+        assert list_response.json() == [
+            {"id": create_participant.id, "email": create_participant.email}
+        ]
+        assert detail_response.json() == {"name": create_participant.name}
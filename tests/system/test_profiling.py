@@ -0,0 +1,140 @@
+"""
+Pruebas end-to-end para el perfilado bajo demanda
+"""
+import json
+import pstats
+import time
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from src.controllers import diagnostics_controller
+from src.observability.profiling import ProfileStore, ProfilingMiddleware
+from src.observability.tracing import TracedRoute
+
+TOKEN = "secreto"
+
+
+def _slow_payload_handler(size: int) -> int:
+    deadline = time.perf_counter() + 0.05
+    total = 0
+    while time.perf_counter() < deadline:
+        total += sum(range(size))
+    return total
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ProfileStore(str(tmp_path), max_files=3)
+
+
+@pytest.fixture
+def profiled_client(store):
+    """Aplicación mínima con ProfilingMiddleware y un endpoint síncrono"""
+    router = APIRouter(route_class=TracedRoute)
+
+    @router.get("/items/{size}")
+    def get_items(size: int):
+        return {"total": _slow_payload_handler(size)}
+
+    app = FastAPI()
+    app.include_router(router)
+    app.add_middleware(
+        ProfilingMiddleware, token=TOKEN, store=store, sample_interval=0.001
+    )
+    return TestClient(app)
+
+
+@pytest.fixture
+def diagnostics_client(store, monkeypatch):
+    """Controller de diagnóstico con token y directorio de prueba"""
+    monkeypatch.setattr(diagnostics_controller.settings, "DIAGNOSTICS_TOKEN", TOKEN)
+    monkeypatch.setattr(diagnostics_controller, "profile_store", store)
+    app = FastAPI()
+    app.include_router(diagnostics_controller.router)
+    return TestClient(app)
+
+
+@pytest.mark.system
+class TestProfiling:
+    """Pruebas E2E para X-Profile y /diagnostics/profiles"""
+
+    def test_cprofile_profiles_threadpool_endpoint(self, profiled_client, store):
+        """Prueba que el perfil incluye el trabajo del endpoint síncrono"""
+        # Act
+        response = profiled_client.get(
+            "/items/100",
+            headers={"X-Profile": "cprofile", "X-Diagnostics-Token": TOKEN},
+        )
+
+        # Assert
+        assert response.status_code == 200
+        profile_id = response.headers["x-profile-id"]
+        stats = pstats.Stats(store.path(profile_id))
+        functions = {name for _, _, name in stats.stats}
+        assert "_slow_payload_handler" in functions
+
+    def test_sampling_writes_speedscope(self, profiled_client, store):
+        """Prueba que el modo sampling guarda un perfil de speedscope"""
+        # Act
+        response = profiled_client.get(
+            "/items/100",
+            headers={"X-Profile": "sampling", "X-Diagnostics-Token": TOKEN},
+        )
+
+        # Assert
+        path = store.path(response.headers["x-profile-id"])
+        assert path.endswith(".speedscope.json")
+        with open(path) as file:
+            profile = json.load(file)
+        frames = [frame["name"] for frame in profile["shared"]["frames"]]
+        assert "_slow_payload_handler" in frames
+        assert profile["profiles"][0]["samples"]
+
+    def test_invalid_token_is_not_profiled(self, profiled_client, store):
+        """Prueba que sin el token correcto la petición no se perfila"""
+        # Act
+        response = profiled_client.get(
+            "/items/1", headers={"X-Profile": "cprofile", "X-Diagnostics-Token": "x"}
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert "x-profile-id" not in response.headers
+        assert store.list() == []
+
+    def test_store_keeps_latest_profiles(self, profiled_client, store):
+        """Prueba que solo se conservan los perfiles más recientes"""
+        # Act
+        for _ in range(4):
+            profiled_client.get(
+                "/items/1",
+                headers={"X-Profile": "cprofile", "X-Diagnostics-Token": TOKEN},
+            )
+
+        # Assert
+        assert len(store.list()) == 3
+
+    def test_download_profile(self, profiled_client, diagnostics_client):
+        """Prueba que el perfil se descarga con el token de diagnóstico"""
+        # Arrange
+        profile_id = profiled_client.get(
+            "/items/1", headers={"X-Profile": "cprofile", "X-Diagnostics-Token": TOKEN}
+        ).headers["x-profile-id"]
+
+        # Act
+        listing = diagnostics_client.get(
+            "/diagnostics/profiles", headers={"X-Diagnostics-Token": TOKEN}
+        )
+        download = diagnostics_client.get(
+            f"/diagnostics/profiles/{profile_id}",
+            headers={"X-Diagnostics-Token": TOKEN},
+        )
+        forbidden = diagnostics_client.get(f"/diagnostics/profiles/{profile_id}")
+
+        # Assert
+        assert listing.json()[0]["id"] == profile_id
+        assert download.status_code == 200
+        assert len(download.content) > 0
+        assert forbidden.status_code == 403
@@ -0,0 +1,85 @@
+"""
+Pruebas end-to-end de consultas SQL por petición
+"""
+import logging
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from src.database.connection import get_db
+from src.observability.queries import QueryDiagnosticsMiddleware
+from src.services.statistics_service import StatisticsService
+
+
+@pytest.mark.system
+class TestQueryBudget:
+    """Presupuesto de consultas por endpoint"""
+
+    def test_query_count_header(self, client, create_event):
+        """Prueba que fuera de producción se retorna el número de consultas"""
+        # Act
+        response = client.get(f"/events/{create_event.id}")
+
+        # Assert
+        assert int(response.headers["x-query-count"]) >= 1
+        assert float(response.headers["x-query-time"]) >= 0
+
+    def test_event_list_budget(self, client, db, create_multiple_events, query_budget):
+        """Prueba que el listado de eventos no crece con el número de eventos"""
+        # Arrange
+        StatisticsService(db).rebuild_all()  # como src.commands.rebuild_statistics
+
+        # Act / Assert
+        with query_budget(2):
+            response = client.get("/events/")
+        assert len(response.json()) == len(create_multiple_events)
+
+    def test_event_detail_budget(self, client, db, create_event, query_budget):
+        """Prueba el máximo de consultas del detalle de un evento"""
+        # Arrange
+        StatisticsService(db).rebuild_all()
+
+        # Act / Assert
+        with query_budget(2):
+            client.get(f"/events/{create_event.id}")
+
+    def test_event_attendances_budget(self, client, create_attendance, query_budget):
+        """Prueba que las asistencias de un evento se cargan sin N+1"""
+        # Act / Assert
+        with query_budget(2):
+            response = client.get(f"/attendances/event/{create_attendance.event_id}")
+        assert response.status_code == 200
+
+    def test_participant_list_budget(
+        self, client, create_multiple_participants, query_budget
+    ):
+        """Prueba el máximo de consultas del listado de participantes"""
+        # Act / Assert
+        with query_budget(1):
+            client.get("/participants/")
+
+    def test_repeated_statement_is_reported(self, db, caplog):
+        """Prueba que una sentencia repetida en una petición se avisa como N+1"""
+        # Arrange
+        app = FastAPI()
+
+        @app.get("/n-plus-one")
+        def n_plus_one(session=Depends(get_db)):
+            for value in range(4):
+                session.execute(text("SELECT :value"), {"value": value})
+            return {}
+
+        app.dependency_overrides[get_db] = lambda: db
+        app.add_middleware(QueryDiagnosticsMiddleware, n_plus_one_threshold=3)
+        caplog.set_level(logging.WARNING, logger="src.observability.queries")
+
+        # Act
+        TestClient(app).get("/n-plus-one")
+
+        # Assert
+        warnings = [r for r in caplog.records if r.name == "src.observability.queries"]
+        assert len(warnings) == 1
+        assert warnings[0].repetitions == 4
+        assert warnings[0].route == "/n-plus-one"
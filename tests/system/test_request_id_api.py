@@ -0,0 +1,51 @@
+"""
+Pruebas end-to-end para el ID de petición
+"""
+import logging
+
+import pytest
+
+
+@pytest.mark.system
+class TestRequestIdAPI:
+    """Pruebas E2E para X-Request-ID"""
+
+    def test_generates_request_id(self, client):
+        """Prueba que se genera un ID cuando el cliente no lo envía"""
+        # Act
+        response = client.get("/health/live")
+
+        # Assert
+        assert len(response.headers["x-request-id"]) == 32
+
+    def test_propagates_valid_request_id(self, client):
+        """Prueba que se respeta el ID enviado por el cliente"""
+        # Act
+        response = client.get("/health/live", headers={"X-Request-ID": "lb-42.a_b"})
+
+        # Assert
+        assert response.headers["x-request-id"] == "lb-42.a_b"
+
+    def test_replaces_invalid_request_id(self, client):
+        """Prueba que un ID con caracteres no permitidos se reemplaza"""
+        # Act
+        response = client.get("/health/live", headers={"X-Request-ID": "a b\\c"})
+
+        # Assert
+        assert response.headers["x-request-id"] != "a b\\c"
+
+    def test_business_errors_are_logged_with_fields(self, client, caplog):
+        """Prueba que el log del error de negocio lleva campos estructurados"""
+        # Arrange
+        caplog.set_level(logging.WARNING, logger="src.middleware.error_handler")
+
+        # Act
+        response = client.get("/events/999999")
+
+        # Assert
+        assert response.status_code == 404
+        records = [
+            r for r in caplog.records if r.name == "src.middleware.error_handler"
+        ]
+        assert records and records[-1].error == "NotFoundException"
+        assert records[-1].status_code == 404
@@ -0,0 +1,107 @@
+"""
+Pruebas end-to-end para las trazas por petición
+"""
+import io
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.observability.tracing import (
+    SERVICE,
+    SpanExporter,
+    TracedRoute,
+    TracingMiddleware,
+    span,
+)
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+
+
+@pytest.fixture
+def traced_app():
+    """Aplicación mínima con TracingMiddleware y exportador en memoria"""
+    stream = io.StringIO()
+    app = FastAPI()
+    app.router.route_class = TracedRoute
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: int):
+        with span("ItemService.get", SERVICE):
+            return {"id": item_id}
+
+    app.add_middleware(
+        TracingMiddleware, sample_rate=0.0, exporter=SpanExporter(stream, "test")
+    )
+    return TestClient(app), stream
+
+
+@pytest.mark.system
+class TestTracingAPI:
+    """Pruebas E2E para Server-Timing y la exportación de trazas"""
+
+    def test_server_timing_breakdown(self, client, create_event):
+        """Prueba que la respuesta desglosa el tiempo por categoría"""
+        # Act
+        response = client.get(f"/events/{create_event.id}")
+
+        # Assert
+        assert response.status_code == 200
+        timing = response.headers["server-timing"]
+        for category in ("controller", "service", "db", "total"):
+            assert f"{category};dur=" in timing
+        assert "queries" in timing
+
+    def test_unsampled_requests_are_not_exported(self, traced_app):
+        """Prueba que con sample_rate=0 no se exporta nada"""
+        # Arrange
+        client, stream = traced_app
+
+        # Act
+        response = client.get("/items/1")
+
+        # Assert
+        assert "service;dur=" in response.headers["server-timing"]
+        assert stream.getvalue() == ""
+
+    def test_server_timing_can_be_disabled(self):
+        """Prueba omitir Server-Timing (producción) sin dejar de medir"""
+        # Arrange
+        stream = io.StringIO()
+        app = FastAPI()
+        app.router.route_class = TracedRoute
+        app.get("/ping")(lambda: {"ok": True})
+        app.add_middleware(
+            TracingMiddleware,
+            server_timing=False,
+            sample_rate=1.0,
+            exporter=SpanExporter(stream, "test"),
+        )
+
+        # Act
+        response = TestClient(app).get("/ping")
+
+        # Assert
+        assert response.status_code == 200
+        assert "server-timing" not in response.headers
+        assert stream.getvalue() != ""
+
+    def test_sampled_traceparent_is_exported(self, traced_app):
+        """Prueba que un traceparent muestreado se exporta con su trace ID"""
+        # Arrange
+        client, stream = traced_app
+        parent_id = "00f067aa0ba902b7"
+
+        # Act
+        client.get("/items/7", headers={"traceparent": f"00-{TRACE_ID}-{parent_id}-01"})
+
+        # Assert
+        spans = json.loads(stream.getvalue())["resourceSpans"][0]["scopeSpans"][0][
+            "spans"
+        ]
+        root, *children = spans
+        assert root["name"] == "GET /items/{item_id}"
+        assert root["parentSpanId"] == parent_id
+        assert {s["traceId"] for s in spans} == {TRACE_ID}
+        assert [s["name"] for s in children] == ["ItemService.get", "get_item"]
@@ -0,0 +1,59 @@
+"""
+Pruebas de sistema para la captura y reproducción de tráfico
+"""
+import asyncio
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from loadtest.replay import compare, load_captures, replay
+from src.main import app
+from src.observability.capture import (
+    Scrubber,
+    TrafficCaptureMiddleware,
+    TrafficRecorder,
+)
+
+
+@pytest.mark.system
+class TestTrafficCaptureAndReplay:
+    """Pruebas de extremo a extremo: capturar, reproducir y comparar"""
+
+    def test_captured_traffic_is_replayed(self, per_request_sessions, tmp_path):
+        """Prueba que lo capturado se reproduce por ruta y sin datos personales"""
+        # Arrange
+        path = tmp_path / "capture.jsonl"
+        recorder = TrafficRecorder(str(path), Scrubber(key="clave"))
+        captured = TestClient(TrafficCaptureMiddleware(app, recorder, sample_rate=1.0))
+        created = captured.post(
+            "/participants/",
+            json={"name": "Ana", "email": "ana@example.org", "phone": "3001234567"},
+        )
+        participant_id = created.json()["id"]
+        captured.get(f"/participants/{participant_id}")
+        captured.get("/health")  # excluida
+        recorder.stop()
+
+        # Act
+        records = load_captures([str(path)])
+        report = asyncio.run(
+            replay(
+                records,
+                base_url="http://testserver",
+                speed=100,
+                transport=httpx.ASGITransport(app=app),
+            )
+        )
+        rows = {row["operation"]: row for row in compare(records, report)}
+
+        # Assert
+        assert "ana@example.org" not in path.read_text()
+        assert [record["route"] for record in records] == [
+            "/participants/",
+            "/participants/{participant_id}",
+        ]
+        assert report["errors"] == 0
+        # El email reemplazado es un email nuevo: el registro se crea otra vez
+        assert report["operations"]["POST /participants/"]["outcomes"] == {"201": 1}
+        assert rows["GET /participants/{participant_id}"]["captured"]["p50_ms"] > 0
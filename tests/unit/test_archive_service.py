@@ -0,0 +1,150 @@
+"""
+Pruebas unitarias para ArchiveService
+
+Estas pruebas verifican el archivado de eventos pasados y la consulta
+transparente de eventos archivados por ID.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.exceptions.custom_exceptions import NotFoundException
+from src.models import ArchivedAttendance, ArchivedEvent, Attendance, Event
+from src.services.archive_service import ArchiveService
+from src.services.attendance_service import AttendanceService
+from src.services.event_service import EventService
+
+
+@pytest.fixture
+def past_attendance(db, create_participant):
+    """Crea un evento pasado con una asistencia"""
+    event = Event(
+        name="Evento Pasado",
+        description="Ya ocurrió",
+        location="Auditorio",
+        date=datetime.utcnow() - timedelta(days=60),
+        capacity=10,
+    )
+    db.add(event)
+    db.commit()
+    attendance = Attendance(event_id=event.id, participant_id=create_participant.id)
+    db.add(attendance)
+    db.commit()
+    return attendance
+
+
+@pytest.mark.unit
+class TestArchiveService:
+    """Pruebas para el servicio de archivo"""
+
+    def test_archive_past_events(self, db, past_attendance, create_event):
+        """Prueba mover eventos pasados y sus asistencias al archivo"""
+        # Arrange
+        service = ArchiveService(db)
+        event_id = past_attendance.event_id
+
+        # Act
+        summary = service.archive_past_events(horizon_days=30)
+
+        # Assert
+        assert summary.archived_events == 1
+        assert summary.archived_attendances == 1
+        assert db.query(Event).filter(Event.id == event_id).first() is None
+        assert db.query(Attendance).filter(Attendance.event_id == event_id).count() == 0
+        assert db.query(ArchivedEvent).filter(ArchivedEvent.id == event_id).count() == 1
+        assert (
+            db.query(ArchivedAttendance)
+            .filter(ArchivedAttendance.event_id == event_id)
+            .count()
+            == 1
+        )
+        # El evento futuro sigue en la tabla activa
+        assert db.query(Event).filter(Event.id == create_event.id).count() == 1
+
+    def test_archived_ids_are_not_reused(self, db, past_attendance):
+        """Prueba archivar, crear otro evento pasado y volver a archivar"""
+        # Arrange
+        service = ArchiveService(db)
+        archived_id = past_attendance.event_id
+        service.archive_past_events(horizon_days=30)
+        event = Event(
+            name="Otro Evento Pasado",
+            location="Auditorio",
+            date=datetime.utcnow() - timedelta(days=45),
+            capacity=5,
+        )
+        db.add(event)
+        db.commit()
+        db.add(
+            Attendance(event_id=event.id, participant_id=past_attendance.participant_id)
+        )
+        db.commit()
+
+        # Act
+        summary = service.archive_past_events(horizon_days=30)
+
+        # Assert
+        assert event.id != archived_id
+        assert summary.archived_events == 1
+        assert summary.archived_attendances == 1
+        assert db.query(ArchivedEvent).count() == 2
+        assert db.query(ArchivedAttendance).count() == 2
+
+    def test_archive_in_bounded_batches(self, db, past_attendance):
+        """Prueba que se respete el número máximo de lotes"""
+        # Arrange
+        service = ArchiveService(db)
+
+        # Act
+        summary = service.archive_past_events(
+            horizon_days=30, batch_size=1, max_batches=0
+        )
+
+        # Assert
+        assert summary.batches == 0
+        assert summary.archived_events == 0
+
+    def test_event_detail_falls_back_to_archive(self, db, past_attendance):
+        """Prueba consultar por ID un evento ya archivado"""
+        # Arrange
+        event_id = past_attendance.event_id
+        ArchiveService(db).archive_past_events(horizon_days=30)
+
+        # Act
+        event = EventService(db).get_event_detail(event_id)
+        stats = EventService(db).get_event_statistics(event_id)
+        attendances = AttendanceService(db).get_event_attendances(event_id)
+
+        # Assert
+        assert event.archived is True
+        assert event.available_capacity == 9
+        assert stats.registered_participants == 1
+        assert len(attendances) == 1
+
+    def test_archived_attendances_outlive_participant(
+        self, db, past_attendance, create_participant
+    ):
+        """Prueba que el historial conserve asistencias de participantes eliminados"""
+        # Arrange
+        event_id = past_attendance.event_id
+        ArchiveService(db).archive_past_events(horizon_days=30)
+        db.delete(create_participant)
+        db.commit()
+
+        # Act
+        attendances = AttendanceService(db).get_event_attendances(event_id)
+
+        # Assert
+        assert len(attendances) == 1
+        assert attendances[0].participant_id == create_participant.id
+        assert attendances[0].participant_name is None
+        assert attendances[0].participant_email is None
+
+    def test_get_archived_event_not_found(self, db):
+        """Prueba consultar un evento que no está ni activo ni archivado"""
+        # Arrange
+        service = EventService(db)
+
+        # Act & Assert
+        with pytest.raises(NotFoundException):
+            service.get_event_detail(999)
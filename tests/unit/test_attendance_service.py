@@ -4,6 +4,7 @@ Pruebas unitarias para AttendanceService
 Estas pruebas verifican las reglas de negocio de asistencias.
 """
 import pytest
+from sqlalchemy.orm import sessionmaker
 
 from src.exceptions.custom_exceptions import (
     CapacityExceededException,
@@ -11,8 +12,38 @@ from src.exceptions.custom_exceptions import (
     NotFoundException,
 )
 from src.models import Attendance
-from src.schemas.attendance import AttendanceCreate
+from src.schemas.attendance import (
+    AttendanceBulkCreate,
+    AttendanceCreate,
+    AttendanceMultiEventCreate,
+)
 from src.services.attendance_service import AttendanceService
+from src.services.event_service import EventService
+from src.services.statistics_service import StatisticsService
+
+
+@pytest.fixture
+def concurrent_registration(db, monkeypatch):
+    """
+    Simula un registro de otra transacción que se confirma mientras el
+    servicio espera el bloqueo de las estadísticas
+    """
+    pending = []
+    lock_statistics = StatisticsService.lock_statistics
+
+    def lock_after_concurrent_commit(self, event_ids):
+        while pending:
+            other = sessionmaker(bind=db.get_bind(), expire_on_commit=False)()
+            try:
+                AttendanceService(other).register_attendance(pending.pop())
+            finally:
+                other.close()
+        return lock_statistics(self, event_ids)
+
+    monkeypatch.setattr(
+        StatisticsService, "lock_statistics", lock_after_concurrent_commit
+    )
+    return pending
 
 
 @pytest.mark.unit
@@ -50,6 +81,23 @@ class TestAttendanceService:
 
         assert "Evento" in str(exc_info.value.message)
 
+    def test_register_attendance_event_being_deleted(
+        self, db, create_event, create_participant
+    ):
+        """Prueba que un evento con eliminación en curso no admite registros"""
+        # Arrange
+        EventService(db).schedule_event_deletion(create_event.id)
+        service = AttendanceService(db)
+        attendance_data = AttendanceCreate(
+            event_id=create_event.id, participant_id=create_participant.id
+        )
+
+        # Act & Assert
+        with pytest.raises(NotFoundException):
+            service.register_attendance(attendance_data)
+
+        assert db.query(Attendance).count() == 0
+
     def test_register_attendance_participant_not_found(self, db, create_event):
         """Prueba registrar asistencia con participante inexistente"""
         # Arrange
@@ -159,3 +207,187 @@ class TestAttendanceService:
         assert len(attendances) == 1
         assert attendances[0].participant_id == create_attendance.participant_id
         assert attendances[0].event_name is not None
+
+    def test_register_attendances_bulk(
+        self, db, create_event, create_multiple_participants
+    ):
+        """Prueba el registro masivo con resultado por participante"""
+        # Arrange
+        create_event.capacity = 3
+        db.commit()
+        service = AttendanceService(db)
+        ids = [p.id for p in create_multiple_participants]
+        service.register_attendance(
+            AttendanceCreate(event_id=create_event.id, participant_id=ids[0])
+        )
+
+        # Act
+        result = service.register_attendances_bulk(
+            AttendanceBulkCreate(
+                event_id=create_event.id,
+                participant_ids=[ids[0], ids[1], ids[1], 999, ids[2], ids[3]],
+            )
+        )
+
+        # Assert
+        assert result.created == 2
+        assert [(i.participant_id, i.status) for i in result.items] == [
+            (ids[0], "duplicate"),
+            (ids[1], "created"),
+            (999, "not_found"),
+            (ids[2], "created"),
+            (ids[3], "over_capacity"),
+        ]
+        assert all(i.attendance_id for i in result.items if i.status == "created")
+        assert (
+            db.query(Attendance).filter(Attendance.event_id == create_event.id).count()
+            == 3
+        )
+
+    def test_register_attendances_bulk_concurrent_registration(
+        self, db, create_event, create_multiple_participants, concurrent_registration
+    ):
+        """Prueba que un registro concurrente se reporte como duplicado"""
+        # Arrange
+        service = AttendanceService(db)
+        ids = [p.id for p in create_multiple_participants[:3]]
+        concurrent_registration.append(
+            AttendanceCreate(event_id=create_event.id, participant_id=ids[1])
+        )
+
+        # Act
+        result = service.register_attendances_bulk(
+            AttendanceBulkCreate(event_id=create_event.id, participant_ids=ids)
+        )
+
+        # Assert
+        assert result.created == 2
+        assert [i.status for i in result.items] == ["created", "duplicate", "created"]
+        assert (
+            db.query(Attendance).filter(Attendance.event_id == create_event.id).count()
+            == 3
+        )
+
+    def test_register_attendances_bulk_event_not_found(self, db, create_participant):
+        """Prueba el registro masivo con evento inexistente"""
+        # Arrange
+        service = AttendanceService(db)
+
+        # Act & Assert
+        with pytest.raises(NotFoundException):
+            service.register_attendances_bulk(
+                AttendanceBulkCreate(
+                    event_id=999, participant_ids=[create_participant.id]
+                )
+            )
+
+    def test_register_multi_event_all_or_nothing(
+        self, db, create_multiple_events, create_participant
+    ):
+        """Prueba que un evento lleno impida registrar en los demás"""
+        # Arrange
+        full_event = create_multiple_events[1]
+        full_event.capacity = 0
+        db.commit()
+        service = AttendanceService(db)
+        event_ids = [e.id for e in create_multiple_events[:3]]
+
+        # Act
+        result = service.register_attendance_multi_event(
+            AttendanceMultiEventCreate(
+                participant_id=create_participant.id, event_ids=event_ids
+            )
+        )
+
+        # Assert
+        assert result.created == 0
+        assert [i.status for i in result.items] == [
+            "skipped",
+            "over_capacity",
+            "skipped",
+        ]
+        assert (
+            db.query(Attendance)
+            .filter(Attendance.participant_id == create_participant.id)
+            .count()
+            == 0
+        )
+
+    def test_register_multi_event_best_effort(
+        self, db, create_multiple_events, create_participant
+    ):
+        """Prueba registrar los eventos posibles en modo best_effort"""
+        # Arrange
+        full_event = create_multiple_events[1]
+        full_event.capacity = 0
+        db.commit()
+        service = AttendanceService(db)
+        event_ids = [e.id for e in create_multiple_events[:3]] + [999]
+
+        # Act
+        result = service.register_attendance_multi_event(
+            AttendanceMultiEventCreate(
+                participant_id=create_participant.id,
+                event_ids=event_ids,
+                mode="best_effort",
+            )
+        )
+
+        # Assert
+        assert result.created == 2
+        assert [i.status for i in result.items] == [
+            "created",
+            "over_capacity",
+            "created",
+            "not_found",
+        ]
+        attendances = service.get_participant_attendances(create_participant.id)
+        assert {a.event_id for a in attendances} == {event_ids[0], event_ids[2]}
+
+    def test_register_multi_event_skips_event_being_deleted(
+        self, db, create_multiple_events, create_participant
+    ):
+        """Prueba que los eventos en eliminación se reportan como not_found"""
+        # Arrange
+        event_ids = [e.id for e in create_multiple_events[:2]]
+        EventService(db).schedule_event_deletion(event_ids[1])
+        service = AttendanceService(db)
+
+        # Act
+        result = service.register_attendance_multi_event(
+            AttendanceMultiEventCreate(
+                participant_id=create_participant.id,
+                event_ids=event_ids,
+                mode="best_effort",
+            )
+        )
+
+        # Assert
+        assert result.created == 1
+        assert [i.status for i in result.items] == ["created", "not_found"]
+
+    def test_register_multi_event_concurrent_registration(
+        self, db, create_multiple_events, create_participant, concurrent_registration
+    ):
+        """Prueba que un registro concurrente a un evento sea un duplicado"""
+        # Arrange
+        service = AttendanceService(db)
+        event_ids = [e.id for e in create_multiple_events[:3]]
+        concurrent_registration.append(
+            AttendanceCreate(
+                event_id=event_ids[1], participant_id=create_participant.id
+            )
+        )
+
+        # Act
+        result = service.register_attendance_multi_event(
+            AttendanceMultiEventCreate(
+                participant_id=create_participant.id,
+                event_ids=event_ids,
+                mode="best_effort",
+            )
+        )
+
+        # Assert
+        assert result.created == 2
+        assert [i.status for i in result.items] == ["created", "duplicate", "created"]
@@ -0,0 +1,64 @@
+"""
+Pruebas unitarias para la comparación de la suite de benchmarks
+"""
+import pytest
+
+from benchmarks.suite import compare, main, measure
+from src.config.setting import settings
+from src.models import Event
+
+
+@pytest.mark.unit
+class TestBenchmarkSuite:
+    """Pruebas para measure y compare"""
+
+    def test_measure_counts_repetitions(self):
+        """Prueba que measure ejecuta calentamiento más repeticiones"""
+        # Arrange
+        calls = []
+
+        # Act
+        result = measure(lambda: calls.append(1), repeat=5, warmup=2)
+
+        # Assert
+        assert len(calls) == 7
+        assert result["repeat"] == 5
+        assert result["min_ms"] <= result["median_ms"] <= result["p95_ms"]
+
+    def test_compare_classifies_by_threshold(self):
+        """Prueba que compare marca regresiones, mejoras y casos nuevos"""
+        # Arrange
+        baseline = {
+            "slower": {"median_ms": 10.0},
+            "faster": {"median_ms": 10.0},
+            "same": {"median_ms": 10.0},
+        }
+        results = {
+            "slower": {"median_ms": 13.0},
+            "faster": {"median_ms": 7.0},
+            "same": {"median_ms": 11.0},
+            "added": {"median_ms": 1.0},
+        }
+
+        # Act
+        rows = {row["case"]: row for row in compare(results, baseline, 0.2)}
+
+        # Assert
+        assert rows["slower"]["status"] == "regression"
+        assert rows["faster"]["status"] == "improvement"
+        assert rows["same"]["status"] == "ok"
+        assert rows["added"]["status"] == "new"
+        assert rows["slower"]["ratio"] == 1.3
+
+    def test_refuses_to_seed_database_with_data(self, db, create_event, monkeypatch):
+        """Prueba que sin --replace no se borra una base de datos con datos"""
+        # Arrange - main() fija estas variables; monkeypatch las restaura
+        for name in ("DATABASE_URL", "LOG_LEVEL", "STARTUP_INIT_DB_IN_BACKGROUND"):
+            monkeypatch.setenv(name, "")
+
+        # Act
+        code = main(["--database-url", settings.DATABASE_URL, "--events", "1"])
+
+        # Assert
+        assert code == 2
+        assert db.query(Event).filter(Event.id == create_event.id).count() == 1
@@ -0,0 +1,79 @@
+"""
+Pruebas unitarias para el circuit breaker del caché
+"""
+import pytest
+
+from src.cache.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from src.cache.redis_client import RedisClient
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    """Pruebas para CircuitBreaker"""
+
+    def test_opens_after_threshold(self):
+        """Prueba que el circuito se abre tras N fallos consecutivos"""
+        # Arrange
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+        # Act
+        breaker.record_failure()
+        state_after_one = breaker.state
+        breaker.record_failure()
+
+        # Assert
+        assert state_after_one == CLOSED
+        assert breaker.state == OPEN
+        assert breaker.allow_request() is False
+
+    def test_half_open_allows_single_trial(self):
+        """Prueba que al expirar el bloqueo se permite una sola llamada"""
+        # Arrange
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+
+        # Act
+        first = breaker.allow_request()
+        second = breaker.allow_request()
+
+        # Assert
+        assert first is True
+        assert second is False
+        assert breaker.state == HALF_OPEN
+
+    def test_trial_success_closes_and_failure_reopens(self):
+        """Prueba el resultado de la llamada de prueba"""
+        # Arrange
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        breaker.allow_request()
+
+        # Act
+        breaker.record_success()
+
+        # Assert
+        assert breaker.state == CLOSED
+        assert breaker.failures == 0
+
+        breaker.record_failure()
+        breaker.allow_request()
+        breaker.record_failure()
+        assert breaker._state == OPEN
+
+    def test_redis_client_skips_calls_when_open(self):
+        """Prueba que con el circuito abierto el caché no toca Redis"""
+        # Arrange
+        client = RedisClient()
+        client.breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        client.breaker.record_failure()
+        calls = []
+        client._client = type(
+            "FakeRedis", (), {"get": lambda self, key: calls.append(key)}
+        )()
+
+        # Act
+        value = client.get("event:1")
+
+        # Assert
+        assert value is None
+        assert calls == []
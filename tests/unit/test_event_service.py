@@ -4,8 +4,10 @@ Pruebas unitarias para EventService
 Estas pruebas verifican la lógica de negocio de eventos.
 """
 import pytest
+from sqlalchemy import inspect
 
 from src.exceptions.custom_exceptions import NotFoundException
+from src.models import Attendance
 from src.schemas.event import EventCreate, EventUpdate
 from src.services.event_service import EventService
 
@@ -29,6 +31,20 @@ class TestEventService:
         assert event.capacity == sample_event_data["capacity"]
         assert event.created_at is not None
 
+    def test_create_event_does_not_expire_defaults(self, db, sample_event_data):
+        """Prueba que los valores por defecto estén disponibles sin refresh"""
+        # Arrange
+        service = EventService(db)
+        event_data = EventCreate(**sample_event_data)
+
+        # Act
+        event = service.create_event(event_data)
+
+        # Assert
+        assert not inspect(event).expired_attributes
+        assert event.created_at is not None
+        assert event.updated_at is not None
+
     def test_get_event_success(self, db, create_event):
         """Prueba obtener un evento existente"""
         # Arrange
@@ -106,6 +122,62 @@ class TestEventService:
         with pytest.raises(NotFoundException):
             service.get_event(event_id)
 
+    def test_delete_event_removes_attendances(self, db, create_attendance):
+        """Prueba que eliminar un evento elimine sus asistencias"""
+        # Arrange
+        service = EventService(db)
+        event_id = create_attendance.event_id
+
+        # Act
+        service.delete_event(event_id)
+
+        # Assert
+        assert db.query(Attendance).filter(Attendance.event_id == event_id).count() == 0
+
+    def test_delete_event_in_batches(
+        self, db, create_event, create_multiple_participants
+    ):
+        """Prueba eliminar un evento borrando sus asistencias por lotes"""
+        # Arrange
+        service = EventService(db)
+        for participant in create_multiple_participants:
+            db.add(Attendance(event_id=create_event.id, participant_id=participant.id))
+        db.commit()
+
+        # Act
+        deletion = service.delete_event_in_batches(create_event.id, batch_size=2)
+
+        # Assert
+        assert deletion.status == "completed"
+        assert deletion.deleted_attendances == len(create_multiple_participants)
+        with pytest.raises(NotFoundException):
+            service.get_event(create_event.id)
+
+    def test_deletion_status_is_persisted(self, db, create_attendance):
+        """Prueba que el estado de la eliminación se guarda en la base de datos"""
+        # Arrange
+        service = EventService(db)
+        event_id = create_attendance.event_id
+
+        # Act
+        pending = service.schedule_event_deletion(event_id)
+        service.delete_event_in_batches(event_id)
+
+        # Assert
+        assert pending.status == "pending"
+        deletion = service.get_deletion_status(event_id)
+        assert deletion.status == "completed"
+        assert deletion.deleted_attendances == 1
+
+    def test_get_deletion_status_not_found(self, db, create_event):
+        """Prueba consultar una eliminación que no se programó"""
+        # Arrange
+        service = EventService(db)
+
+        # Act & Assert
+        with pytest.raises(NotFoundException):
+            service.get_deletion_status(create_event.id)
+
     def test_get_available_capacity(self, db, create_event):
         """Prueba calcular capacidad disponible"""
         # Arrange
@@ -131,3 +203,22 @@ class TestEventService:
         assert stats.registered_participants == 0
         assert stats.available_capacity == create_event.capacity
         assert stats.occupation_percentage == 0.0
+
+    def test_get_all_events_loads_only_requested_columns(
+        self, db, create_multiple_events
+    ):
+        """Prueba que `fields` limite las columnas cargadas"""
+        # Arrange
+        service = EventService(db)
+        db.expunge_all()
+
+        # Act
+        events = service.get_all_events(fields=["name"])
+
+        # Assert
+        assert len(events) == len(create_multiple_events)
+        unloaded = inspect(events[0]).unloaded
+        assert "description" in unloaded
+        assert "location" in unloaded
+        assert "capacity" not in unloaded
+        assert events[0].available_capacity == events[0].capacity
@@ -0,0 +1,90 @@
+"""
+Pruebas unitarias para el generador de datos sintéticos
+"""
+import random
+from datetime import datetime
+
+import pytest
+
+from src.commands.generate_data import (
+    _next_id,
+    allocate,
+    plan_events,
+    registration_times,
+    zipf_weights,
+)
+from src.models import ArchivedEvent, Event
+
+REFERENCE_DATE = datetime(2026, 1, 1)
+
+
+@pytest.mark.unit
+class TestGenerateData:
+    """Pruebas para la planificación de eventos y registros"""
+
+    def test_allocate_respects_total_and_cap(self):
+        """Prueba que el reparto suma el total y el excedente pasa a otros"""
+        # Arrange
+        weights = zipf_weights(10, 1.5)
+
+        # Act
+        counts = allocate(1000, weights, cap=200)
+
+        # Assert
+        assert sum(counts) == 1000
+        assert max(counts) == 200
+        assert counts == sorted(counts, reverse=True)
+
+    def test_allocate_rejects_impossible_total(self):
+        """Prueba que no se reparten más unidades de las que caben"""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            allocate(101, zipf_weights(10, 1.0), cap=10)
+
+    def test_plan_is_reproducible_and_within_capacity(self):
+        """Prueba que la misma semilla da el mismo plan y ningún evento se sobrevende"""
+        # Act
+        first = plan_events(random.Random(7), 1, 100, 500, 20000, 1.1, REFERENCE_DATE)
+        second = plan_events(random.Random(7), 1, 100, 500, 20000, 1.1, REFERENCE_DATE)
+
+        # Assert
+        assert first == second
+        assert [plan.id for plan in first] == list(range(1, 101))
+        assert sum(plan.registrations for plan in first) == 20000
+        assert all(plan.registrations <= plan.capacity for plan in first)
+        assert any(plan.registrations == plan.capacity for plan in first)
+
+    def test_registration_times_fall_in_window(self):
+        """Prueba que los registros quedan ordenados entre publicación y cierre"""
+        # Arrange
+        plan = plan_events(random.Random(1), 1, 5, 100, 200, 1.1, REFERENCE_DATE)[0]
+
+        # Act
+        times = registration_times(random.Random(1), plan, 50)
+
+        # Assert
+        assert times == sorted(times)
+        assert plan.created_at <= times[0]
+        assert times[-1] <= plan.closes_at
+
+    def test_next_event_id_skips_archived_ids(self, db, create_event):
+        """Prueba que los IDs generados no choquen con eventos archivados"""
+        # Arrange
+        archived_id = create_event.id + 10
+        db.add(
+            ArchivedEvent(
+                id=archived_id,
+                name="Archivado",
+                location="Auditorio",
+                date=REFERENCE_DATE,
+                capacity=10,
+            )
+        )
+        db.commit()
+
+        # Act
+        with db.get_bind().connect() as connection:
+            next_id = _next_id(connection, Event, ArchivedEvent)
+
+        # Assert
+        assert next_id == archived_id + 1
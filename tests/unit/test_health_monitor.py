@@ -0,0 +1,76 @@
+"""
+Pruebas unitarias para el monitor de dependencias
+"""
+import asyncio
+
+import pytest
+
+from src.observability import health
+from src.observability.health import HealthMonitor
+from src.observability.startup import StartupProfile
+
+
+@pytest.fixture
+def profile(monkeypatch):
+    """Perfil de arranque propio, con init_db fallido"""
+    profile = StartupProfile()
+    profile.record("init_db", 0.1, "failed", "sin conexión")
+    monkeypatch.setattr(health, "startup", profile)
+    return profile
+
+
+@pytest.mark.unit
+class TestHealthMonitorStartupRetry:
+    """Pruebas para el reintento de pasos de arranque fallidos"""
+
+    def test_retry_completes_failed_step(self, profile):
+        """Prueba que un reintento exitoso deja la instancia lista"""
+        # Arrange
+        calls = []
+        monitor = HealthMonitor(interval=1, timeout=1)
+        monitor.retry_startup_step("init_db", lambda: calls.append(1))
+        monitor.snapshot = {"status": health.HEALTHY}
+        monitor._checked_at = float("inf")
+
+        # Act
+        asyncio.run(monitor.retry_failed_steps())
+
+        # Assert
+        assert calls == [1]
+        assert profile.snapshot()["steps"]["init_db"]["status"] == "ok"
+        assert monitor.readiness()["ready"] is True
+
+    def test_retry_backs_off_after_failure(self, profile):
+        """Prueba que tras un reintento fallido se espera antes del siguiente"""
+        # Arrange
+        calls = []
+
+        def failing_init():
+            calls.append(1)
+            raise ConnectionError("sin conexión")
+
+        monitor = HealthMonitor(interval=30, timeout=1)
+        monitor.retry_startup_step("init_db", failing_init)
+        monitor.snapshot = {"status": health.HEALTHY}
+
+        # Act
+        asyncio.run(monitor.retry_failed_steps())
+        asyncio.run(monitor.retry_failed_steps())
+
+        # Assert
+        assert calls == [1]
+        assert monitor.readiness()["status"] == "startup_failed"
+
+    def test_successful_step_is_not_retried(self, profile):
+        """Prueba que un paso correcto no se vuelve a ejecutar"""
+        # Arrange
+        calls = []
+        profile.record("init_db", 0.1)
+        monitor = HealthMonitor(interval=1, timeout=1)
+        monitor.retry_startup_step("init_db", lambda: calls.append(1))
+
+        # Act
+        asyncio.run(monitor.retry_failed_steps())
+
+        # Assert
+        assert calls == []
@@ -0,0 +1,46 @@
+"""
+Pruebas unitarias para el registro de resultados de carga
+"""
+import pytest
+
+from loadtest.stats import Recorder, percentile
+
+
+@pytest.mark.unit
+class TestLoadTestStats:
+    """Pruebas para percentile y Recorder"""
+
+    def test_percentile_nearest_rank(self):
+        """Prueba el percentil por rango más cercano"""
+        # Arrange
+        ordered = list(range(1, 101))
+
+        # Act & Assert
+        assert percentile(ordered, 50) == 50
+        assert percentile(ordered, 99) == 99
+        assert percentile(ordered, 100) == 100
+        assert percentile([], 50) == 0.0
+
+    def test_report_separates_expected_outcomes_from_errors(self):
+        """Prueba que solo los resultados no esperados cuentan como errores"""
+        # Arrange
+        recorder = Recorder()
+        recorder.start()
+        recorder.record("register", 0.010, "201", True)
+        recorder.record("register", 0.020, "400", True)
+        recorder.record("register", 0.030, "500", False)
+        recorder.record("register", 0.040, "ReadTimeout", False)
+        recorder.stop()
+
+        # Act
+        report = recorder.report()
+
+        # Assert
+        assert report["requests"] == 4
+        assert report["errors"] == 2
+        assert report["error_rate"] == 0.5
+        assert report["operations"]["register"]["outcomes"]["400"] == 1
+        assert report["error_breakdown"] == {
+            "register 500": 1,
+            "register ReadTimeout": 1,
+        }
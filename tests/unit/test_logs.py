@@ -0,0 +1,113 @@
+"""
+Pruebas unitarias para el logging estructurado
+"""
+import logging
+import queue
+
+import pytest
+
+from src.observability.logs import (
+    LogRateLimiter,
+    NonBlockingQueueHandler,
+    RequestIdFilter,
+    request_id_var,
+)
+
+
+def _record(msg, *args):
+    return logging.LogRecord("test", logging.WARNING, __file__, 1, msg, args, None)
+
+
+@pytest.mark.unit
+class TestLogRateLimiter:
+    """Pruebas para LogRateLimiter"""
+
+    def test_limits_per_key(self):
+        """Prueba que se permiten `limit` registros por clave y ventana"""
+        # Arrange
+        limiter = LogRateLimiter(limit=2, window=60)
+
+        # Act
+        results = [limiter.allow(("NotFound", "/events/{id}"))[0] for _ in range(4)]
+        other = limiter.allow(("Duplicate", "/attendances"))
+
+        # Assert
+        assert results == [True, True, False, False]
+        assert other == (True, 0)
+
+    def test_reports_suppressed_in_next_window(self):
+        """Prueba que el primer registro de la ventana siguiente informa los omitidos"""
+        # Arrange
+        limiter = LogRateLimiter(limit=1, window=60)
+        for _ in range(3):
+            limiter.allow(("k",))
+        _, allowed, suppressed = limiter._windows[("k",)]
+        limiter._windows[("k",)] = (-60.0, allowed, suppressed)  # ventana vencida
+
+        # Act
+        result = limiter.allow(("k",))
+
+        # Assert
+        assert result == (True, 2)
+
+    def test_zero_limit_suppresses_everything(self):
+        """Prueba que limit=0 omite todos los registros"""
+        # Arrange
+        limiter = LogRateLimiter(limit=0)
+
+        # Act
+        allowed, _ = limiter.allow(("k",))
+
+        # Assert
+        assert allowed is False
+
+
+@pytest.mark.unit
+class TestQueueLogging:
+    """Pruebas para el QueueHandler y el filtro de request_id"""
+
+    def test_enqueues_resolved_message_without_formatting(self):
+        """Prueba que en el hilo emisor solo se resuelve el mensaje"""
+        # Arrange
+        log_queue = queue.Queue()
+        handler = NonBlockingQueueHandler(log_queue)
+        handler.setFormatter(logging.Formatter("FORMATEADO %(message)s"))
+
+        # Act
+        handler.handle(_record("evento %s", 7))
+
+        # Assert
+        record = log_queue.get_nowait()
+        assert record.msg == "evento 7"
+        assert record.args is None
+
+    def test_drops_records_when_queue_is_full(self):
+        """Prueba que con la cola llena se descarta sin bloquear"""
+        # Arrange
+        handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+
+        # Act
+        handler.handle(_record("uno"))
+        handler.handle(_record("dos"))
+
+        # Assert
+        assert handler.dropped == 1
+
+    def test_request_id_filter(self):
+        """Prueba que cada registro lleva el request_id de la petición"""
+        # Arrange
+        record_filter = RequestIdFilter()
+        token = request_id_var.set("abc123")
+
+        # Act
+        try:
+            inside = _record("dentro")
+            record_filter.filter(inside)
+        finally:
+            request_id_var.reset(token)
+        outside = _record("fuera")
+        record_filter.filter(outside)
+
+        # Assert
+        assert inside.request_id == "abc123"
+        assert outside.request_id == "-"
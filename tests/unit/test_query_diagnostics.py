@@ -0,0 +1,60 @@
+"""
+Pruebas unitarias para el diagnóstico de consultas SQL
+"""
+import pytest
+
+from src.database.instrumentation import QueryEvent
+from src.observability.queries import RequestQueries, normalize, parameter_shape
+
+
+@pytest.mark.unit
+class TestQueryDiagnostics:
+    """Pruebas para normalize, parameter_shape y RequestQueries"""
+
+    def test_normalize_ignores_values_and_in_lists(self):
+        """Prueba que la misma consulta con otros valores se normaliza igual"""
+        # Act
+        first = normalize(
+            "SELECT *\n  FROM events WHERE id IN (?, ?, ?) AND name = 'a'"
+        )
+        second = normalize("SELECT * FROM events WHERE id IN (%s) AND name = 'b''c'")
+        third = normalize(
+            "SELECT * FROM events WHERE id IN (%(id_1)s, %(id_2)s) AND name = :n"
+        )
+
+        # Assert
+        assert first == "SELECT * FROM events WHERE id IN (?) AND name = ?"
+        assert first == second == third
+
+    def test_parameter_shape_hides_values(self):
+        """Prueba que la forma de los parámetros no incluye los valores"""
+        # Act
+        positional = parameter_shape((1, "juan@example.com"))
+        named = parameter_shape({"email": "juan@example.com"})
+        many = parameter_shape([(1, 2), (3, 4)])
+
+        # Assert
+        assert positional == "(int, str)"
+        assert named == "{email: str}"
+        assert many == "2 x (int, int)"
+        assert "juan" not in positional + named
+
+    def test_repeated_statements(self):
+        """Prueba la detección de sentencias repetidas (N+1)"""
+        # Arrange
+        queries = RequestQueries("GET", "/events")
+        queries.add(QueryEvent("SELECT * FROM events", (), 0.001))
+        for event_id in range(4):
+            queries.add(
+                QueryEvent(
+                    f"SELECT * FROM attendances WHERE event_id = {event_id}", (), 0.001
+                )
+            )
+
+        # Act
+        repeated = queries.repeated(threshold=3)
+
+        # Assert
+        assert queries.count == 5
+        assert queries.duration == pytest.approx(0.005)
+        assert repeated == [("SELECT * FROM attendances WHERE event_id = ?", 4)]
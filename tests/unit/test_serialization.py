@@ -0,0 +1,72 @@
+"""
+Pruebas unitarias para la serialización rápida de respuestas
+"""
+import json
+from datetime import datetime
+from typing import List
+
+import pytest
+
+from src.schemas.attendance import AttendanceDetail
+from src.schemas.event import EventPartialResponse
+from src.schemas.serialization import get_adapter, model_response
+
+
+@pytest.mark.unit
+class TestSerialization:
+    """Pruebas para model_response y el caché de TypeAdapter"""
+
+    def test_adapter_is_cached_per_type(self):
+        """Prueba que el TypeAdapter se construye una sola vez por tipo"""
+        # Act
+        first = get_adapter(List[AttendanceDetail])
+        second = get_adapter(List[AttendanceDetail])
+
+        # Assert
+        assert first is second
+
+    def test_model_response_serializes_list(self):
+        """Prueba serializar una lista de modelos a JSON"""
+        # Arrange
+        detail = AttendanceDetail(
+            id=1,
+            event_id=2,
+            event_name="Conferencia",
+            participant_id=3,
+            participant_name="Ana",
+            participant_email="ana@example.com",
+            registered_at=datetime(2024, 1, 15, 14, 30),
+        )
+
+        # Act
+        response = model_response(List[AttendanceDetail], [detail], status_code=201)
+
+        # Assert
+        assert response.status_code == 201
+        assert response.media_type == "application/json"
+        data = json.loads(response.body)
+        assert data[0]["participant_email"] == "ana@example.com"
+        assert data[0]["registered_at"] == "2024-01-15T14:30:00"
+
+    def test_model_response_does_not_revalidate(self):
+        """Prueba que los modelos ya construidos no se validan de nuevo"""
+        # Arrange: model_construct omite la validación; un valor inválido
+        # sobrevive solo si la respuesta no vuelve a validar
+        detail = AttendanceDetail.model_construct(id="no-validado")
+
+        # Act
+        response = model_response(AttendanceDetail, detail)
+
+        # Assert
+        assert json.loads(response.body)["id"] == "no-validado"
+
+    def test_model_response_exclude_unset(self):
+        """Prueba omitir los campos no asignados en respuestas parciales"""
+        # Arrange
+        partial = EventPartialResponse(id=1, name="Conferencia")
+
+        # Act
+        response = model_response(EventPartialResponse, partial, exclude_unset=True)
+
+        # Assert
+        assert json.loads(response.body) == {"id": 1, "name": "Conferencia"}
@@ -0,0 +1,62 @@
+"""
+Pruebas unitarias para el perfil de arranque
+"""
+import threading
+
+import pytest
+
+from src.observability.startup import StartupProfile
+
+
+@pytest.mark.unit
+class TestStartupProfile:
+    """Pruebas para StartupProfile"""
+
+    def test_step_records_duration(self):
+        """Prueba medir un paso síncrono"""
+        # Arrange
+        profile = StartupProfile()
+
+        # Act
+        with profile.step("configuracion"):
+            pass
+
+        # Assert
+        step = profile.snapshot()["steps"]["configuracion"]
+        assert step["status"] == "ok"
+        assert step["duration_ms"] >= 0
+
+    def test_step_records_failure(self):
+        """Prueba que un paso fallido queda registrado y propaga el error"""
+        # Arrange
+        profile = StartupProfile()
+
+        # Act & Assert
+        with pytest.raises(RuntimeError):
+            with profile.step("init_db"):
+                raise RuntimeError("sin conexión")
+        step = profile.snapshot()["steps"]["init_db"]
+        assert step["status"] == "failed"
+        assert step["error"] == "sin conexión"
+
+    def test_run_in_background_does_not_block(self):
+        """Prueba que un paso en segundo plano no bloquea y se puede esperar"""
+        # Arrange
+        profile = StartupProfile()
+        release = threading.Event()
+
+        # Act
+        profile.run_in_background("init_db", lambda: release.wait(5))
+
+        # Assert
+        assert profile.pending() is True
+        assert profile.snapshot()["steps"]["init_db"]["status"] == "running"
+        release.set()
+        assert profile.wait("init_db", timeout=5) is True
+        assert profile.pending() is False
+        assert profile.snapshot()["steps"]["init_db"]["status"] == "ok"
+
+    def test_wait_without_background_step_returns_immediately(self):
+        """Prueba esperar un paso que no se lanzó en segundo plano"""
+        # Assert
+        assert StartupProfile().wait("init_db", timeout=0) is True
@@ -0,0 +1,207 @@
+"""
+Pruebas unitarias para StatisticsService
+
+Estas pruebas verifican que la proyección event_statistics se mantenga
+en la misma transacción que registros y cancelaciones, y que pueda
+reconstruirse desde las asistencias existentes.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.exceptions.custom_exceptions import CapacityExceededException
+from src.models import EventDailyRegistration, EventStatistic
+from src.schemas.attendance import AttendanceCreate
+from src.schemas.event import EventCreate
+from src.services.attendance_service import AttendanceService
+from src.services.event_service import EventService
+from src.services.participant_service import ParticipantService
+from src.services.statistics_service import StatisticsService
+
+
+@pytest.fixture
+def small_event(db):
+    """Crea un evento de capacidad 2 a través del servicio"""
+    return EventService(db).create_event(
+        EventCreate(
+            name="Taller Reducido",
+            description="Cupo limitado",
+            location="Sala 1",
+            date=datetime.utcnow() + timedelta(days=10),
+            capacity=2,
+        )
+    )
+
+
+@pytest.mark.unit
+class TestStatisticsService:
+    """Pruebas para la proyección de estadísticas"""
+
+    def test_create_event_initializes_statistics(self, db, small_event):
+        """Prueba que crear un evento crea su fila de estadísticas"""
+        # Act
+        statistic = db.get(EventStatistic, small_event.id)
+
+        # Assert
+        assert statistic is not None
+        assert statistic.registered_count == 0
+
+    def test_registration_updates_projection(
+        self, db, small_event, create_multiple_participants
+    ):
+        """Prueba que registrar actualiza contador, último registro y día"""
+        # Arrange
+        service = AttendanceService(db)
+
+        # Act
+        attendance = service.register_attendance(
+            AttendanceCreate(
+                event_id=small_event.id,
+                participant_id=create_multiple_participants[0].id,
+            )
+        )
+
+        # Assert
+        statistics = EventService(db).get_event_statistics(small_event.id)
+        assert statistics.registered_participants == 1
+        assert statistics.occupation_percentage == 50.0
+        assert statistics.last_registration_at == attendance.registered_at
+        daily = StatisticsService(db).get_daily_registrations(small_event.id)
+        assert [(d.day, d.registrations) for d in daily] == [
+            (attendance.registered_at.date(), 1)
+        ]
+
+    def test_capacity_enforced_by_projection(
+        self, db, small_event, create_multiple_participants
+    ):
+        """Prueba que el contador rechace registros por encima de la capacidad"""
+        # Arrange
+        service = AttendanceService(db)
+        for participant in create_multiple_participants[:2]:
+            service.register_attendance(
+                AttendanceCreate(event_id=small_event.id, participant_id=participant.id)
+            )
+
+        # Act & Assert
+        with pytest.raises(CapacityExceededException):
+            service.register_attendance(
+                AttendanceCreate(
+                    event_id=small_event.id,
+                    participant_id=create_multiple_participants[2].id,
+                )
+            )
+        assert db.get(EventStatistic, small_event.id).registered_count == 2
+
+    def test_cancellation_and_participant_deletion_decrement(
+        self, db, small_event, create_multiple_participants
+    ):
+        """Prueba que cancelar y eliminar participantes descuenten registros"""
+        # Arrange
+        service = AttendanceService(db)
+        first = service.register_attendance(
+            AttendanceCreate(
+                event_id=small_event.id,
+                participant_id=create_multiple_participants[0].id,
+            )
+        )
+        service.register_attendance(
+            AttendanceCreate(
+                event_id=small_event.id,
+                participant_id=create_multiple_participants[1].id,
+            )
+        )
+
+        # Act
+        service.cancel_attendance(first.id)
+        ParticipantService(db).delete_participant(create_multiple_participants[1].id)
+
+        # Assert
+        assert db.get(EventStatistic, small_event.id).registered_count == 0
+        assert StatisticsService(db).get_daily_registrations(small_event.id) == []
+
+    def test_missing_row_is_computed_without_writing(self, db, create_attendance):
+        """Prueba que leer un evento sin proyección no la guarde"""
+        # Arrange
+        event_id = create_attendance.event_id
+        assert db.get(EventStatistic, event_id) is None
+
+        # Act
+        statistics = EventService(db).get_event_statistics(event_id)
+
+        # Assert
+        assert statistics.registered_participants == 1
+        assert db.get(EventStatistic, event_id) is None
+        assert not db.new and not db.dirty
+
+    def test_registration_backfills_missing_row(
+        self, db, create_attendance, create_multiple_participants
+    ):
+        """Prueba que registrar en un evento sin proyección la cree"""
+        # Arrange
+        event_id = create_attendance.event_id
+        assert db.get(EventStatistic, event_id) is None
+
+        # Act
+        AttendanceService(db).register_attendance(
+            AttendanceCreate(
+                event_id=event_id, participant_id=create_multiple_participants[0].id
+            )
+        )
+
+        # Assert
+        assert db.get(EventStatistic, event_id).registered_count == 2
+        assert (
+            db.query(EventDailyRegistration)
+            .filter(EventDailyRegistration.event_id == event_id)
+            .count()
+            == 1
+        )
+
+    def test_backfill_skips_existing_rows(self, db, create_attendance):
+        """Prueba que completar dos veces el mismo evento no falle"""
+        # Arrange
+        event_id = create_attendance.event_id
+        service = StatisticsService(db)
+
+        # Act
+        service.backfill([event_id])
+        service.backfill([event_id])
+        db.commit()
+
+        # Assert
+        assert db.get(EventStatistic, event_id).registered_count == 1
+
+    def test_rebuild_all_fixes_drift(self, db, create_attendance):
+        """Prueba que el backfill corrija contadores desviados"""
+        # Arrange
+        event_id = create_attendance.event_id
+        db.add(EventStatistic(event_id=event_id, registered_count=7))
+        db.commit()
+
+        # Act
+        processed = StatisticsService(db).rebuild_all(batch_size=1)
+
+        # Assert
+        assert processed == 1
+        assert db.get(EventStatistic, event_id).registered_count == 1
+
+    def test_cancellation_rebuilds_drifted_counter(
+        self, db, create_attendance, create_multiple_participants, caplog
+    ):
+        """Prueba que cancelar con un contador desviado lo recalcule"""
+        # Arrange - Dos asistencias pero el contador quedó en 0
+        event_id = create_attendance.event_id
+        AttendanceService(db).register_attendance(
+            AttendanceCreate(
+                event_id=event_id, participant_id=create_multiple_participants[0].id
+            )
+        )
+        db.get(EventStatistic, event_id).registered_count = 0
+        db.commit()
+
+        # Act
+        AttendanceService(db).cancel_attendance(create_attendance.id)
+
+        # Assert
+        assert db.get(EventStatistic, event_id).registered_count == 1
+        assert "desincronizadas" in caplog.text
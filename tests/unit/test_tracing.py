@@ -0,0 +1,149 @@
+"""
+Pruebas unitarias para las trazas por petición
+"""
+import io
+import json
+
+import pytest
+
+from src.observability import tracing
+from src.observability.tracing import (
+    DB,
+    SERVICE,
+    SpanExporter,
+    Trace,
+    record,
+    span,
+    traced_service,
+)
+
+
+@pytest.fixture
+def active_trace():
+    """Activa una traza muestreada durante la prueba"""
+
+    def start(sampled=True):
+        trace = Trace("0" * 31 + "1", None, sampled)
+        token = tracing._current_trace.set(trace)
+        started.append(token)
+        return trace
+
+    started = []
+    yield start
+    for token in reversed(started):
+        tracing._current_trace.reset(token)
+
+
+@traced_service
+class _Service:
+    def outer(self):
+        return self.inner() + 1
+
+    def inner(self):
+        record("SELECT", DB, 0.002)
+        return 1
+
+
+@pytest.mark.unit
+class TestTracing:
+    """Pruebas para span, record y traced_service"""
+
+    def test_without_trace_is_noop(self):
+        """Prueba que sin traza activa no se registra nada"""
+        # Act
+        with span("bloque", SERVICE) as current:
+            record("SELECT", DB, 0.01)
+        result = _Service().outer()
+
+        # Assert
+        assert current is None
+        assert result == 2
+        assert tracing.current_trace() is None
+
+    def test_nested_services_are_not_double_counted(self, active_trace):
+        """Prueba que un servicio dentro de otro se suma una sola vez"""
+        # Arrange
+        trace = active_trace()
+
+        # Act
+        _Service().outer()
+
+        # Assert
+        assert trace.counts == {SERVICE: 1, DB: 1}
+        assert trace.totals[DB] == pytest.approx(0.002)
+        names = [s.name for s in trace.spans]
+        assert names == ["SELECT", "_Service.inner", "_Service.outer"]
+
+    def test_spans_are_parented(self, active_trace):
+        """Prueba que cada span cuelga del span que lo contiene"""
+        # Arrange
+        trace = active_trace()
+
+        # Act
+        _Service().outer()
+
+        # Assert
+        query, inner, outer = trace.spans
+        assert outer.parent_id == trace.root.span_id
+        assert inner.parent_id == outer.span_id
+        assert query.parent_id == inner.span_id
+
+    def test_unsampled_trace_keeps_only_totals(self, active_trace):
+        """Prueba que sin muestreo no se guardan spans"""
+        # Arrange
+        trace = active_trace(sampled=False)
+
+        # Act
+        _Service().outer()
+
+        # Assert
+        assert trace.spans == []
+        assert set(trace.totals) == {SERVICE, DB}
+
+    def test_server_timing_header(self, active_trace):
+        """Prueba el formato del encabezado Server-Timing"""
+        # Arrange
+        trace = active_trace(sampled=False)
+        record("SELECT", DB, 0.0015)
+        record("SELECT", DB, 0.0005)
+
+        # Act
+        header = trace.server_timing()
+
+        # Assert
+        assert header.startswith('db;dur=2.00;desc="2 queries", total;dur=')
+
+    def test_span_records_error(self, active_trace):
+        """Prueba que un span con excepción queda marcado con error"""
+        # Arrange
+        trace = active_trace()
+
+        # Act
+        with pytest.raises(ValueError):
+            with span("falla", SERVICE):
+                raise ValueError("boom")
+
+        # Assert
+        assert trace.spans[0].error == "ValueError: boom"
+        assert SERVICE in trace.totals
+
+    def test_exporter_writes_otlp_json(self, active_trace):
+        """Prueba que el exportador escribe una traza OTLP/JSON por línea"""
+        # Arrange
+        trace = active_trace()
+        _Service().outer()
+        stream = io.StringIO()
+
+        # Act
+        SpanExporter(stream, "eventia").export(trace)
+
+        # Assert
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 1
+        resource_spans = json.loads(lines[0])["resourceSpans"][0]
+        spans = resource_spans["scopeSpans"][0]["spans"]
+        assert len(spans) == 4  # raíz + 3
+        assert {s["traceId"] for s in spans} == {trace.trace_id}
+        assert resource_spans["resource"]["attributes"][0]["value"] == {
+            "stringValue": "eventia"
+        }
@@ -0,0 +1,118 @@
+"""
+Pruebas unitarias para la captura de tráfico
+"""
+import pytest
+
+from src.observability.capture import CapturedRequest, Scrubber, TrafficRecorder
+
+
+def _request(**overrides):
+    values = dict(
+        ts=1000.0,
+        method="POST",
+        route="/participants/",
+        path="/participants/",
+        query_string=b"",
+        content_type="application/json",
+        body=b"",
+        body_bytes=0,
+        status=201,
+        duration=0.0125,
+    )
+    values.update(overrides)
+    return CapturedRequest(**values)
+
+
+@pytest.mark.unit
+class TestScrubber:
+    """Pruebas para Scrubber"""
+
+    def test_replaces_emails_and_phones(self):
+        """Prueba que emails y teléfonos se reemplazan de forma determinista"""
+        # Arrange
+        scrubber = Scrubber(key="clave")
+        body = {
+            "name": "Ana",
+            "email": "ana@example.org",
+            "phone": "3001234567",
+            "notes": "contactar a Ana@Example.org o +57 300 123 4567",
+            "capacity": 10,
+        }
+
+        # Act
+        scrubbed = scrubber.scrub(body)
+
+        # Assert
+        assert scrubbed["name"] == "Ana"
+        assert scrubbed["capacity"] == 10
+        assert "example.org" not in str(scrubbed)
+        assert "300" not in scrubbed["phone"]
+        assert scrubbed["email"].endswith("@scrubbed.example.com")
+        # Mismo email (sin distinguir mayúsculas), mismo reemplazo
+        assert scrubbed["email"] in scrubbed["notes"]
+        assert scrubbed == Scrubber(key="clave").scrub(body)
+
+    def test_replaces_non_string_phones(self):
+        """Prueba que un teléfono numérico también se reemplaza"""
+        # Arrange
+        scrubber = Scrubber(key="clave")
+
+        # Act
+        scrubbed = scrubber.scrub({"phone": 3001234567, "phones": [3001234567]})
+
+        # Assert
+        assert "3001234567" not in str(scrubbed)
+        assert scrubbed["phone"] == scrubber.phone("3001234567")
+        assert scrubbed["phones"] == [scrubbed["phone"]]
+        assert scrubber.scrub({"phone": None}) == {"phone": None}
+
+    def test_keeps_dates_and_numbers(self):
+        """Prueba que fechas y números no se confunden con teléfonos"""
+        # Arrange
+        scrubber = Scrubber(key="clave")
+
+        # Act & Assert
+        assert scrubber.scrub("2026-01-01T10:00:00") == "2026-01-01T10:00:00"
+        assert scrubber.scrub({"ids": [1, 2]}) == {"ids": [1, 2]}
+
+
+@pytest.mark.unit
+class TestTrafficRecorder:
+    """Pruebas para TrafficRecorder.to_record"""
+
+    def test_record_has_scrubbed_body_and_shape(self):
+        """Prueba el registro de un cuerpo JSON"""
+        # Arrange
+        recorder = TrafficRecorder("unused.jsonl", Scrubber(key="clave"))
+        body = b'{"name": "Ana", "email": "ana@example.org"}'
+
+        # Act
+        record = recorder.to_record(
+            _request(
+                body=body,
+                body_bytes=len(body),
+                query_string=b"ids=1&ids=2&email=ana@example.org",
+            )
+        )
+
+        # Assert
+        assert record["body"]["email"].endswith("@scrubbed.example.com")
+        assert record["body_shape"] == {"name": "str", "email": "str"}
+        assert record["query"]["ids"] == ["1", "2"]
+        assert record["query"]["email"] == record["body"]["email"]
+        assert record["duration_ms"] == 12.5
+
+    def test_large_or_binary_bodies_keep_only_size(self):
+        """Prueba que un cuerpo no capturado solo registra su tamaño"""
+        # Arrange
+        recorder = TrafficRecorder("unused.jsonl", Scrubber(key="clave"))
+
+        # Act
+        record = recorder.to_record(
+            _request(body=None, body_bytes=100000, content_type="text/csv")
+        )
+
+        # Assert
+        assert "body" not in record
+        assert record["body_bytes"] == 100000
+        assert record["content_type"] == "text/csv"